@@ -0,0 +1,31 @@
+"""add_unprocessed_content_index
+
+Revision ID: 3b7e2c1d9a4f
+Revises: f69452393f99
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3b7e2c1d9a4f"
+down_revision = "f69452393f99"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index for the LLM processing queue (unprocessed items)
+    op.create_index(
+        "ix_content_items_unprocessed",
+        "content_items",
+        ["processed_at"],
+        sqlite_where=sa.text("processed_at IS NULL"),
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_content_items_unprocessed", "content_items")
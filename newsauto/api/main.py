@@ -22,6 +22,9 @@ from newsauto.api.routes import (
 )
 from newsauto.core.config import get_settings
 from newsauto.core.database import init_db
+from newsauto.core.http import close_shared_client
+from newsauto.monitoring.health import close_health_checker
+from newsauto.monitoring.metrics import metrics_collector
 
 # Configure logging
 logging.basicConfig(
@@ -39,11 +42,18 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Newsauto API...")
     init_db()
     logger.info("Database initialized")
+    if settings.enable_metrics:
+        metrics_collector.start_flush_loop()
+        metrics_collector.start_system_sampler()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Newsauto API...")
+    await close_health_checker()
+    await close_shared_client()
+    await metrics_collector.stop_flush_loop()
+    await metrics_collector.stop_system_sampler()
 
 
 # Create FastAPI app
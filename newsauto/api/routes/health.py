@@ -3,12 +3,15 @@
 from datetime import datetime
 
 import psutil
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from prometheus_client import CONTENT_TYPE_LATEST
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from newsauto.core.database import get_db
 from newsauto.llm.ollama_client import OllamaClient
+from newsauto.monitoring.health import get_health_checker
+from newsauto.monitoring.metrics import metrics_collector
 
 router = APIRouter()
 
@@ -48,6 +51,24 @@ async def health_check(db: Session = Depends(get_db)):
     return health_status
 
 
+@router.get("/health/live")
+async def liveness_check():
+    """Liveness probe; returns a static body without JSON encoding."""
+    return Response(
+        content=get_health_checker().check_liveness_fast(),
+        media_type="application/json",
+    )
+
+
+@router.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus scrape endpoint."""
+    return Response(
+        content=await metrics_collector.get_prometheus_metrics_async(),
+        media_type=CONTENT_TYPE_LATEST,
+    )
+
+
 @router.get("/health/system")
 async def system_stats():
     """System resource statistics."""
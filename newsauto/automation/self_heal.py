@@ -156,8 +156,9 @@ class SelfHealingOrchestrator:
                 if health["healthy"]:
                     logger.info(f"✅ Successfully rotated to {relay['name']}")
 
-                    # Update configuration
+                    # Update configuration, and monitor the new relay
                     await self._update_smtp_config(relay)
+                    self.smtp_check.config = test_config
                     self._reset_failure_count("smtp_blacklist")
                     return True
 
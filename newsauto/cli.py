@@ -527,7 +527,7 @@ def add_default_sources(newsletter_id, niche, confirm):
         table.add_column("URL/Config", style="green", max_width=50)
 
         for source in sources:
-            url_or_config = source.get("url") or str(source.get("config", {}))
+            url_or_config = source.get("url") or str(dict(source.get("config", {})))
             table.add_row(source["name"], source["type"], url_or_config[:50])
 
         console.print(table)
@@ -570,7 +570,7 @@ def add_default_sources(newsletter_id, niche, confirm):
                 name=source_data["name"],
                 type=source_type,
                 url=source_data.get("url", ""),
-                config=source_data.get("config", {}),
+                config=dict(source_data.get("config", {})),
                 active=True,
                 fetch_frequency_minutes=60,
             )
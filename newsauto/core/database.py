@@ -1,5 +1,10 @@
 """Database configuration and session management."""
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, SQLAlchemy falls back to stdlib json
+    orjson = None
+
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
@@ -9,6 +14,19 @@ from newsauto.core.config import get_settings
 
 settings = get_settings()
 
+
+def _orjson_dumps(value) -> str:
+    """Serialize JSON column values with orjson (non-str keys as strings, like json)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON column (de)serializers; omitted to keep SQLAlchemy's json defaults
+_json_options = (
+    {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+    if orjson is not None
+    else {}
+)
+
 # Configure SQLAlchemy
 if settings.database_url.startswith("sqlite"):
     # SQLite specific configuration
@@ -17,6 +35,7 @@ if settings.database_url.startswith("sqlite"):
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         echo=settings.debug,
+        **_json_options,
     )
 
     # Enable foreign key constraints for SQLite
@@ -32,6 +51,7 @@ else:
         settings.database_url,
         pool_pre_ping=True,
         echo=settings.debug,
+        **_json_options,
     )
 
 # Create session factory
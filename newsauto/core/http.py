@@ -0,0 +1,310 @@
+"""HTTP client configuration shared by the scrapers."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to httpx's stdlib json decoding
+    orjson = None
+
+# Default timeouts for scraper requests, in seconds
+DEFAULT_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 5.0
+
+# Connection pool sizes per client
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Minimum spacing between requests to one host, in seconds
+HOST_MIN_INTERVAL = 0.1
+
+# Retries for rate-limited or transiently failing requests
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # Doubled on each attempt
+MAX_RETRY_WAIT = 60.0  # Longer server-requested waits are not honored
+
+# Bodies kept for conditional GETs
+CONDITIONAL_CACHE_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+# Host -> earliest time.monotonic() the next request may start
+_next_request_at: Dict[str, float] = {}
+
+# ETag, Last-Modified, Content-Type and body of a URL's last 200 response
+_CachedBody = Tuple[Optional[str], Optional[str], Optional[str], bytes]
+
+# URL -> its cached response, most recently used last
+_conditional_cache: "OrderedDict[str, _CachedBody]" = OrderedDict()
+
+# Client shared by scraper runs, and the event loop it belongs to
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create an async HTTP client with the scraper defaults.
+
+    Clients negotiate HTTP/2 where the host supports it, so concurrent
+    requests to one host multiplex over a single connection, and keep
+    a larger pool of idle connections than httpx's default.
+
+    Args:
+        **kwargs: Options for httpx.AsyncClient, overriding the defaults
+
+    Returns:
+        Client, to be used as an async context manager
+    """
+    options = {
+        "http2": True,
+        "limits": httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        "timeout": httpx.Timeout(DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT),
+    }
+    options.update(kwargs)
+    return httpx.AsyncClient(**options)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the client shared by all scraper runs on the running event loop.
+
+    Created on first use with create_client's defaults and kept open, so
+    repeated scraper runs reuse pooled connections instead of paying a
+    TLS handshake per run. Callers must not close it. Connection pools
+    cannot move between event loops, so a new loop gets a new client.
+
+    Returns:
+        Shared client
+    """
+    global _shared_client, _shared_client_loop
+
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_client is None
+        or _shared_client.is_closed
+        or _shared_client_loop is not loop
+    ):
+        _shared_client = create_client()
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared client's connections, if it was created."""
+    global _shared_client, _shared_client_loop
+
+    client = _shared_client
+    _shared_client = _shared_client_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when installed.
+
+    Args:
+        response: Response with a JSON body
+
+    Returns:
+        Decoded JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    max_retries: int = MAX_RETRIES,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send a request, paced per host and retried on transient failures.
+
+    Requests to a host are spaced at least HOST_MIN_INTERVAL apart, and a
+    host that reports an exhausted rate limit (X-RateLimit-Remaining: 0)
+    is paused until its X-RateLimit-Reset when that is near. Responses with a status in
+    RETRY_STATUSES, GitHub's rate-limited 403s and transport errors are
+    retried with exponential backoff, honoring Retry-After.
+
+    Args:
+        client: Client to send the request with
+        method: HTTP method
+        url: Absolute URL, or a path relative to the client's base URL
+        max_retries: Retries after the first attempt
+        **kwargs: Passed to client.request
+
+    Returns:
+        Last response received; callers check its status as usual
+
+    Raises:
+        httpx.TransportError: If the final attempt fails to connect or read
+    """
+    host = httpx.URL(url).host or client.base_url.host
+
+    for attempt in range(max_retries + 1):
+        delay = _reserve_slot(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt == max_retries:
+                raise
+            logger.debug(f"Retrying {method} {url} after {e!r}")
+            await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+            continue
+
+        reset_wait = _rate_limit_wait(response)
+        if reset_wait is not None:
+            _pause_host(host, reset_wait)
+
+        if attempt == max_retries or not _should_retry(response):
+            return response
+
+        wait = _retry_after(response)
+        if wait is None:
+            wait = reset_wait if reset_wait is not None else RETRY_BACKOFF * 2**attempt
+        if wait > MAX_RETRY_WAIT:
+            return response
+
+        logger.debug(
+            f"Retrying {method} {url} in {wait:.1f}s (HTTP {response.status_code})"
+        )
+        await asyncio.sleep(wait)
+
+    return response
+
+
+async def conditional_get(
+    client: httpx.AsyncClient, url: str, **kwargs: Any
+) -> httpx.Response:
+    """GET a URL, revalidating the body cached from its last response.
+
+    The ETag and Last-Modified of a URL's last 200 response are sent back
+    as If-None-Match and If-Modified-Since. A 304 answer is returned as a
+    200 response carrying the cached body, so an unchanged resource costs
+    one round trip and no download.
+
+    Args:
+        client: Client to send the request with
+        url: Absolute URL
+        **kwargs: Passed to request
+
+    Returns:
+        Response, with a 304 replaced by the cached body
+    """
+    cached = _conditional_cache.get(url)
+    if cached is not None:
+        etag, last_modified, _, _ = cached
+        headers = dict(kwargs.pop("headers", None) or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        kwargs["headers"] = headers
+
+    response = await request(client, "GET", url, **kwargs)
+
+    if response.status_code == 304 and cached is not None:
+        _conditional_cache.move_to_end(url)
+        _, _, content_type, body = cached
+        return httpx.Response(
+            200,
+            headers={"Content-Type": content_type} if content_type else None,
+            content=body,
+            request=response.request,
+        )
+
+    if response.status_code == 200:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _conditional_cache[url] = (
+                etag,
+                last_modified,
+                response.headers.get("Content-Type"),
+                response.content,
+            )
+            _conditional_cache.move_to_end(url)
+            if len(_conditional_cache) > CONDITIONAL_CACHE_SIZE:
+                _conditional_cache.popitem(last=False)
+
+    return response
+
+
+def _reserve_slot(host: str) -> float:
+    """Claim the next request slot for host.
+
+    Runs without awaiting, so concurrent callers on the event loop each get
+    a distinct slot.
+
+    Returns:
+        Seconds to wait before sending
+    """
+    now = time.monotonic()
+    start = max(now, _next_request_at.get(host, 0.0))
+    _next_request_at[host] = start + HOST_MIN_INTERVAL
+    return start - now
+
+
+def _pause_host(host: str, seconds: float) -> None:
+    """Hold back further requests to host until its rate limit resets.
+
+    Resets further out than MAX_RETRY_WAIT are not waited for; requests go
+    out and fail fast rather than stalling the scraper.
+    """
+    if seconds > MAX_RETRY_WAIT:
+        return
+    resume = time.monotonic() + seconds
+    if resume > _next_request_at.get(host, 0.0):
+        _next_request_at[host] = resume
+
+
+def _should_retry(response: httpx.Response) -> bool:
+    """Whether response is a rate limit or transient upstream failure."""
+    if response.status_code in RETRY_STATUSES:
+        return True
+    # GitHub answers an exhausted rate limit with 403
+    return (
+        response.status_code == 403
+        and response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds requested by a Retry-After header, in either form."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_wait(response: httpx.Response) -> Optional[float]:
+    """Seconds until an exhausted X-RateLimit window resets, if reported."""
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    try:
+        reset = float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return None
+    return max(0.0, reset - time.time())
@@ -64,6 +64,11 @@ class EmailSender:
             await self._client.quit()
         self._client = None
 
+    async def noop(self):
+        """Verify the SMTP session with a NOOP command."""
+        await self.connect()
+        await self._client.noop()
+
     async def send_email(
         self,
         to_email: str,
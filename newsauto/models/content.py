@@ -1,7 +1,7 @@
 """Content models for sources and items."""
 
 import enum
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from sqlalchemy import (
     JSON,
@@ -11,15 +11,47 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    literal,
+    or_,
+    text,
 )
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.functions import FunctionElement
 
 from newsauto.models.base import BaseModel
 
 
+class _minutes_before(FunctionElement):
+    """SQL timestamp a column-valued number of minutes before another."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_minutes_before)
+def _minutes_before_default(element, compiler, **kw):
+    timestamp, minutes = list(element.clauses)
+    return "(%s - %s * INTERVAL '1 minute')" % (
+        compiler.process(timestamp, **kw),
+        compiler.process(minutes, **kw),
+    )
+
+
+@compiles(_minutes_before, "sqlite")
+def _minutes_before_sqlite(element, compiler, **kw):
+    timestamp, minutes = list(element.clauses)
+    return "datetime(%s, '-' || %s || ' minutes')" % (
+        compiler.process(timestamp, **kw),
+        compiler.process(minutes, **kw),
+    )
+
+
 class ContentSourceType(str, enum.Enum):
     """Content source type enum."""
 
@@ -62,22 +94,38 @@ class ContentSource(BaseModel):
         """Check if source is active."""
         return self.active and self.error_count < 5
 
-    @property
+    @hybrid_property
     def needs_fetch(self) -> bool:
         """Check if source needs to be fetched."""
         if not self.last_fetched:
             return True
 
-        from datetime import timedelta
-
         next_fetch = self.last_fetched + timedelta(minutes=self.fetch_frequency_minutes)
         return datetime.utcnow() >= next_fetch
 
+    @needs_fetch.expression
+    def needs_fetch(cls):
+        """SQL form of needs_fetch, so due sources are filtered in the query."""
+        now = literal(datetime.utcnow(), DateTime())
+        return or_(
+            cls.last_fetched.is_(None),
+            cls.last_fetched <= _minutes_before(now, cls.fetch_frequency_minutes),
+        )
+
 
 class ContentItem(BaseModel):
     """Content item model."""
 
     __tablename__ = "content_items"
+    __table_args__ = (
+        # Partial index for the LLM processing queue (unprocessed items)
+        Index(
+            "ix_content_items_unprocessed",
+            "processed_at",
+            sqlite_where=text("processed_at IS NULL"),
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
 
     source_id = Column(Integer, ForeignKey("content_sources.id"), nullable=False)
     url = Column(String(500), unique=True, nullable=False)
@@ -0,0 +1,37 @@
+"""Dedicated database engine for health checks.
+
+Health probes get their own tiny connection pool so they never compete
+with application traffic for slots in the shared pool.
+"""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from newsauto.core.config import get_settings
+
+settings = get_settings()
+
+# Seconds to wait for a connection/lock before the probe gives up
+HEALTH_DB_TIMEOUT = 2.0
+
+# Seconds a table count is reused; migrations usually run in another
+# process, which cannot invalidate the cache directly
+SCHEMA_CACHE_TTL = 300.0
+
+if settings.database_url.startswith("sqlite"):
+    connect_args = {"check_same_thread": False, "timeout": HEALTH_DB_TIMEOUT}
+else:
+    connect_args = {"connect_timeout": int(HEALTH_DB_TIMEOUT)}
+
+health_engine = create_engine(
+    settings.database_url,
+    connect_args=connect_args,
+    poolclass=QueuePool,
+    pool_size=1,
+    max_overflow=1,
+    pool_timeout=HEALTH_DB_TIMEOUT,
+)
+
+# Session factory used only by health checks
+HealthSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=health_engine)
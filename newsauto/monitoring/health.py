@@ -2,19 +2,45 @@
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
 
 import httpx
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from newsauto.core.config import get_settings
-from newsauto.core.database import get_db
+from newsauto.monitoring._health_engine import (
+    HEALTH_DB_TIMEOUT,
+    SCHEMA_CACHE_TTL,
+    HealthSessionLocal,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-component timeout (seconds) applied by check_all, in check order.
+# The database check bounds its own query by HEALTH_DB_TIMEOUT and reports
+# why it failed, so its outer timeout leaves room for that to happen first.
+CHECK_TIMEOUT = {
+    "database": HEALTH_DB_TIMEOUT + 0.5,
+    "ollama": 5.0,
+    "redis": 1.0,
+    "disk": 0.5,
+    "memory": 0.5,
+}
+
+# Components whose timeout only degrades overall health
+OPTIONAL_COMPONENTS = {"redis", "disk", "memory"}
+
+# Pre-serialized liveness response body
+_LIVENESS_BODY = b'{"alive":true}'
+
+_DB_PROBE_QUERY = text(
+    "SELECT 1, (SELECT COUNT(*) FROM sqlite_master WHERE type='table')"
+)
+
 
 class HealthStatus(str, Enum):
     """Health status levels."""
@@ -24,15 +50,27 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
+# Severity order used to pick the overall status
+_STATUS_PRIORITY = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNHEALTHY: 2,
+}
+_PRIORITY_STATUS = {v: k for k, v in _STATUS_PRIORITY.items()}
+
+
 class ComponentHealth:
     """Health status of a component."""
 
+    __slots__ = ("name", "status", "message", "details", "checked_at")
+
     def __init__(
         self,
         name: str,
         status: HealthStatus,
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
+        checked_at: Optional[datetime] = None,
     ):
         """Initialize component health.
 
@@ -41,16 +79,20 @@ class ComponentHealth:
             status: Health status
             message: Optional status message
             details: Optional additional details
+            checked_at: Optional check time (defaults to now)
         """
         self.name = name
         self.status = status
         self.message = message or f"{name} is {status}"
         self.details = details or {}
-        self.checked_at = datetime.utcnow()
+        self.checked_at = checked_at or datetime.utcnow()
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, checked_at_iso: Optional[str] = None) -> Dict[str, Any]:
         """Convert to dictionary.
 
+        Args:
+            checked_at_iso: Optional preformatted check time to report
+
         Returns:
             Health status dictionary
         """
@@ -59,18 +101,23 @@ class ComponentHealth:
             "status": self.status,
             "message": self.message,
             "details": self.details,
-            "checked_at": self.checked_at.isoformat(),
+            "checked_at": checked_at_iso or self.checked_at.isoformat(),
         }
 
 
 class HealthChecker:
     """Application health checker."""
 
-    def __init__(self, db: Optional[Session] = None):
+    def __init__(
+        self,
+        db: Optional[Session] = None,
+        enabled_checks: Optional[Sequence[str]] = None,
+    ):
         """Initialize health checker.
 
         Args:
             db: Optional database session
+            enabled_checks: Components to check (defaults to all of CHECK_TIMEOUT)
         """
         self.db = db
         self.settings = get_settings()
@@ -78,6 +125,138 @@ class HealthChecker:
         self.cached_status: Optional[Dict[str, Any]] = None
         self.cache_duration = timedelta(seconds=10)
 
+        # Long-lived Redis client, created on first check and reused
+        self._redis = None
+        self._redis_info: Dict[str, Any] = {}
+        self._redis_info_at: Optional[datetime] = None
+        self._redis_info_interval = timedelta(seconds=60)
+
+        # Table count, cached for SCHEMA_CACHE_TTL or until
+        # invalidate_schema_cache() is called
+        self._table_count_cache: Optional[int] = None
+        self._table_count_at: Optional[datetime] = None
+        self._schema_ttl = timedelta(seconds=SCHEMA_CACHE_TTL)
+
+        # Recent disk/memory snapshots, keyed by component
+        self._system_snapshots: Dict[str, tuple] = {}
+        self._system_snapshot_ttl = timedelta(seconds=5)
+
+        # Last non-unhealthy result, served (marked stale) during brief flaps
+        self._last_good: Optional[Dict[str, Any]] = None
+        self._last_good_at: Optional[datetime] = None
+        self.stale_window = timedelta(seconds=60)
+
+        # The component set is fixed, so specialize the runner once
+        self._run = self._build_runner(enabled_checks or tuple(CHECK_TIMEOUT))
+
+    def invalidate_schema_cache(self):
+        """Forget the cached table count (call after migrations)."""
+        self._table_count_cache = None
+
+    def _cached_table_count(self) -> Optional[int]:
+        """Get the table count if it was counted within SCHEMA_CACHE_TTL."""
+        if self._table_count_cache is None:
+            return None
+        if datetime.utcnow() - self._table_count_at >= self._schema_ttl:
+            return None
+        return self._table_count_cache
+
+    def _build_runner(self, enabled_checks: Sequence[str]) -> Callable:
+        """Build a check runner bound to a fixed set of components.
+
+        Args:
+            enabled_checks: Component names to run, in report order
+
+        Returns:
+            Async function returning (component dicts, overall status)
+        """
+        methods = {
+            "database": self.check_database,
+            "ollama": self.check_ollama,
+            "redis": self.check_redis,
+            "disk": self.check_disk_space,
+            "memory": self.check_memory,
+        }
+        checks = tuple(
+            (name, methods[name], CHECK_TIMEOUT[name]) for name in enabled_checks
+        )
+        names = tuple(name for name, _, _ in checks)
+        gather = asyncio.gather
+        wait_for = asyncio.wait_for
+        to_component = self._to_component
+
+        async def run(now: datetime, now_iso: str):
+            results = await gather(
+                *[wait_for(method(), timeout) for _, method, timeout in checks],
+                return_exceptions=True,
+            )
+            healths = [
+                to_component(name, result, now) for name, result in zip(names, results)
+            ]
+            worst = max((_STATUS_PRIORITY[h.status] for h in healths), default=0)
+            return [h.to_dict(now_iso) for h in healths], _PRIORITY_STATUS[worst]
+
+        return run
+
+    @staticmethod
+    def _to_component(name: str, result: Any, now: datetime) -> ComponentHealth:
+        """Turn a gathered check result into a ComponentHealth.
+
+        Args:
+            name: Component name
+            result: Check result or raised exception
+            now: Check time for synthesized results
+
+        Returns:
+            Component health
+        """
+        if isinstance(result, asyncio.TimeoutError):
+            logger.error(f"Health check {name} timed out")
+            return ComponentHealth(
+                name=name,
+                status=(
+                    HealthStatus.DEGRADED
+                    if name in OPTIONAL_COMPONENTS
+                    else HealthStatus.UNHEALTHY
+                ),
+                message=f"timeout after {CHECK_TIMEOUT[name]}s",
+                checked_at=now,
+            )
+
+        if isinstance(result, Exception):
+            logger.error(f"Health check error: {result}")
+            return ComponentHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=str(result),
+                checked_at=now,
+            )
+
+        return result
+
+    def _query_database(self) -> int:
+        """Run the database probe queries synchronously.
+
+        Returns:
+            Number of tables in the database
+        """
+        db = self.db or HealthSessionLocal()
+        try:
+            # Schema only changes at migration time, so recount rarely
+            table_count = self._cached_table_count()
+            if table_count is not None:
+                db.execute(text("SELECT 1")).fetchone()
+                return table_count
+
+            # Liveness and table count in a single round-trip
+            row = db.execute(_DB_PROBE_QUERY).fetchone()
+            self._table_count_cache = row[1]
+            self._table_count_at = datetime.utcnow()
+            return self._table_count_cache
+        finally:
+            if db is not self.db:
+                db.close()
+
     async def check_database(self) -> ComponentHealth:
         """Check database health.
 
@@ -85,17 +264,10 @@ class HealthChecker:
             Database health status
         """
         try:
-            if not self.db:
-                self.db = next(get_db())
-
-            # Execute simple query
-            result = self.db.execute(text("SELECT 1"))
-            result.fetchone()
-
-            # Check table count
-            tables = self.db.execute(
-                text("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
-            ).scalar()
+            tables = await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(None, self._query_database),
+                timeout=HEALTH_DB_TIMEOUT,
+            )
 
             return ComponentHealth(
                 name="database",
@@ -103,6 +275,14 @@ class HealthChecker:
                 details={"tables": tables, "connected": True},
             )
 
+        except asyncio.TimeoutError:
+            logger.error("Database health check timed out")
+            return ComponentHealth(
+                name="database",
+                status=HealthStatus.UNHEALTHY,
+                message=f"Database timeout after {HEALTH_DB_TIMEOUT}s",
+                details={"connected": False, "error": "timeout"},
+            )
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
             return ComponentHealth(
@@ -133,10 +313,14 @@ class HealthChecker:
                         self.settings.ollama_fallback_model,
                     ]
 
+                    # Match by model family (e.g. "mistral" for "mistral:7b")
+                    available_prefixes = {
+                        name.split(":")[0] for name in model_names if name
+                    }
                     missing_models = [
                         m
                         for m in required_models
-                        if not any(m in name for name in model_names)
+                        if m.split(":")[0] not in available_prefixes
                     ]
 
                     if missing_models:
@@ -186,22 +370,30 @@ class HealthChecker:
             Redis health status
         """
         try:
-            import redis.asyncio as redis
-
-            client = redis.from_url(
-                self.settings.redis_url or "redis://localhost:6379",
-                decode_responses=True,
-            )
+            if self._redis is None:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(
+                    self.settings.redis_url or "redis://localhost:6379",
+                    decode_responses=True,
+                    socket_keepalive=True,
+                    health_check_interval=30,
+                )
 
             # Ping Redis
-            await client.ping()
+            await self._redis.ping()
 
-            # Get info
-            info = await client.info()
-            memory_used = info.get("used_memory_human", "N/A")
-            connected_clients = info.get("connected_clients", 0)
+            # Refresh info only occasionally, it rarely changes between probes
+            now = datetime.utcnow()
+            if (
+                self._redis_info_at is None
+                or now - self._redis_info_at >= self._redis_info_interval
+            ):
+                self._redis_info = await self._redis.info()
+                self._redis_info_at = now
 
-            await client.close()
+            memory_used = self._redis_info.get("used_memory_human", "N/A")
+            connected_clients = self._redis_info.get("connected_clients", 0)
 
             return ComponentHealth(
                 name="redis",
@@ -221,6 +413,26 @@ class HealthChecker:
                 details={"available": False},
             )
 
+    async def _system_snapshot(self, key: str, func, *args) -> Any:
+        """Run a blocking psutil call in a thread, reusing recent results.
+
+        Args:
+            key: Snapshot cache key
+            func: psutil function to call
+            *args: Arguments for the function
+
+        Returns:
+            psutil result
+        """
+        now = datetime.utcnow()
+        cached = self._system_snapshots.get(key)
+        if cached and now - cached[1] < self._system_snapshot_ttl:
+            return cached[0]
+
+        result = await asyncio.to_thread(func, *args)
+        self._system_snapshots[key] = (result, now)
+        return result
+
     async def check_disk_space(self) -> ComponentHealth:
         """Check disk space.
 
@@ -230,7 +442,7 @@ class HealthChecker:
         try:
             import psutil
 
-            disk = psutil.disk_usage("/")
+            disk = await self._system_snapshot("disk", psutil.disk_usage, "/")
             free_gb = disk.free / (1024**3)
             percent_used = disk.percent
 
@@ -271,7 +483,7 @@ class HealthChecker:
         try:
             import psutil
 
-            memory = psutil.virtual_memory()
+            memory = await self._system_snapshot("memory", psutil.virtual_memory)
             available_gb = memory.available / (1024**3)
             percent_used = memory.percent
 
@@ -315,52 +527,38 @@ class HealthChecker:
             if now - self.last_check < self.cache_duration:
                 return self.cached_status
 
-        # Run all health checks concurrently
-        checks = await asyncio.gather(
-            self.check_database(),
-            self.check_ollama(),
-            self.check_redis(),
-            self.check_disk_space(),
-            self.check_memory(),
-            return_exceptions=True,
-        )
-
-        # Process results
-        components = []
-        overall_status = HealthStatus.HEALTHY
-
-        for check in checks:
-            if isinstance(check, Exception):
-                logger.error(f"Health check error: {check}")
-                components.append(
-                    ComponentHealth(
-                        name="unknown",
-                        status=HealthStatus.UNHEALTHY,
-                        message=str(check),
-                    ).to_dict()
-                )
-                overall_status = HealthStatus.UNHEALTHY
-            else:
-                components.append(check.to_dict())
+        # All components share one timestamp for this run
+        now_iso = now.isoformat()
 
-                # Update overall status
-                if check.status == HealthStatus.UNHEALTHY:
-                    overall_status = HealthStatus.UNHEALTHY
-                elif (
-                    check.status == HealthStatus.DEGRADED
-                    and overall_status == HealthStatus.HEALTHY
-                ):
-                    overall_status = HealthStatus.DEGRADED
+        # Run the configured health checks concurrently
+        components, overall_status = await self._run(now, now_iso)
 
         # Build response
-        self.cached_status = {
+        payload = {
             "status": overall_status,
-            "timestamp": now.isoformat(),
+            "timestamp": now_iso,
             "components": components,
             "version": self.settings.app_version,
             "environment": "production" if not self.settings.debug else "development",
         }
 
+        if overall_status != HealthStatus.UNHEALTHY:
+            self._last_good = payload
+            self._last_good_at = now
+        elif self._last_good and now - self._last_good_at < self.stale_window:
+            # Ride out a brief downstream flap on the last good snapshot
+            payload = {
+                **self._last_good,
+                "stale": True,
+                "fresh_error": [
+                    f"{c['name']}: {c['message']}"
+                    for c in components
+                    if c["status"] == HealthStatus.UNHEALTHY
+                ],
+                "status": HealthStatus.DEGRADED,
+            }
+
+        self.cached_status = payload
         self.last_check = now
         return self.cached_status
 
@@ -370,15 +568,30 @@ class HealthChecker:
         Returns:
             Readiness status
         """
-        # Check only critical components for readiness
-        db_health = await self.check_database()
+        # Check only critical components for readiness, reusing a fresh
+        # check_all snapshot when there is one
+        now = datetime.utcnow()
+        db_status = None
+        if (
+            self.cached_status
+            and self.last_check
+            and now - self.last_check < self.cache_duration
+            and not self.cached_status.get("stale")
+        ):
+            for component in self.cached_status["components"]:
+                if component["name"] == "database":
+                    db_status = component["status"]
+                    break
+
+        if db_status is None:
+            db_status = (await self.check_database()).status
 
-        ready = db_health.status != HealthStatus.UNHEALTHY
+        ready = db_status != HealthStatus.UNHEALTHY
 
         return {
             "ready": ready,
-            "timestamp": datetime.utcnow().isoformat(),
-            "checks": {"database": db_health.status},
+            "timestamp": now.isoformat(),
+            "checks": {"database": db_status},
         }
 
     async def check_liveness(self) -> Dict[str, Any]:
@@ -390,6 +603,26 @@ class HealthChecker:
         # Simple liveness check - if we can respond, we're alive
         return {"alive": True, "timestamp": datetime.utcnow().isoformat()}
 
+    def check_liveness_fast(self) -> bytes:
+        """Get a pre-serialized liveness payload.
+
+        Returns:
+            Static JSON body, ready to send without encoding
+        """
+        return _LIVENESS_BODY
+
+    async def close(self):
+        """Release long-lived connections held by the checker."""
+        if self._redis is not None:
+            try:
+                await self._redis.close()
+            except Exception as e:
+                logger.warning(f"Error closing Redis health client: {e}")
+            finally:
+                self._redis = None
+                self._redis_info = {}
+                self._redis_info_at = None
+
 
 # Global health checker instance
 _health_checker: Optional[HealthChecker] = None
@@ -407,6 +640,12 @@ def get_health_checker() -> HealthChecker:
     return _health_checker
 
 
+async def close_health_checker():
+    """Close the global health checker's connections, if it was created."""
+    if _health_checker is not None:
+        await _health_checker.close()
+
+
 async def get_health_status() -> Dict[str, Any]:
     """Get current health status.
 
@@ -422,7 +661,8 @@ class SystemMonitor:
 
     def __init__(self):
         """Initialize system monitor."""
-        self.alerts: List[Dict[str, Any]] = []
+        # Oldest first, so expired alerts are popped from the left
+        self.alerts: Deque[Dict[str, Any]] = deque()
         self.thresholds = {
             "cpu_percent": 80,
             "memory_percent": 85,
@@ -437,55 +677,49 @@ class SystemMonitor:
             metrics: Current metrics
         """
         alerts = []
+        system = metrics.get("system") or {}
 
         # Check CPU
-        if (
-            metrics.get("system", {}).get("cpu_percent", 0)
-            > self.thresholds["cpu_percent"]
-        ):
+        if system.get("cpu_percent", 0) > self.thresholds["cpu_percent"]:
             alerts.append(
                 {
                     "level": "warning",
                     "component": "cpu",
-                    "message": f"CPU usage high: {metrics['system']['cpu_percent']:.1f}%",
+                    "message": f"CPU usage high: {system['cpu_percent']:.1f}%",
                 }
             )
 
         # Check memory
-        if (
-            metrics.get("system", {}).get("memory_percent", 0)
-            > self.thresholds["memory_percent"]
-        ):
+        if system.get("memory_percent", 0) > self.thresholds["memory_percent"]:
             alerts.append(
                 {
                     "level": "warning",
                     "component": "memory",
-                    "message": f"Memory usage high: {metrics['system']['memory_percent']:.1f}%",
+                    "message": f"Memory usage high: {system['memory_percent']:.1f}%",
                 }
             )
 
         # Check disk
-        if (
-            metrics.get("system", {}).get("disk_percent", 0)
-            > self.thresholds["disk_percent"]
-        ):
+        if system.get("disk_percent", 0) > self.thresholds["disk_percent"]:
             alerts.append(
                 {
                     "level": "critical",
                     "component": "disk",
-                    "message": f"Disk usage critical: {metrics['system']['disk_percent']:.1f}%",
+                    "message": f"Disk usage critical: {system['disk_percent']:.1f}%",
                 }
             )
 
         # Add alerts with timestamp
+        now = datetime.utcnow()
         for alert in alerts:
-            alert["timestamp"] = datetime.utcnow()
+            alert["timestamp"] = now
             self.alerts.append(alert)
             logger.warning(f"Alert: {alert['message']}")
 
         # Keep only recent alerts
-        cutoff = datetime.utcnow() - timedelta(hours=24)
-        self.alerts = [a for a in self.alerts if a["timestamp"] > cutoff]
+        cutoff = now - timedelta(hours=24)
+        while self.alerts and self.alerts[0]["timestamp"] <= cutoff:
+            self.alerts.popleft()
 
     def get_alerts(self) -> List[Dict[str, Any]]:
         """Get current alerts.
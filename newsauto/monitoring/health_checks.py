@@ -10,18 +10,52 @@ Specialized health checks for:
 
 import asyncio
 import logging
+import os
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 import aiohttp
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 from sqlalchemy.orm import Session
 
 from newsauto.core.config import get_settings
 from newsauto.core.database import SessionLocal
+from newsauto.monitoring._health_engine import (
+    HEALTH_DB_TIMEOUT,
+    SCHEMA_CACHE_TTL,
+    HealthSessionLocal,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-check timeout (seconds) applied by ComprehensiveHealthCheck, in check order
+CHECK_TIMEOUT = {
+    "smtp": 15.0,
+    "ollama": 10.0,
+    "feeds": 5.0,
+    "database": 3.0,
+}
+
+# SMTP error keywords that suggest the sender has been blacklisted
+_BLACKLIST_RE = re.compile(r"blacklist|spam|reputation|blocked|refused", re.I)
+
+_DB_PROBE_QUERY = text(
+    "SELECT 1, (SELECT COUNT(*) FROM sqlite_master WHERE type='table')"
+)
+
+
+async def _disconnect_quietly(sender):
+    """Disconnect an EmailSender, logging rather than raising errors.
+
+    A failing QUIT must not replace the error that ended the probe, whose
+    text is used for blacklist detection.
+    """
+    try:
+        await sender.disconnect()
+    except Exception as e:
+        logger.debug(f"SMTP disconnect failed: {e}")
+
 
 class SMTPHealthCheck:
     """SMTP server health checker with blacklist detection."""
@@ -38,53 +72,71 @@ class SMTPHealthCheck:
 
         self.canary_email = get_settings().smtp_canary_email or "test@example.com"
 
+        # Real canary emails are only sent this often; other probes handshake.
+        # After a failed canary the next one is sent sooner.
+        self.canary_interval = timedelta(hours=1)
+        self.canary_retry_interval = timedelta(minutes=5)
+
+    @property
+    def config(self):
+        """SMTP server configuration being checked."""
+        return self._config
+
+    @config.setter
+    def config(self, config):
+        # Canary results belong to the previous server
+        self._config = config
+        self._last_canary_send: Optional[datetime] = None
+        self._last_canary_ok = True
+
     async def check(self) -> Dict:
         """
         Check SMTP server health.
 
+        Always performs a connect/NOOP handshake; a real canary email is
+        only sent once per ``canary_interval`` (``canary_retry_interval``
+        after a failed one). A canary's result is only reported by the
+        check that sent it.
+
         Returns:
             Health status dict
         """
         try:
-            from newsauto.email.email_sender import EmailSender
-
-            sender = EmailSender(self.config)
-
-            # Test connection
-            await sender.connect()
+            await self._check_handshake()
 
-            # Send test email to canary address
-            test_result = await sender.send_email(
-                to_email=self.canary_email,
-                subject="Health Check",
-                html_content="<html><body>Health check test</body></html>",
+            now = datetime.utcnow()
+            interval = (
+                self.canary_interval
+                if self._last_canary_ok
+                else self.canary_retry_interval
             )
+            canary_due = (
+                self._last_canary_send is None
+                or now - self._last_canary_send > interval
+            )
+            if canary_due:
+                self._last_canary_send = now
+                self._last_canary_ok = await self._check_canary()
 
-            await sender.disconnect()
+                if not self._last_canary_ok:
+                    return {
+                        "healthy": False,
+                        "smtp_host": self.config.host,
+                        "error": "Test email failed - possible blacklisting",
+                    }
 
-            if test_result:
-                return {
-                    "healthy": True,
-                    "smtp_host": self.config.host,
-                    "smtp_port": self.config.port,
-                    "test_send": "success",
-                }
-            else:
-                return {
-                    "healthy": False,
-                    "smtp_host": self.config.host,
-                    "error": "Test email failed - possible blacklisting",
-                }
+            return {
+                "healthy": True,
+                "smtp_host": self.config.host,
+                "smtp_port": self.config.port,
+                "test_send": "success" if canary_due else "skipped",
+            }
 
         except Exception as e:
             logger.error(f"SMTP health check failed: {e}")
 
             # Check if error indicates blacklisting
-            error_str = str(e).lower()
-            is_blacklisted = any(
-                keyword in error_str
-                for keyword in ["blacklist", "spam", "reputation", "blocked", "refused"]
-            )
+            is_blacklisted = bool(_BLACKLIST_RE.search(str(e)))
 
             return {
                 "healthy": False,
@@ -93,6 +145,41 @@ class SMTPHealthCheck:
                 "blacklisted": is_blacklisted,
             }
 
+    async def _check_handshake(self):
+        """Connect, issue NOOP and quit without sending mail."""
+        from newsauto.email.email_sender import EmailSender
+
+        sender = EmailSender(self.config)
+        try:
+            await sender.noop()
+        finally:
+            await _disconnect_quietly(sender)
+
+    async def _check_canary(self) -> bool:
+        """Send a real test email to the canary address.
+
+        Returns:
+            True if the email was accepted
+        """
+        from newsauto.email.email_sender import EmailSender
+
+        sender = EmailSender(self.config)
+        try:
+            await sender.connect()
+
+            # Send test email to canary address
+            return await sender.send_email(
+                to_email=self.canary_email,
+                subject="Health Check",
+                html_content="<html><body>Health check test</body></html>",
+            )
+        except Exception:
+            # Report the failure until the next canary is due, too
+            self._last_canary_ok = False
+            raise
+        finally:
+            await _disconnect_quietly(sender)
+
 
 class OllamaHealthCheck:
     """Ollama service and model health checker."""
@@ -126,11 +213,15 @@ class OllamaHealthCheck:
                     available_models = [m["name"] for m in data.get("models", [])]
 
                     # Check required models are available
-                    missing_models = []
-                    for model in self.required_models:
-                        # Match by prefix (e.g., "mistral:7b" matches "mistral:7b-instruct")
-                        if not any(model.split(":")[0] in avail for avail in available_models):
-                            missing_models.append(model)
+                    # Match by prefix (e.g., "mistral:7b" matches "mistral:7b-instruct")
+                    available_prefixes = {
+                        avail.split(":")[0] for avail in available_models
+                    }
+                    missing_models = [
+                        model
+                        for model in self.required_models
+                        if model.split(":")[0] not in available_prefixes
+                    ]
 
                     if missing_models:
                         return {
@@ -172,45 +263,58 @@ class FeedHealthCheck:
             db = SessionLocal()
 
             try:
-                # Get all enabled content sources
                 from newsauto.models.content import ContentSource
 
-                sources = db.query(ContentSource).filter(ContentSource.enabled == True).all()
+                # Count active sources and fetch only the failing ones, as
+                # plain Core rows rather than ORM-mapped objects
+                total_feeds = (
+                    db.execute(
+                        select(func.count())
+                        .select_from(ContentSource)
+                        .where(ContentSource.active.is_(True))
+                    ).scalar()
+                    or 0
+                )
 
-                if not sources:
+                if not total_feeds:
                     return {"healthy": True, "total_feeds": 0, "failed_feeds": []}
 
-                # Check each feed's recent failure rate
+                rows = db.execute(
+                    select(
+                        ContentSource.id,
+                        ContentSource.name,
+                        ContentSource.url,
+                        ContentSource.error_count,
+                    ).where(
+                        ContentSource.active.is_(True),
+                        ContentSource.error_count > 0,
+                    )
+                ).all()
+
+                # Bucket the (few) failing feeds by consecutive failure count
                 failed_feeds = []
                 warning_feeds = []
 
-                for source in sources:
-                    # Count recent failures (last 24 hours)
-                    cutoff = datetime.utcnow() - timedelta(hours=24)
-
-                    # Get failure count from source metadata
-                    failure_count = source.metadata.get("consecutive_failures", 0) if source.metadata else 0
-
+                for source_id, name, url, failure_count in rows:
                     if failure_count >= self.failure_threshold:
                         failed_feeds.append(
                             {
-                                "source_id": source.id,
-                                "name": source.name,
-                                "url": source.url,
+                                "source_id": source_id,
+                                "name": name,
+                                "url": url,
                                 "failure_count": failure_count,
                             }
                         )
-                    elif failure_count > 0:
+                    else:
                         warning_feeds.append(
                             {
-                                "source_id": source.id,
-                                "name": source.name,
+                                "source_id": source_id,
+                                "name": name,
                                 "failure_count": failure_count,
                             }
                         )
 
                 # Calculate failure rate
-                total_feeds = len(sources)
                 failure_rate = len(failed_feeds) / total_feeds if total_feeds > 0 else 0
 
                 # Unhealthy if >20% of feeds are failing
@@ -236,7 +340,30 @@ class DatabaseHealthCheck:
     """Database connection and integrity checker."""
 
     def __init__(self):
-        pass
+        # Table count, cached for SCHEMA_CACHE_TTL or until
+        # invalidate_schema_cache() is called
+        self._table_count_cache: Optional[int] = None
+        self._table_count_at: Optional[datetime] = None
+        self._schema_ttl = timedelta(seconds=SCHEMA_CACHE_TTL)
+
+        db_url = get_settings().database_url
+        self.db_path = db_url.replace("sqlite:///", "") if "sqlite" in db_url else None
+
+        # (size_mb, measured_at); file size barely changes between probes
+        self._size_cache = (0.0, datetime.min)
+        self._size_ttl = timedelta(seconds=60)
+
+    def invalidate_schema_cache(self):
+        """Forget the cached table count (call after migrations)."""
+        self._table_count_cache = None
+
+    def _cached_table_count(self) -> Optional[int]:
+        """Get the table count if it was counted within SCHEMA_CACHE_TTL."""
+        if self._table_count_cache is None:
+            return None
+        if datetime.utcnow() - self._table_count_at >= self._schema_ttl:
+            return None
+        return self._table_count_cache
 
     async def check(self) -> Dict:
         """
@@ -246,53 +373,86 @@ class DatabaseHealthCheck:
             Health status dict
         """
         try:
-            db = SessionLocal()
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(None, self._check_sync),
+                timeout=HEALTH_DB_TIMEOUT,
+            )
 
-            try:
-                # Test basic query
-                result = db.execute(text("SELECT 1")).scalar()
+        except asyncio.TimeoutError:
+            logger.error("Database health check timed out")
+            return {
+                "healthy": False,
+                "error": f"Database timeout after {HEALTH_DB_TIMEOUT}s",
+                "connection": "failed",
+            }
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return {"healthy": False, "error": str(e), "connection": "failed"}
 
-                if result != 1:
-                    return {"healthy": False, "error": "Query returned unexpected result"}
+    def _db_size_mb(self) -> Optional[float]:
+        """Get the SQLite file size, re-statting at most once per ``_size_ttl``.
 
-                # Check table existence
-                tables_query = text(
-                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table'"
-                )
-                table_count = db.execute(tables_query).scalar()
+        Returns:
+            Size in MB, or None for non-SQLite databases
+        """
+        if self.db_path is None:
+            return None
 
-                if table_count < 5:  # Expect at least 5 core tables
-                    return {
-                        "healthy": False,
-                        "error": f"Only {table_count} tables found (expected >=5)",
-                    }
+        now = datetime.utcnow()
+        size_mb, measured_at = self._size_cache
+        if now - measured_at < self._size_ttl:
+            return size_mb
 
-                # Check database file size
-                import os
+        if os.path.exists(self.db_path):
+            size_mb = os.path.getsize(self.db_path) / (1024 * 1024)
+        else:
+            size_mb = 0
+        self._size_cache = (size_mb, now)
+        return size_mb
 
-                db_url = get_settings().database_url
-                if "sqlite" in db_url:
-                    db_path = db_url.replace("sqlite:///", "")
-                    if os.path.exists(db_path):
-                        db_size_mb = os.path.getsize(db_path) / (1024 * 1024)
-                    else:
-                        db_size_mb = 0
-                else:
-                    db_size_mb = None
+    def _check_sync(self) -> Dict:
+        """Run the blocking database checks.
+
+        Returns:
+            Health status dict
+        """
+        db = HealthSessionLocal()
+
+        try:
+            table_count = self._cached_table_count()
+            recounted = table_count is None
+            if not recounted:
+                # Schema was counted recently, only test liveness
+                result = db.execute(text("SELECT 1")).scalar()
+            else:
+                # Test basic query and table existence in one round-trip
+                result, table_count = db.execute(_DB_PROBE_QUERY).fetchone()
 
+            if result != 1:
+                return {"healthy": False, "error": "Query returned unexpected result"}
+
+            if table_count < 5:  # Expect at least 5 core tables
                 return {
-                    "healthy": True,
-                    "table_count": table_count,
-                    "db_size_mb": round(db_size_mb, 2) if db_size_mb else None,
-                    "connection": "ok",
+                    "healthy": False,
+                    "error": f"Only {table_count} tables found (expected >=5)",
                 }
 
-            finally:
-                db.close()
+            if recounted:
+                self._table_count_cache = table_count
+                self._table_count_at = datetime.utcnow()
 
-        except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            return {"healthy": False, "error": str(e), "connection": "failed"}
+            # Check database file size
+            db_size_mb = self._db_size_mb()
+
+            return {
+                "healthy": True,
+                "table_count": table_count,
+                "db_size_mb": round(db_size_mb, 2) if db_size_mb else None,
+                "connection": "ok",
+            }
+
+        finally:
+            db.close()
 
 
 class ComprehensiveHealthCheck:
@@ -304,39 +464,73 @@ class ComprehensiveHealthCheck:
         self.feed_check = FeedHealthCheck()
         self.db_check = DatabaseHealthCheck()
 
+        # Short-lived result cache; concurrent misses share one in-flight run
+        self._cached: Optional[Dict] = None
+        self._last: Optional[datetime] = None
+        self._ttl = timedelta(seconds=10)
+        self._inflight: Optional[asyncio.Future] = None
+
     async def check_all(self) -> Dict:
         """
-        Run all health checks.
+        Run all health checks, reusing results for up to ``_ttl``.
+
+        Returns:
+            Complete health status
+        """
+        if self._cached is not None and self._last is not None:
+            if datetime.utcnow() - self._last < self._ttl:
+                return self._cached
+
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._run_all())
+            self._inflight.add_done_callback(self._clear_inflight)
+
+        # Shield so a cancelled caller does not cancel the shared run
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, _future: asyncio.Future):
+        self._inflight = None
+
+    async def _run_all(self) -> Dict:
+        """
+        Run all health checks and refresh the cache.
 
         Returns:
             Complete health status
         """
         try:
-            # Run all checks in parallel
-            smtp, ollama, feeds, database = await asyncio.gather(
-                self.smtp_check.check(),
-                self.ollama_check.check(),
-                self.feed_check.check(),
-                self.db_check.check(),
+            # Run all checks in parallel, each bounded by its own timeout
+            results = await asyncio.gather(
+                asyncio.wait_for(self.smtp_check.check(), CHECK_TIMEOUT["smtp"]),
+                asyncio.wait_for(self.ollama_check.check(), CHECK_TIMEOUT["ollama"]),
+                asyncio.wait_for(self.feed_check.check(), CHECK_TIMEOUT["feeds"]),
+                asyncio.wait_for(self.db_check.check(), CHECK_TIMEOUT["database"]),
                 return_exceptions=True,
             )
 
             # Process results
-            checks = {
-                "smtp": smtp if not isinstance(smtp, Exception) else {"healthy": False, "error": str(smtp)},
-                "ollama": ollama if not isinstance(ollama, Exception) else {"healthy": False, "error": str(ollama)},
-                "feeds": feeds if not isinstance(feeds, Exception) else {"healthy": False, "error": str(feeds)},
-                "database": database if not isinstance(database, Exception) else {"healthy": False, "error": str(database)},
-            }
+            checks = {}
+            for name, result in zip(CHECK_TIMEOUT, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    result = {
+                        "healthy": False,
+                        "error": f"timeout after {CHECK_TIMEOUT[name]}s",
+                    }
+                elif isinstance(result, Exception):
+                    result = {"healthy": False, "error": str(result)}
+                checks[name] = result
 
             # Overall health
             all_healthy = all(check.get("healthy", False) for check in checks.values())
 
-            return {
+            now = datetime.utcnow()
+            self._cached = {
                 "overall_healthy": all_healthy,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now.isoformat(),
                 "checks": checks,
             }
+            self._last = now
+            return self._cached
 
         except Exception as e:
             logger.error(f"Comprehensive health check failed: {e}")
@@ -1,18 +1,34 @@
 """Metrics collection and monitoring."""
 
+import asyncio
+import heapq
 import logging
+import os
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import psutil
 from fastapi import Request, Response
-from prometheus_client import Counter, Gauge, Histogram, generate_latest
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
 from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
+# Seconds a get_stats() result is reused, so bursts of scrapes share one pass
+STATS_CACHE_TTL = 1.0
+
 
 # Prometheus metrics
 request_count = Counter(
@@ -51,17 +67,137 @@ memory_usage = Gauge("system_memory_percent", "Memory usage percentage")
 disk_usage = Gauge("system_disk_percent", "Disk usage percentage")
 
 
+def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a get_stats() result, so callers cannot change the cached one."""
+    return {
+        **stats,
+        "avg_response_times": dict(stats["avg_response_times"]),
+        "system": dict(stats["system"]),
+    }
+
+
+class _RequestAggregator:
+    """Accumulates request metrics in plain dicts between flushes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[tuple, int] = defaultdict(int)
+        self._durations: Dict[tuple, list] = defaultdict(list)
+
+    def add(self, method: str, endpoint: str, status_code: int, duration: float):
+        with self._lock:
+            self._counts[(method, endpoint, status_code)] += 1
+            self._durations[(method, endpoint)].append(duration)
+
+    def swap(self):
+        """Take the accumulated values and start fresh ones.
+
+        Returns:
+            Tuple of (counts, durations) collected since the last swap
+        """
+        with self._lock:
+            counts, durations = self._counts, self._durations
+            self._counts = defaultdict(int)
+            self._durations = defaultdict(list)
+        return counts, durations
+
+
 class MetricsCollector:
     """Collects and manages application metrics."""
 
     def __init__(self):
         """Initialize metrics collector."""
         self.start_time = datetime.utcnow()
-        self.request_times: Dict[str, list] = defaultdict(list)
+        # Last 1000 request durations per endpoint
+        self.request_times: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+
+        # Running totals so get_stats does not rescan every sample
+        self._total_requests = 0
+        self._endpoint_sum: Dict[str, float] = defaultdict(float)
         self.error_counts: Dict[str, int] = defaultdict(int)
         self.cache_hits = 0
         self.cache_misses = 0
 
+        # Resolved Prometheus children, keyed by label values
+        self._children: Dict[tuple, Any] = {}
+
+        # Client-side request aggregation, active while the flush loop runs
+        self._aggregator = _RequestAggregator()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Latest system resource sample, refreshed by the background sampler
+        self._system_stats: Dict[str, float] = {}
+        self._sampler_task: Optional[asyncio.Task] = None
+
+        # get_stats result, reused for STATS_CACHE_TTL seconds
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_ts = 0.0
+
+    def _child(self, metric, *label_values):
+        """Get the labelled child of a metric, resolving it only once.
+
+        Args:
+            metric: Prometheus metric with labels
+            *label_values: Label values in declaration order
+
+        Returns:
+            Labelled metric child
+        """
+        key = (metric, label_values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*label_values)
+        return child
+
+    def flush(self):
+        """Push aggregated request metrics into the Prometheus metrics."""
+        counts, durations = self._aggregator.swap()
+
+        for (method, endpoint, status_code), delta in counts.items():
+            self._child(request_count, method, endpoint, status_code).inc(delta)
+
+        for (method, endpoint), values in durations.items():
+            histogram = self._child(request_duration, method, endpoint)
+            for value in values:
+                histogram.observe(value)
+
+    async def _flush_loop(self, interval: float):
+        """Flush aggregated metrics every ``interval`` seconds.
+
+        Args:
+            interval: Seconds between flushes
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing metrics: {e}")
+
+    def start_flush_loop(self, interval: float = 1.0):
+        """Start batching request metrics and flushing them periodically.
+
+        Must be called from a running event loop (e.g. app startup).
+
+        Args:
+            interval: Seconds between flushes
+        """
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_loop(interval)
+            )
+
+    async def stop_flush_loop(self):
+        """Stop the flush loop and push any remaining metrics."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self.flush()
+
     def record_request(
         self, method: str, endpoint: str, status_code: int, duration: float
     ):
@@ -73,17 +209,22 @@ class MetricsCollector:
             status_code: Response status code
             duration: Request duration in seconds
         """
-        # Prometheus metrics
-        request_count.labels(method=method, endpoint=endpoint, status=status_code).inc()
-        request_duration.labels(method=method, endpoint=endpoint).observe(duration)
+        # Prometheus metrics, batched when the flush loop is running
+        if self._flush_task is not None:
+            self._aggregator.add(method, endpoint, status_code, duration)
+        else:
+            self._child(request_count, method, endpoint, status_code).inc()
+            self._child(request_duration, method, endpoint).observe(duration)
 
         # Internal tracking
         key = f"{method}:{endpoint}"
-        self.request_times[key].append(duration)
-
-        # Keep only last 1000 requests per endpoint
-        if len(self.request_times[key]) > 1000:
-            self.request_times[key] = self.request_times[key][-1000:]
+        times = self.request_times[key]
+        if len(times) == times.maxlen:
+            # Oldest sample is about to be evicted
+            self._endpoint_sum[key] -= times[0]
+        times.append(duration)
+        self._endpoint_sum[key] += duration
+        self._total_requests += 1
 
         # Track errors
         if status_code >= 400:
@@ -100,9 +241,7 @@ class MetricsCollector:
             recipient_count: Number of recipients
         """
         status = "success" if success else "failed"
-        newsletter_sends.labels(newsletter_id=newsletter_id, status=status).inc(
-            recipient_count
-        )
+        self._child(newsletter_sends, newsletter_id, status).inc(recipient_count)
 
     def record_content_fetch(self, source: str, success: bool, item_count: int = 0):
         """Record content fetch metrics.
@@ -113,7 +252,7 @@ class MetricsCollector:
             item_count: Number of items fetched
         """
         status = "success" if success else "failed"
-        content_fetches.labels(source=source, status=status).inc()
+        self._child(content_fetches, source, status).inc()
 
         if success:
             logger.info(f"Fetched {item_count} items from {source}")
@@ -129,13 +268,13 @@ class MetricsCollector:
             tokens_input: Input token count
             tokens_output: Output token count
         """
-        llm_requests.labels(model=model, operation=operation).inc()
+        self._child(llm_requests, model, operation).inc()
 
         if tokens_input > 0:
-            llm_tokens.labels(model=model, type="input").inc(tokens_input)
+            self._child(llm_tokens, model, "input").inc(tokens_input)
 
         if tokens_output > 0:
-            llm_tokens.labels(model=model, type="output").inc(tokens_output)
+            self._child(llm_tokens, model, "output").inc(tokens_output)
 
     def record_email_send(self, success: bool):
         """Record email send metrics.
@@ -144,7 +283,7 @@ class MetricsCollector:
             success: Whether email was sent successfully
         """
         status = "success" if success else "failed"
-        email_sends.labels(status=status).inc()
+        self._child(email_sends, status).inc()
 
     def record_subscriber_event(self, event_type: str):
         """Record subscriber event.
@@ -152,7 +291,7 @@ class MetricsCollector:
         Args:
             event_type: Type of event (open, click, unsubscribe, etc.)
         """
-        subscriber_events.labels(event_type=event_type).inc()
+        self._child(subscriber_events, event_type).inc()
 
     def record_cache_access(self, hit: bool):
         """Record cache access.
@@ -166,10 +305,19 @@ class MetricsCollector:
             self.cache_misses += 1
 
     def update_system_metrics(self):
-        """Update system resource metrics."""
+        """Update system resource metrics.
+
+        A no-op while the background sampler is running, since it keeps
+        the gauges current.
+        """
+        if self._sampler_task is None:
+            self._sample_system()
+
+    def _sample_system(self):
+        """Sample system resources without blocking and update the gauges."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous call (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_usage.set(cpu_percent)
 
             # Memory usage
@@ -180,22 +328,72 @@ class MetricsCollector:
             disk = psutil.disk_usage("/")
             disk_usage.set(disk.percent)
 
+            self._system_stats = {
+                "cpu_percent": cpu_percent,
+                "memory_percent": memory.percent,
+                "disk_percent": disk.percent,
+            }
+
         except Exception as e:
             logger.error(f"Error updating system metrics: {e}")
 
+    async def _system_sampler(self, period: float):
+        """Sample system resources every ``period`` seconds.
+
+        Args:
+            period: Seconds between samples
+        """
+        while True:
+            await asyncio.to_thread(self._sample_system)
+            await asyncio.sleep(period)
+
+    def start_system_sampler(self, period: float = 5.0):
+        """Start sampling system metrics in the background.
+
+        Must be called from a running event loop (e.g. app startup).
+
+        Args:
+            period: Seconds between samples
+        """
+        if self._sampler_task is None:
+            self._sampler_task = asyncio.get_running_loop().create_task(
+                self._system_sampler(period)
+            )
+
+    async def stop_system_sampler(self):
+        """Stop the background system sampler."""
+        if self._sampler_task is not None:
+            self._sampler_task.cancel()
+            try:
+                await self._sampler_task
+            except asyncio.CancelledError:
+                pass
+            self._sampler_task = None
+
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics.
 
         Returns:
             Statistics dictionary
         """
+        now = time.monotonic()
+        if (
+            self._stats_cache is not None
+            and now - self._stats_cache_ts < STATS_CACHE_TTL
+        ):
+            return _copy_stats(self._stats_cache)
+
         uptime = datetime.utcnow() - self.start_time
 
         # Calculate average response times
         avg_response_times = {}
         for endpoint, times in self.request_times.items():
             if times:
-                avg_response_times[endpoint] = sum(times) / len(times)
+                avg_response_times[endpoint] = self._endpoint_sum[endpoint] / len(times)
+
+        # Without the background sampler, sample on each refresh
+        if self._sampler_task is None:
+            self._sample_system()
 
         # Calculate cache hit rate
         total_cache_access = self.cache_hits + self.cache_misses
@@ -205,18 +403,16 @@ class MetricsCollector:
             else 0
         )
 
-        return {
+        self._stats_cache = {
             "uptime_seconds": uptime.total_seconds(),
-            "total_requests": sum(len(times) for times in self.request_times.values()),
+            "total_requests": self._total_requests,
             "error_count": sum(self.error_counts.values()),
             "avg_response_times": avg_response_times,
             "cache_hit_rate": cache_hit_rate,
-            "system": {
-                "cpu_percent": psutil.cpu_percent(),
-                "memory_percent": psutil.virtual_memory().percent,
-                "disk_percent": psutil.disk_usage("/").percent,
-            },
+            "system": dict(self._system_stats),
         }
+        self._stats_cache_ts = now
+        return _copy_stats(self._stats_cache)
 
     def get_prometheus_metrics(self) -> bytes:
         """Get metrics in Prometheus format.
@@ -226,9 +422,41 @@ class MetricsCollector:
         """
         # Update system metrics
         self.update_system_metrics()
+        self.flush()
 
         # Generate Prometheus format
-        return generate_latest()
+        return generate_latest(_exposition_registry())
+
+    async def get_prometheus_metrics_async(self) -> bytes:
+        """Get metrics in Prometheus format without blocking the event loop.
+
+        Serializing the registry is CPU-bound, so it runs in the default
+        executor.
+
+        Returns:
+            Prometheus formatted metrics
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_prometheus_metrics)
+
+
+def _exposition_registry() -> CollectorRegistry:
+    """Get the registry to expose metrics from.
+
+    The module-level metrics live in the default registry, which is only
+    accurate in single-process mode. When running multiple workers, set
+    PROMETHEUS_MULTIPROC_DIR so every worker writes its samples there and
+    the exposition aggregates them across processes.
+
+    Returns:
+        A multiprocess registry, or the default registry
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
 
 
 # Global metrics collector instance
@@ -293,7 +521,10 @@ class PerformanceMonitor:
             threshold_ms: Threshold in milliseconds for slow requests
         """
         self.threshold_ms = threshold_ms
-        self.slow_requests: list = []
+        # Last 100 slow requests
+        self.slow_requests: deque = deque(maxlen=100)
+        # endpoint -> (count, sum, max) over the slow_requests window
+        self._endpoint_agg: Dict[str, Tuple[int, float, float]] = {}
 
     def check_request(
         self, endpoint: str, duration_ms: float, request_id: Optional[str] = None
@@ -306,6 +537,15 @@ class PerformanceMonitor:
             request_id: Optional request ID
         """
         if duration_ms > self.threshold_ms:
+            if len(self.slow_requests) == self.slow_requests.maxlen:
+                self._evict(self.slow_requests[0])
+
+            count, total, peak = self._endpoint_agg.get(endpoint, (0, 0.0, 0.0))
+            self._endpoint_agg[endpoint] = (
+                count + 1,
+                total + duration_ms,
+                max(peak, duration_ms),
+            )
             self.slow_requests.append(
                 {
                     "endpoint": endpoint,
@@ -315,14 +555,27 @@ class PerformanceMonitor:
                 }
             )
 
-            # Keep only last 100 slow requests
-            if len(self.slow_requests) > 100:
-                self.slow_requests = self.slow_requests[-100:]
-
             logger.warning(
                 f"Slow request detected: {endpoint} took {duration_ms:.2f}ms"
             )
 
+    def _evict(self, req: Dict[str, Any]):
+        """Remove a request that is about to fall out of the window."""
+        endpoint = req["endpoint"]
+        count, total, peak = self._endpoint_agg[endpoint]
+        if count == 1:
+            del self._endpoint_agg[endpoint]
+            return
+
+        if req["duration_ms"] >= peak:
+            # Rare: the evicted request was the max, rescan the window
+            peak = max(
+                r["duration_ms"]
+                for r in islice(self.slow_requests, 1, None)
+                if r["endpoint"] == endpoint
+            )
+        self._endpoint_agg[endpoint] = (count - 1, total - req["duration_ms"], peak)
+
     def get_slow_endpoints(self) -> Dict[str, Any]:
         """Get statistics about slow endpoints.
 
@@ -332,27 +585,22 @@ class PerformanceMonitor:
         if not self.slow_requests:
             return {"count": 0, "endpoints": []}
 
-        # Group by endpoint
-        endpoint_stats = defaultdict(list)
-        for req in self.slow_requests:
-            endpoint_stats[req["endpoint"]].append(req["duration_ms"])
+        # Top 10 slowest by average duration
+        top = heapq.nlargest(
+            10,
+            self._endpoint_agg.items(),
+            key=lambda item: item[1][1] / item[1][0],
+        )
 
-        # Calculate stats per endpoint
-        results = []
-        for endpoint, durations in endpoint_stats.items():
-            results.append(
+        return {
+            "count": len(self.slow_requests),
+            "endpoints": [
                 {
                     "endpoint": endpoint,
-                    "count": len(durations),
-                    "avg_duration_ms": sum(durations) / len(durations),
-                    "max_duration_ms": max(durations),
+                    "count": count,
+                    "avg_duration_ms": total / count,
+                    "max_duration_ms": peak,
                 }
-            )
-
-        # Sort by average duration
-        results.sort(key=lambda x: x["avg_duration_ms"], reverse=True)
-
-        return {
-            "count": len(self.slow_requests),
-            "endpoints": results[:10],  # Top 10 slowest
+                for endpoint, (count, total, peak) in top
+            ],
         }
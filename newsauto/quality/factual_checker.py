@@ -7,13 +7,97 @@ Cross-references generated content with source URLs and known facts.
 import asyncio
 import logging
 import re
-from typing import Dict, Optional
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import aiohttp
 
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, fall back to substring scans
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Academic/government domain suffixes
+_ACADEMIC_SUFFIXES = (".edu", ".gov", ".ac.uk", ".edu.au")
+
+# Known tech blogs/news sites
+_KNOWN_TECH_SOURCES = frozenset(
+    {
+        "github.com",
+        "stackoverflow.com",
+        "medium.com",
+        "dev.to",
+        "hackernews.com",
+        "reddit.com",
+    }
+)
+
+# HEAD timeout (seconds) for sources whose domain is already trusted
+TRUSTED_HEAD_TIMEOUT = 2.0
+
+# How long (seconds) a URL accessibility result is reused
+ACCESSIBILITY_CACHE_TTL = 300.0
+
+# Bytes of source content read for consistency checks, and the largest
+# advertised body (Content-Length) worth fetching at all
+SOURCE_READ_LIMIT = 50_000
+MAX_SOURCE_CONTENT_LENGTH = 2_000_000
+
+# HTML tag and whitespace-run patterns used to clean fetched source pages
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+def _matches_domain(domain: str, domains: FrozenSet[str]) -> bool:
+    """Check whether domain, or any parent domain of it, is in a set.
+
+    "cooking.nytimes.com" matches "nytimes.com" via suffix lookups, one
+    set probe per label rather than a scan of the whole set.
+    """
+    parts = domain.split(".")
+    return any(".".join(parts[i:]) in domains for i in range(len(parts) - 1))
+
+
+@lru_cache(maxsize=1024)
+def _domain_credibility(domain: str, trusted: FrozenSet[str]) -> float:
+    """Score a domain's credibility (pure, so results are memoized)."""
+    # Check against trusted sources
+    if _matches_domain(domain, trusted):
+        return 1.0  # High credibility
+
+    # Check for academic/government domains
+    if domain.endswith(_ACADEMIC_SUFFIXES):
+        return 0.95
+
+    # Check for known tech blogs/news sites
+    if _matches_domain(domain, _KNOWN_TECH_SOURCES):
+        return 0.75
+
+    # Unknown source - medium credibility
+    return 0.60
+
+
+def _count_phrases_present(phrases: List[str], text: str) -> int:
+    """Count how many phrases occur as substrings of text.
+
+    Uses a single Aho-Corasick pass over the text when pyahocorasick is
+    installed, instead of one scan per phrase.
+    """
+    if ahocorasick is None:
+        return sum(1 for phrase in phrases if phrase in text)
+
+    automaton = ahocorasick.Automaton()
+    for phrase in set(phrases):
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+
+    found = {phrase for _, phrase in automaton.iter(text)}
+    return sum(1 for phrase in phrases if phrase in found)
+
 
 class FactualChecker:
     """Checks factual accuracy of generated content."""
@@ -38,11 +122,31 @@ class FactualChecker:
             "nature.com",
             "science.org",
         }
+        self._trusted = frozenset(self.trusted_sources)
+
+        # URL -> (accessibility score, expiry on the monotonic clock)
+        self._acc_cache: Dict[str, Tuple[float, float]] = {}
 
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+            # Cache DNS so repeat checks on the same news domains skip lookups
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (compatible; Newsauto/1.0)",
+                    "Accept-Encoding": "gzip, deflate",
+                },
+                raise_for_status=False,
+            )
         return self.session
 
     async def close(self):
@@ -50,13 +154,17 @@ class FactualChecker:
         if self.session and not self.session.closed:
             await self.session.close()
 
-    async def check(self, summary: str, source_url: str) -> float:
+    async def check(
+        self, summary: str, source_url: str, cached_body: Optional[str] = None
+    ) -> float:
         """
         Check factual accuracy of summary against source.
 
         Args:
             summary: Generated summary
             source_url: Original source URL
+            cached_body: Source content already fetched by the pipeline; when
+                non-empty, the URL is not requested again
 
         Returns:
             Score from 0.0 (low accuracy) to 1.0 (high accuracy)
@@ -73,11 +181,24 @@ class FactualChecker:
             scores.append(credibility_score * 0.35)  # 35% weight
 
             # 2. URL accessibility check
-            accessibility_score = await self._check_url_accessible(source_url)
+            if cached_body:
+                # We already have the body, so the source was reachable
+                accessibility_score = 1.0
+            elif credibility_score >= 0.95:
+                accessibility_score = await self._check_url_accessible(
+                    source_url, timeout=TRUSTED_HEAD_TIMEOUT
+                )
+            else:
+                accessibility_score = await self._check_url_accessible(source_url)
             scores.append(accessibility_score * 0.25)  # 25% weight
 
             # 3. Content consistency (if we can fetch source)
-            if accessibility_score > 0.5:
+            if cached_body:
+                consistency_score = self._check_content_consistency(
+                    summary, cached_body
+                )
+                scores.append(consistency_score * 0.40)  # 40% weight
+            elif accessibility_score > 0.5:
                 try:
                     source_content = await self._fetch_source_content(source_url)
                     if source_content:
@@ -96,10 +217,11 @@ class FactualChecker:
             final_score = sum(scores)
 
             logger.debug(
-                f"Factual check for {source_url[:50]}: "
-                f"credibility={credibility_score:.2f}, "
-                f"accessible={accessibility_score:.2f}, "
-                f"final={final_score:.2f}"
+                "Factual check for %.50s: credibility=%.2f, accessible=%.2f, final=%.2f",
+                source_url,
+                credibility_score,
+                accessibility_score,
+                final_score,
             )
 
             return round(final_score, 3)
@@ -108,59 +230,84 @@ class FactualChecker:
             logger.error(f"Error in factual checking: {e}")
             return 0.5  # Neutral score on error
 
+    async def check_batch(
+        self, items: List[Tuple[str, str]], concurrency: int = 16
+    ) -> List[Union[float, BaseException]]:
+        """
+        Check many (summary, source_url) pairs concurrently.
+
+        Args:
+            items: (summary, source_url) pairs
+            concurrency: Maximum checks in flight at once
+
+        Returns:
+            Scores in input order (exceptions returned in place)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(summary: str, source_url: str) -> float:
+            async with semaphore:
+                return await self.check(summary, source_url)
+
+        return await asyncio.gather(
+            *[_one(summary, url) for summary, url in items], return_exceptions=True
+        )
+
     def _check_source_credibility(self, url: str) -> float:
         """Check if source is from a credible domain."""
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+            domain = (parsed.hostname or "").lower()
 
             # Remove www. prefix
             domain = domain.replace("www.", "")
 
-            # Check against trusted sources
-            for trusted in self.trusted_sources:
-                if trusted in domain:
-                    return 1.0  # High credibility
-
-            # Check for academic/government domains
-            if domain.endswith((".edu", ".gov", ".ac.uk", ".edu.au")):
-                return 0.95
-
-            # Check for known tech blogs/news sites
-            known_tech = [
-                "github.com",
-                "stackoverflow.com",
-                "medium.com",
-                "dev.to",
-                "hackernews.com",
-                "reddit.com",
-            ]
-            if any(site in domain for site in known_tech):
-                return 0.75
-
-            # Unknown source - medium credibility
-            return 0.60
+            return _domain_credibility(domain, self._trusted)
 
         except Exception as e:
             logger.error(f"Error checking source credibility: {e}")
             return 0.50
 
-    async def _check_url_accessible(self, url: str) -> float:
-        """Check if URL is accessible."""
+    async def _check_url_accessible(
+        self, url: str, timeout: Optional[float] = None
+    ) -> float:
+        """Check if URL is accessible, reusing recent results for the URL.
+
+        Args:
+            url: URL to check
+            timeout: Optional total timeout overriding the session default
+        """
+        now = time.monotonic()
+        cached = self._acc_cache.get(url)
+        if cached and now < cached[1]:
+            return cached[0]
+
         try:
             session = await self.get_session()
 
-            async with session.head(url, allow_redirects=True) as response:
+            kwargs = {}
+            if timeout is not None:
+                kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+            async with session.head(url, allow_redirects=True, **kwargs) as response:
                 if response.status == 200:
-                    return 1.0
+                    score = 1.0
                 elif response.status in (301, 302, 307, 308):
-                    return 0.8  # Redirects are okay
+                    score = 0.8  # Redirects are okay
                 elif response.status == 403:
-                    return 0.6  # Forbidden but exists
+                    score = 0.6  # Forbidden but exists
                 elif response.status == 404:
-                    return 0.0  # Not found
+                    score = 0.0  # Not found
                 else:
-                    return 0.4  # Other errors
+                    score = 0.4  # Other errors
+
+            # Only definite answers are cached; errors are retried next time
+            if len(self._acc_cache) >= 1024:
+                self._acc_cache = {
+                    k: v for k, v in self._acc_cache.items() if now < v[1]
+                }
+            self._acc_cache[url] = (score, now + ACCESSIBILITY_CACHE_TTL)
+            return score
 
         except asyncio.TimeoutError:
             logger.warning(f"Timeout checking {url}")
@@ -179,9 +326,23 @@ class FactualChecker:
                     # Only fetch text content
                     content_type = response.headers.get("Content-Type", "")
                     if "text/html" in content_type or "text/plain" in content_type:
-                        text = await response.text()
-                        # Limit to first 50KB to avoid memory issues
-                        return text[:50000]
+                        length = int(response.headers.get("Content-Length") or 0)
+                        if length > MAX_SOURCE_CONTENT_LENGTH:
+                            return None
+
+                        # Stream only the first 50KB to avoid memory issues;
+                        # read() returns what is buffered, so keep reading
+                        # until the limit or EOF
+                        chunks = []
+                        remaining = SOURCE_READ_LIMIT
+                        while remaining > 0:
+                            chunk = await response.content.read(remaining)
+                            if not chunk:
+                                break
+                            chunks.append(chunk)
+                            remaining -= len(chunk)
+                        raw = b"".join(chunks)
+                        return raw.decode(response.charset or "utf-8", errors="replace")
 
             return None
 
@@ -193,8 +354,8 @@ class FactualChecker:
         """Check if summary is consistent with source content."""
         try:
             # Clean source content (remove HTML tags)
-            clean_source = re.sub(r"<[^>]+>", " ", source_content)
-            clean_source = re.sub(r"\s+", " ", clean_source).lower()
+            clean_source = _TAG_RE.sub(" ", source_content)
+            clean_source = _WS_RE.sub(" ", clean_source).lower()
 
             summary_lower = summary.lower()
 
@@ -213,7 +374,7 @@ class FactualChecker:
                 return 0.7  # Neutral if no phrases to check
 
             # Check how many key phrases appear in source
-            matches = sum(1 for phrase in key_phrases if phrase in clean_source)
+            matches = _count_phrases_present(key_phrases, clean_source)
 
             consistency_ratio = matches / len(key_phrases)
 
@@ -231,7 +392,7 @@ class FactualChecker:
         parsed = urlparse(url)
         domain = parsed.netloc.lower().replace("www.", "")
 
-        is_trusted = any(trusted in domain for trusted in self.trusted_sources)
+        is_trusted = _matches_domain(domain.split(":")[0], self._trusted)
         is_academic = domain.endswith((".edu", ".gov", ".ac.uk"))
 
         return {
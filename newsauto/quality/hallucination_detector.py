@@ -4,12 +4,20 @@ Hallucination Detection for LLM-generated content.
 Detects when LLM summaries contain information not present in source material.
 """
 
+import asyncio
 import logging
 import re
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Runs of 1-3 capitalized words, first word at least 3 chars
+_ENTITY_RE = re.compile(r"\b[A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+){0,2}\b")
+
+# Percentages (45%, 3.5%), currency ($1,000, $5.50), then plain numbers
+# (42, 3.14, 2024), tried in that order at each position
+_NUMBER_RE = re.compile(r"\d+\.?\d*%|\$\d+(?:,\d{3})*(?:\.\d{2})?|\d+\.?\d*")
+
 
 class HallucinationDetector:
     """Detects hallucinations in LLM-generated summaries."""
@@ -31,6 +39,13 @@ class HallucinationDetector:
         # Compile patterns
         self.patterns = [re.compile(p, re.IGNORECASE) for p in self.hallucination_indicators]
 
+        # Derived data for the most recent source, reused while the same
+        # source object is checked against several summaries
+        self._last_src: Optional[str] = None
+        self._last_src_lower: Optional[str] = None
+        self._last_src_entities: Set[str] = set()
+        self._last_src_numbers: Set[str] = set()
+
     async def check(self, summary: str, source_content: str) -> float:
         """
         Check summary for hallucinations against source content.
@@ -48,13 +63,15 @@ class HallucinationDetector:
 
             # Convert to lowercase for comparison
             summary_lower = summary.lower()
-            source_lower = source_content.lower()
+            source_lower, source_entities, source_numbers = self._source_features(
+                source_content
+            )
 
             # Score components
             scores = []
 
             # 1. Entity overlap check
-            entity_score = self._check_entity_overlap(summary_lower, source_lower)
+            entity_score = self._check_entity_overlap(summary_lower, source_entities)
             scores.append(entity_score * 0.4)  # 40% weight
 
             # 2. Fact pattern check
@@ -62,16 +79,20 @@ class HallucinationDetector:
             scores.append(fact_score * 0.35)  # 35% weight
 
             # 3. Numeric consistency check
-            numeric_score = self._check_numeric_consistency(summary_lower, source_lower)
+            numeric_score = self._check_numeric_consistency(
+                summary_lower, source_numbers
+            )
             scores.append(numeric_score * 0.25)  # 25% weight
 
             # Aggregate score
             final_score = sum(scores)
 
             logger.debug(
-                f"Hallucination check: entity={entity_score:.2f}, "
-                f"fact={fact_score:.2f}, numeric={numeric_score:.2f}, "
-                f"final={final_score:.2f}"
+                "Hallucination check: entity=%.2f, fact=%.2f, numeric=%.2f, final=%.2f",
+                entity_score,
+                fact_score,
+                numeric_score,
+                final_score,
             )
 
             return round(final_score, 3)
@@ -80,11 +101,49 @@ class HallucinationDetector:
             logger.error(f"Error in hallucination detection: {e}")
             return 0.5  # Neutral score on error
 
-    def _check_entity_overlap(self, summary: str, source: str) -> float:
-        """Check if summary entities appear in source."""
+    async def check_batch(
+        self, items: List[Tuple[str, str]], concurrency: int = 16
+    ) -> List[Union[float, BaseException]]:
+        """
+        Check many (summary, source_content) pairs concurrently.
+
+        Args:
+            items: (summary, source_content) pairs
+            concurrency: Maximum checks in flight at once
+
+        Returns:
+            Scores in input order (exceptions returned in place)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(summary: str, source_content: str) -> float:
+            async with semaphore:
+                return await self.check(summary, source_content)
+
+        return await asyncio.gather(
+            *[_one(summary, source) for summary, source in items],
+            return_exceptions=True,
+        )
+
+    def _source_features(self, source_content: str) -> Tuple[str, Set[str], Set[str]]:
+        """Get the lowercased source with its entities and numbers.
+
+        Results are kept for the last source object seen, so scoring several
+        candidate summaries against one article only processes it once.
+        """
+        if source_content is not self._last_src:
+            source_lower = source_content.lower()
+            self._last_src_lower = source_lower
+            self._last_src_entities = self._extract_entities(source_lower)
+            self._last_src_numbers = self._extract_numbers(source_lower)
+            self._last_src = source_content
+
+        return self._last_src_lower, self._last_src_entities, self._last_src_numbers
+
+    def _check_entity_overlap(self, summary: str, source_entities: Set[str]) -> float:
+        """Check if summary entities appear in the source's entities."""
         # Extract potential entities (capitalized words/phrases)
-        summary_entities = set(self._extract_entities(summary))
-        source_entities = set(self._extract_entities(source))
+        summary_entities = self._extract_entities(summary)
 
         if not summary_entities:
             return 1.0  # No entities to check
@@ -95,42 +154,35 @@ class HallucinationDetector:
 
         return overlap_ratio
 
-    def _extract_entities(self, text: str) -> List[str]:
-        """Extract entity-like patterns from text."""
-        # Simple entity extraction (capitalized words of 3+ chars)
-        entities = []
-
-        # Find capitalized words
-        words = text.split()
-        for word in words:
-            # Remove punctuation
-            cleaned = re.sub(r"[^\w\s]", "", word)
-            if len(cleaned) >= 3 and cleaned[0].isupper():
-                entities.append(cleaned.lower())
-
-        # Also extract multi-word entities (2-3 consecutive capitalized words)
-        pattern = r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b"
-        multi_word = re.findall(pattern, text)
-        entities.extend([e.lower() for e in multi_word])
+    def _extract_entities(self, text: str) -> Set[str]:
+        """Extract entity-like patterns from text.
 
+        Capitalized words of 3+ chars, plus the runs of up to 3 words they
+        form, all collected from a single scan.
+        """
+        entities = set()
+        for match in _ENTITY_RE.finditer(text):
+            run = match.group(0).lower()
+            entities.add(run)
+            words = run.split()
+            if len(words) > 1:
+                entities.update(word for word in words if len(word) >= 3)
         return entities
 
     def _check_fact_patterns(self, summary: str, source: str) -> float:
-        """Check if factual claims in summary are supported by source."""
-        hallucination_count = 0
-        total_patterns = 0
-
-        for pattern in self.patterns:
-            # Find matches in summary
-            summary_matches = pattern.findall(summary)
-            total_patterns += len(summary_matches)
-
-            for match in summary_matches:
-                # Check if similar pattern exists in source
-                # Allow for some variation
-                match_escaped = re.escape(match[:20])  # First 20 chars
-                if not re.search(match_escaped, source, re.IGNORECASE):
-                    hallucination_count += 1
+        """Check if factual claims in summary are supported by source.
+
+        Expects a lowercased source, as passed by check().
+        """
+        # Find matches in summary
+        summary_matches = self._find_claims(summary)
+        total_patterns = len(summary_matches)
+
+        # Check if similar pattern exists in source
+        # Allow for some variation: compare the first 20 chars only
+        hallucination_count = sum(
+            1 for match in summary_matches if match[:20].lower() not in source
+        )
 
         if total_patterns == 0:
             return 1.0  # No factual patterns to check
@@ -139,11 +191,22 @@ class HallucinationDetector:
         score = 1.0 - (hallucination_count / total_patterns)
         return max(0.0, min(1.0, score))
 
-    def _check_numeric_consistency(self, summary: str, source: str) -> float:
-        """Check if numbers in summary match source."""
-        # Extract numbers from both texts
+    def _find_claims(self, summary: str) -> List[str]:
+        """Find factual-claim pattern matches in a summary.
+
+        Each pattern is searched separately; indicators can overlap (as in
+        "increased by 45% of"), and a single alternation would only report
+        the first of them.
+        """
+        return [
+            match for pattern in self.patterns for match in pattern.findall(summary)
+        ]
+
+    def _check_numeric_consistency(
+        self, summary: str, source_numbers: Set[str]
+    ) -> float:
+        """Check if numbers in summary match the source's numbers."""
         summary_numbers = self._extract_numbers(summary)
-        source_numbers = self._extract_numbers(source)
 
         if not summary_numbers:
             return 1.0  # No numbers to check
@@ -156,20 +219,8 @@ class HallucinationDetector:
 
     def _extract_numbers(self, text: str) -> Set[str]:
         """Extract numbers from text."""
-        # Match integers, decimals, percentages, currency
-        patterns = [
-            r"\d+\.?\d*%",  # Percentages: 45%, 3.5%
-            r"\$\d+(?:,\d{3})*(?:\.\d{2})?",  # Currency: $1,000, $5.50
-            r"\d{4}",  # Years: 2024
-            r"\d+\.?\d*",  # General numbers: 42, 3.14
-        ]
-
-        numbers = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            numbers.update(matches)
-
-        return numbers
+        # Match percentages, currency and general numbers (incl. years)
+        return set(_NUMBER_RE.findall(text))
 
     def get_detailed_analysis(self, summary: str, source_content: str) -> Dict:
         """
@@ -179,19 +230,20 @@ class HallucinationDetector:
             Dict with detailed scores and flagged content
         """
         summary_lower = summary.lower()
-        source_lower = source_content.lower()
+        source_lower, source_entities, source_numbers = self._source_features(
+            source_content
+        )
 
-        entity_score = self._check_entity_overlap(summary_lower, source_lower)
+        entity_score = self._check_entity_overlap(summary_lower, source_entities)
         fact_score = self._check_fact_patterns(summary_lower, source_lower)
-        numeric_score = self._check_numeric_consistency(summary_lower, source_lower)
+        numeric_score = self._check_numeric_consistency(summary_lower, source_numbers)
 
         # Find specific hallucinated content
-        flagged_patterns = []
-        for pattern in self.patterns:
-            matches = pattern.findall(summary)
-            for match in matches:
-                if match[:20] not in source_lower:
-                    flagged_patterns.append(match)
+        flagged_patterns = [
+            match
+            for match in self._find_claims(summary)
+            if match[:20] not in source_lower
+        ]
 
         return {
             "overall_score": round(entity_score * 0.4 + fact_score * 0.35 + numeric_score * 0.25, 3),
@@ -6,10 +6,53 @@ Detects sentiment bias in generated content to ensure neutral, professional tone
 
 import logging
 import re
-from typing import Dict
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, fall back to token-by-token lookups
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Lexicon classes for SentimentAnalyzer._lexicon
+_POSITIVE = 1
+_NEGATIVE = -1
+_INTENSIFIER = 2
+
+# Characters stripped from each token before lexicon lookups
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def _strip_non_word(token: str) -> str:
+    """Delete every non-word character from a token.
+
+    Most tokens are plain words, which isalnum() confirms without running
+    the regex: it accepts exactly the word characters other than "_".
+    """
+    if token.isalnum():
+        return token
+    return _NON_WORD_RE.sub("", token)
+
+
+# Classification bands: a score at or above _CLASS_THRESHOLDS[i] gets a
+# label past _CLASS_LABELS[i]
+_CLASS_THRESHOLDS = (-0.5, -0.2, 0.2, 0.5)
+_CLASS_LABELS = ("very_negative", "negative", "neutral", "positive", "very_positive")
+
+# Punctuation and capitalization patterns that break a professional tone
+_UNPROFESSIONAL_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
+        r"!\s*!+",  # Multiple exclamation marks
+        r"\?!",  # Interrobang
+        r"[A-Z]{3,}",  # SHOUTING
+        r"!!+",  # Excessive excitement
+        r"\.\.\.+",  # Trailing ellipsis
+    )
+)
+
 
 class SentimentAnalyzer:
     """Analyzes sentiment of generated content."""
@@ -73,6 +116,30 @@ class SentimentAnalyzer:
             "completely",
         }
 
+        # Word -> lexicon class, so each token is hashed once per lookup
+        self._lexicon: Dict[str, int] = {
+            **{w: _INTENSIFIER for w in self.intensifiers},
+            **{w: _NEGATIVE for w in self.negative_words},
+            **{w: _POSITIVE for w in self.positive_words},
+        }
+        self._automaton = self._build_automaton()
+
+    def _build_automaton(self):
+        """Build an Aho-Corasick automaton over the sentiment words.
+
+        Returns:
+            The automaton, or None when pyahocorasick is not installed
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for word, kind in self._lexicon.items():
+            if kind != _INTENSIFIER:
+                automaton.add_word(word, (word, kind))
+        automaton.make_automaton()
+        return automaton
+
     async def analyze(self, text: str) -> float:
         """
         Analyze sentiment of text.
@@ -84,15 +151,16 @@ class SentimentAnalyzer:
             Score from -1.0 (very negative) to +1.0 (very positive)
             Target range for newsletter content: -0.2 to +0.2 (neutral)
         """
+        return self._analyze_sync(text)
+
+    def _analyze_sync(self, text: str) -> float:
+        """Synchronous body of analyze(), for callers outside an event loop."""
         try:
             if not text:
                 return 0.0  # Neutral
 
-            text_lower = text.lower()
-
             # Count positive and negative words
-            positive_count = self._count_sentiment_words(text_lower, self.positive_words)
-            negative_count = self._count_sentiment_words(text_lower, self.negative_words)
+            positive_count, negative_count = self._count_sentiment(text)
 
             # Total sentiment-bearing words
             total_sentiment = positive_count + negative_count
@@ -118,26 +186,119 @@ class SentimentAnalyzer:
             logger.error(f"Error in sentiment analysis: {e}")
             return 0.0  # Neutral on error
 
-    def _count_sentiment_words(self, text: str, word_set: set) -> float:
-        """Count sentiment words with intensity weighting."""
-        count = 0.0
-        words = text.split()
+    def _count_sentiment(
+        self,
+        text: str,
+        positive_found: Optional[List[str]] = None,
+        negative_found: Optional[List[str]] = None,
+    ) -> Tuple[float, float]:
+        """Count weighted positive and negative words in text.
 
-        for i, word in enumerate(words):
-            # Clean word
-            cleaned = re.sub(r"[^\w]", "", word)
+        Scans with the Aho-Corasick automaton when available, otherwise
+        tokenizes the whole text.
+        """
+        if self._automaton is not None:
+            return self._count_with_automaton(
+                text.lower(), positive_found, negative_found
+            )
+        return self._count_sentiment_words(
+            self._tokenize(text), positive_found, negative_found
+        )
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Split lowercased text into words with punctuation stripped.
+
+        Punctuation-only tokens are kept as empty strings, so they still
+        separate an intensifier from the word after it.
+        """
+        return [_strip_non_word(word) for word in text.lower().split()]
+
+    def _count_sentiment_words(
+        self,
+        words: List[str],
+        positive_found: Optional[List[str]] = None,
+        negative_found: Optional[List[str]] = None,
+    ) -> Tuple[float, float]:
+        """Count positive and negative words with intensity weighting.
 
-            if cleaned in word_set:
-                # Check for intensifier in previous word
-                intensity = 1.0
-                if i > 0:
-                    prev_word = re.sub(r"[^\w]", "", words[i - 1])
-                    if prev_word in self.intensifiers:
-                        intensity = 1.5
+        Args:
+            words: Tokens from _tokenize
+            positive_found: Optional list to collect positive words into
+            negative_found: Optional list to collect negative words into
 
-                count += intensity
+        Returns:
+            (positive_count, negative_count)
+        """
+        positive = negative = 0.0
+        prev_intensifier = False
+        lexicon = self._lexicon
+
+        for word in words:
+            kind = lexicon.get(word)
+
+            if kind == _POSITIVE:
+                # Words after an intensifier count 1.5x
+                positive += 1.5 if prev_intensifier else 1.0
+                if positive_found is not None:
+                    positive_found.append(word)
+            elif kind == _NEGATIVE:
+                negative += 1.5 if prev_intensifier else 1.0
+                if negative_found is not None:
+                    negative_found.append(word)
+
+            prev_intensifier = kind == _INTENSIFIER
+
+        return positive, negative
+
+    def _count_with_automaton(
+        self,
+        text: str,
+        positive_found: Optional[List[str]] = None,
+        negative_found: Optional[List[str]] = None,
+    ) -> Tuple[float, float]:
+        """Count sentiment words found by one automaton pass over lowercased text.
+
+        A hit only counts when its whitespace-delimited token, with
+        punctuation stripped, is exactly the word, so results agree with
+        _count_sentiment_words. Only hits are inspected in Python; the rest
+        of the text is never tokenized.
+        """
+        positive = negative = 0.0
+        lexicon = self._lexicon
+        length = len(text)
+
+        for end, (word, kind) in self._automaton.iter(text):
+            # Expand the hit to its enclosing token
+            start = end - len(word) + 1
+            while start > 0 and not text[start - 1].isspace():
+                start -= 1
+            stop = end + 1
+            while stop < length and not text[stop].isspace():
+                stop += 1
+            if _strip_non_word(text[start:stop]) != word:
+                continue
+
+            # Find the previous token and check for an intensifier
+            prev_stop = start
+            while prev_stop > 0 and text[prev_stop - 1].isspace():
+                prev_stop -= 1
+            prev_start = prev_stop
+            while prev_start > 0 and not text[prev_start - 1].isspace():
+                prev_start -= 1
+            prev_word = _strip_non_word(text[prev_start:prev_stop])
+            intensity = 1.5 if lexicon.get(prev_word) == _INTENSIFIER else 1.0
+
+            if kind == _POSITIVE:
+                positive += intensity
+                if positive_found is not None:
+                    positive_found.append(word)
+            else:
+                negative += intensity
+                if negative_found is not None:
+                    negative_found.append(word)
 
-        return count
+        return positive, negative
 
     def get_detailed_analysis(self, text: str) -> Dict:
         """
@@ -146,26 +307,20 @@ class SentimentAnalyzer:
         Returns:
             Dict with sentiment breakdown
         """
-        text_lower = text.lower()
-
-        positive_count = self._count_sentiment_words(text_lower, self.positive_words)
-        negative_count = self._count_sentiment_words(text_lower, self.negative_words)
+        positive_words_found: List[str] = []
+        negative_words_found: List[str] = []
+        positive_count, negative_count = self._count_sentiment(
+            text, positive_words_found, negative_words_found
+        )
 
         total_sentiment = positive_count + negative_count
         net_sentiment = (
-            (positive_count - negative_count) / total_sentiment if total_sentiment > 0 else 0
+            (positive_count - negative_count) / total_sentiment
+            if total_sentiment > 0
+            else 0
         )
         sentiment_score = net_sentiment * (1 - abs(net_sentiment) * 0.3)
 
-        # Find specific sentiment words used
-        words = text_lower.split()
-        positive_words_found = [
-            w for w in words if re.sub(r"[^\w]", "", w) in self.positive_words
-        ]
-        negative_words_found = [
-            w for w in words if re.sub(r"[^\w]", "", w) in self.negative_words
-        ]
-
         return {
             "sentiment_score": round(sentiment_score, 3),
             "positive_count": int(positive_count),
@@ -179,16 +334,7 @@ class SentimentAnalyzer:
 
     def _classify_sentiment(self, score: float) -> str:
         """Classify sentiment from score."""
-        if score >= 0.5:
-            return "very_positive"
-        elif score >= 0.2:
-            return "positive"
-        elif score >= -0.2:
-            return "neutral"
-        elif score >= -0.5:
-            return "negative"
-        else:
-            return "very_negative"
+        return _CLASS_LABELS[bisect_right(_CLASS_THRESHOLDS, score)]
 
     def check_professional_tone(self, text: str) -> Dict:
         """
@@ -197,25 +343,18 @@ class SentimentAnalyzer:
         Returns:
             Dict with tone analysis
         """
-        sentiment_score = asyncio.run(self.analyze(text))
+        sentiment_score = self._analyze_sync(text)
 
         # Professional tone should be neutral (-0.3 to +0.3)
         is_professional = abs(sentiment_score) < 0.3
 
         # Check for unprofessional patterns
-        unprofessional_patterns = [
-            r"!\s*!+",  # Multiple exclamation marks
-            r"\?!",  # Interrobang
-            r"[A-Z]{3,}",  # SHOUTING
-            r"!!+",  # Excessive excitement
-            r"\.\.\.+",  # Trailing ellipsis
+        issues = [
+            pattern.pattern
+            for pattern in _UNPROFESSIONAL_PATTERNS
+            if pattern.search(text)
         ]
 
-        issues = []
-        for pattern in unprofessional_patterns:
-            if re.search(pattern, text):
-                issues.append(pattern)
-
         return {
             "is_professional": is_professional and len(issues) == 0,
             "sentiment_score": sentiment_score,
@@ -234,7 +373,3 @@ class SentimentAnalyzer:
             return "Avoid excessive punctuation and capitalization for professional tone."
         else:
             return "Tone is appropriate and professional."
-
-
-# Import asyncio for the check_professional_tone method
-import asyncio
@@ -2,32 +2,87 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import event, inspect, update
 from sqlalchemy.orm import Session
 
 from newsauto.core.database import get_db
 from newsauto.models.content import ContentItem, ContentSource, ContentSourceType
+from newsauto.scrapers.base import BaseScraper
 from newsauto.scrapers.devto import DevToScraper
 from newsauto.scrapers.github import GitHubTrendingScraper
 from newsauto.scrapers.hackernews import HackerNewsScraper
 from newsauto.scrapers.reddit import RedditScraper
 from newsauto.scrapers.rss import RSSFetcher
 
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # Optional speedup for large batches, compare every title
+    MinHash = MinHashLSH = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds a cached list of candidate source IDs stays valid
+SOURCE_CACHE_TTL = 60.0
+
+# Bumped whenever the set of active sources may have changed
+_source_list_version = 0
+
+
+def _invalidate_source_lists() -> None:
+    """Invalidate every aggregator's cached source ID lists."""
+    global _source_list_version
+    _source_list_version += 1
+
+
+@event.listens_for(ContentSource, "after_insert")
+@event.listens_for(ContentSource, "after_delete")
+def _on_source_added_or_removed(mapper, connection, target):
+    _invalidate_source_lists()
+
+
+@event.listens_for(ContentSource, "after_update")
+def _on_source_updated(mapper, connection, target):
+    # Fetch bookkeeping (last_fetched, error_count) does not affect the lists
+    attrs = inspect(target).attrs
+    if attrs.active.history.has_changes() or attrs.newsletter_id.history.has_changes():
+        _invalidate_source_lists()
+
+
+# Batches at least this large are deduplicated with MinHash LSH candidates
+# (when datasketch is installed) rather than exact all-pairs comparison
+DEDUP_LSH_MIN_ITEMS = 1000
+
+# MinHash settings for title deduplication
+_DEDUP_NUM_PERM = 64
+_DEDUP_SHINGLE = 3
+
+
+def _title_minhash(title: str) -> "MinHash":
+    """Build a MinHash over a title's character shingles."""
+    minhash = MinHash(num_perm=_DEDUP_NUM_PERM)
+    for i in range(max(1, len(title) - _DEDUP_SHINGLE + 1)):
+        minhash.update(title[i : i + _DEDUP_SHINGLE].encode())
+    return minhash
+
 
 class ContentAggregator:
     """Aggregates content from multiple sources."""
 
-    def __init__(self, db: Session = None):
+    def __init__(self, db: Session = None, max_concurrency: Optional[int] = None):
         """Initialize content aggregator.
 
         Args:
             db: Database session
+            max_concurrency: Maximum sources fetched at once, defaults to
+                min(32, number of sources)
         """
         self.db = db or next(get_db())
+        self.max_concurrency = max_concurrency
         self.scrapers = {
             ContentSourceType.RSS: RSSFetcher,
             ContentSourceType.REDDIT: RedditScraper,
@@ -37,6 +92,10 @@ class ContentAggregator:
         }
         self.results = {}
         self.errors = {}
+        # Scrapers reused across fetches, keyed by source ID
+        self._scraper_cache: Dict[int, BaseScraper] = {}
+        # (newsletter_id, source_ids) -> (expiry, list version, source IDs)
+        self._source_cache: Dict[tuple, Tuple[float, int, Tuple[int, ...]]] = {}
 
     async def fetch_all(
         self,
@@ -63,13 +122,17 @@ class ContentAggregator:
 
         logger.info(f"Fetching content from {len(sources)} sources")
 
-        # Fetch from each source concurrently
-        tasks = []
-        for source in sources:
-            task = self._fetch_source(source)
-            tasks.append(task)
+        # Fetch from each source concurrently, bounded to avoid
+        # connection storms against remote rate limits
+        semaphore = asyncio.Semaphore(self.max_concurrency or min(32, len(sources)))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def _bounded(source: ContentSource) -> List[ContentItem]:
+            async with semaphore:
+                return await self._fetch_source(source)
+
+        results = await asyncio.gather(
+            *[_bounded(source) for source in sources], return_exceptions=True
+        )
 
         # Process results
         total_items = 0
@@ -107,7 +170,43 @@ class ContentAggregator:
         Returns:
             List of content sources
         """
-        query = self.db.query(ContentSource).filter(ContentSource.active)
+        ids = self._get_source_ids(newsletter_id, source_ids)
+        if not ids:
+            return []
+
+        # Re-check active in case a source was deactivated by a bulk update,
+        # which does not fire the invalidation events
+        query = self.db.query(ContentSource).filter(
+            ContentSource.id.in_(ids), ContentSource.active
+        )
+
+        # Filter by fetch frequency unless forced
+        if not force:
+            query = query.filter(ContentSource.needs_fetch)
+
+        return query.all()
+
+    def _get_source_ids(
+        self, newsletter_id: Optional[int], source_ids: Optional[List[int]]
+    ) -> Tuple[int, ...]:
+        """Get IDs of active sources matching the filters, cached briefly.
+
+        Args:
+            newsletter_id: Filter by newsletter
+            source_ids: Specific source IDs
+
+        Returns:
+            Matching source IDs
+        """
+        key = (newsletter_id, tuple(source_ids) if source_ids else None)
+        now = time.monotonic()
+
+        cached = self._source_cache.get(key)
+        if cached and now < cached[0] and cached[1] == _source_list_version:
+            return cached[2]
+
+        version = _source_list_version
+        query = self.db.query(ContentSource.id).filter(ContentSource.active)
 
         if newsletter_id:
             query = query.filter(ContentSource.newsletter_id == newsletter_id)
@@ -115,13 +214,9 @@ class ContentAggregator:
         if source_ids:
             query = query.filter(ContentSource.id.in_(source_ids))
 
-        sources = query.all()
-
-        # Filter by fetch frequency unless forced
-        if not force:
-            sources = [s for s in sources if s.needs_fetch]
-
-        return sources
+        ids = tuple(source_id for (source_id,) in query)
+        self._source_cache[key] = (now + SOURCE_CACHE_TTL, version, ids)
+        return ids
 
     async def _fetch_source(self, source: ContentSource) -> List[ContentItem]:
         """Fetch content from a single source.
@@ -138,8 +233,14 @@ class ContentAggregator:
             if not scraper_class:
                 raise ValueError(f"No scraper available for type {source.type}")
 
-            # Initialize scraper
-            scraper = scraper_class(source, self.db)
+            # Reuse the source's scraper so client setup happens once
+            scraper = self._scraper_cache.get(source.id)
+            if type(scraper) is not scraper_class:
+                scraper = scraper_class(source, self.db)
+                self._scraper_cache[source.id] = scraper
+            else:
+                # Pick up config changes on the freshly loaded source
+                scraper.source = source
 
             # Fetch content
             items = await scraper.fetch()
@@ -175,10 +276,17 @@ class ContentAggregator:
 
             router = ModelRouter()
 
-            # Get unprocessed items
+            # Get unprocessed items as plain rows, so per-batch commits
+            # have no ORM instances to expire and reload
             unprocessed = (
-                self.db.query(ContentItem)
-                .filter(ContentItem.processed_at is None)
+                self.db.query(
+                    ContentItem.id,
+                    ContentItem.content,
+                    ContentItem.title,
+                    ContentItem.url,
+                    ContentItem.score,
+                )
+                .filter(ContentItem.processed_at.is_(None))
                 .limit(100)
                 .all()
             )
@@ -195,31 +303,37 @@ class ContentAggregator:
                 # Prepare batch for processing
                 batch_data = [
                     {
-                        "content": item.content,
-                        "title": item.title,
-                        "url": item.url,
-                        "id": item.id,
+                        "content": row.content,
+                        "title": row.title,
+                        "url": row.url,
+                        "id": row.id,
                     }
-                    for item in batch
+                    for row in batch
                 ]
 
                 # Process batch
                 results = router.batch_process(batch_data, batch_size=batch_size)
 
-                # Update items with results
+                # Update items with results, by primary key
+                updates = []
                 for j, result in enumerate(results):
                     if result and "summary" in result:
-                        item = batch[j]
-                        item.summary = result["summary"]
-                        item.key_points = result.get("key_points", [])
-                        item.processed_at = datetime.utcnow()
-                        item.llm_model = result.get("model_used", "unknown")
-
-                        # Update score if provided
-                        if "score" in result:
-                            item.score = result["score"]
-
-                        processed_count += 1
+                        row = batch[j]
+                        updates.append(
+                            {
+                                "id": row.id,
+                                "summary": result["summary"],
+                                "key_points": result.get("key_points", []),
+                                "processed_at": datetime.utcnow(),
+                                "llm_model": result.get("model_used", "unknown"),
+                                # Update score if provided
+                                "score": result.get("score", row.score),
+                            }
+                        )
+
+                if updates:
+                    self.db.execute(update(ContentItem), updates)
+                    processed_count += len(updates)
 
                 self.db.commit()
 
@@ -266,48 +380,78 @@ class ContentAggregator:
         return query.limit(limit).all()
 
     def deduplicate_content(
-        self, items: List[ContentItem], similarity_threshold: float = 0.8
+        self,
+        items: List[ContentItem],
+        similarity_threshold: float = 0.8,
+        use_lsh: Optional[bool] = None,
     ) -> List[ContentItem]:
         """Remove duplicate content items.
 
         Args:
             items: List of content items
             similarity_threshold: Similarity threshold for duplicates
+            use_lsh: Only compare titles that MinHash LSH finds similar.
+                This is much faster on large batches, but may miss a
+                duplicate that exact comparison would catch. Defaults to
+                batches of at least DEDUP_LSH_MIN_ITEMS items. It is
+                ignored when datasketch is not installed.
 
         Returns:
             Deduplicated list
         """
-        from difflib import SequenceMatcher
-
         if not items:
             return items
 
+        if use_lsh is None:
+            use_lsh = len(items) >= DEDUP_LSH_MIN_ITEMS
+
         # Sort by score (keep best version of duplicates)
         items = sorted(items, key=lambda x: x.score, reverse=True)
 
         unique_items = []
-        seen_titles = set()
         seen_urls = set()
+        # One matcher per kept title, with that title as the cached sequence
+        matchers: List[SequenceMatcher] = []
+
+        # With LSH, only titles sharing enough shingles are compared.
+        # The LSH threshold is much looser than similarity_threshold because
+        # it estimates shingle overlap, not the SequenceMatcher ratio.
+        lsh = None
+        if use_lsh and MinHashLSH is not None:
+            lsh = MinHashLSH(
+                threshold=similarity_threshold / 4, num_perm=_DEDUP_NUM_PERM
+            )
 
         for item in items:
             # Check exact URL match
             if item.url in seen_urls:
                 continue
 
-            # Check title similarity
+            title = item.title.lower()
+            if lsh is not None:
+                minhash = _title_minhash(title)
+                candidates: Any = (matchers[i] for i in lsh.query(minhash))
+            else:
+                candidates = matchers
+
+            # Check title similarity, using the cheap upper bounds first
             is_duplicate = False
-            for seen_title in seen_titles:
-                similarity = SequenceMatcher(
-                    None, item.title.lower(), seen_title
-                ).ratio()
-                if similarity > similarity_threshold:
+            for matcher in candidates:
+                matcher.set_seq1(title)
+                if (
+                    matcher.real_quick_ratio() > similarity_threshold
+                    and matcher.quick_ratio() > similarity_threshold
+                    and matcher.ratio() > similarity_threshold
+                ):
                     is_duplicate = True
                     break
 
             if not is_duplicate:
+                if lsh is not None:
+                    lsh.insert(len(matchers), minhash)
                 unique_items.append(item)
                 seen_urls.add(item.url)
-                seen_titles.add(item.title.lower())
+                matchers.append(SequenceMatcher(None, "", title))
 
         logger.info(f"Deduplicated {len(items)} items to {len(unique_items)}")
         return unique_items
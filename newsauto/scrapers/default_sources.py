@@ -1,5 +1,18 @@
 """Default high-quality content sources for newsletters."""
 
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Make nested dicts and lists read-only (mapping proxies and tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 DEFAULT_SOURCES = {
     "AI & Machine Learning": [
         {
@@ -172,15 +185,21 @@ DEFAULT_SOURCES = {
     ],
 }
 
+# Read-only, so callers cannot change the defaults through returned sources
+DEFAULT_SOURCES = _freeze(DEFAULT_SOURCES)
+
+# Category names with their lowercased form, for partial niche matching
+_LOWER_KEYS = tuple((key, key.lower()) for key in DEFAULT_SOURCES)
+
 
-def get_sources_for_niche(niche: str) -> list:
+def get_sources_for_niche(niche: str) -> Tuple[Mapping[str, Any], ...]:
     """Get recommended sources for a specific niche.
 
     Args:
         niche: Newsletter niche/category
 
     Returns:
-        List of source configurations
+        Read-only source configurations; copy a config before storing it
     """
     # Try exact match first
     if niche in DEFAULT_SOURCES:
@@ -188,9 +207,9 @@ def get_sources_for_niche(niche: str) -> list:
 
     # Try partial match
     niche_lower = niche.lower()
-    for key, sources in DEFAULT_SOURCES.items():
-        if niche_lower in key.lower() or key.lower() in niche_lower:
-            return sources
+    for key, key_lower in _LOWER_KEYS:
+        if niche_lower in key_lower or key_lower in niche_lower:
+            return DEFAULT_SOURCES[key]
 
     # Default to general tech if no match
-    return DEFAULT_SOURCES.get("General Tech", [])
+    return DEFAULT_SOURCES.get("General Tech", ())
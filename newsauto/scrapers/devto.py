@@ -1,20 +1,42 @@
 """Dev.to API scraper for high-quality technical articles."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
-from newsauto.scrapers.base import BaseScraper
+from newsauto.core.http import get_shared_client, request, response_json
+from newsauto.scrapers.base import BaseScraper, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
+# min_reactions above which listings are over-fetched to leave enough
+# articles after filtering; top articles nearly all clear lower thresholds
+OVERFETCH_MIN_REACTIONS = 5
+
+# Full-article requests in flight at once per fetch
+FULL_ARTICLE_CONCURRENCY = 8
+
+# Full articles by ID, most recently used last, with their expiry time.
+# Published articles rarely change, so runs within the TTL skip refetching.
+ARTICLE_CACHE_TTL = 3600.0
+ARTICLE_CACHE_SIZE = 512
+_article_cache: "OrderedDict[int, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
 
 class DevToScraper(BaseScraper):
     """Scraper for Dev.to articles using their public API."""
 
     BASE_URL = "https://dev.to/api"
+    HEADERS = {
+        "User-Agent": "Newsauto/1.0 (Newsletter Bot)",
+        "Accept": "application/json",
+    }
 
     async def fetch_raw(self) -> List[Dict[str, Any]]:
         """Fetch articles from Dev.to API.
@@ -31,52 +53,67 @@ class DevToScraper(BaseScraper):
         try:
             articles = []
 
-            # Fetch top articles
+            # Fetch top articles, with extra for filtering only when a
+            # meaningful share of them may fall below min_reactions
+            if min_reactions > OVERFETCH_MIN_REACTIONS:
+                per_page = min(limit * 2, 100)
+            else:
+                per_page = min(limit, 100)
             params = {
-                "per_page": min(limit * 2, 100),  # Fetch extra for filtering
+                "per_page": per_page,
                 "top": top_period,
             }
 
             if tag:
                 params["tag"] = tag
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/articles",
-                    params=params,
-                    headers={
-                        "User-Agent": "Newsauto/1.0 (Newsletter Bot)",
-                        "Accept": "application/json",
-                    },
-                    timeout=30,
-                )
-                response.raise_for_status()
-                articles = response.json()
+            # Shared client, so the listing, full-article fetches and later
+            # runs reuse keep-alive connections to dev.to
+            client = get_shared_client()
+            response = await request(
+                client,
+                "GET",
+                f"{self.BASE_URL}/articles",
+                params=params,
+                headers=self.HEADERS,
+            )
+            response.raise_for_status()
+            articles = response_json(response)
 
-            # Filter by minimum reactions
+            # Filter by minimum reactions, stopping once limit articles pass
             if min_reactions > 0:
-                articles = [
+                articles = (
                     a
                     for a in articles
                     if a.get("public_reactions_count", 0) >= min_reactions
-                ]
-
-            # Limit results
-            articles = articles[:limit]
+                )
+            articles = list(islice(articles, limit))
 
             # Fetch full content for top articles
             if config.get("fetch_full_content", True):
+                semaphore = asyncio.Semaphore(FULL_ARTICLE_CONCURRENCY)
+
+                async def fetch_one(article: Dict[str, Any]) -> Dict[str, Any]:
+                    async with semaphore:
+                        full_article = await self._fetch_full_article(
+                            client, article["id"]
+                        )
+                    return full_article or article
+
+                # Limit full fetch to top 10, fetched concurrently
+                top_articles = articles[:10]
+                results = await asyncio.gather(
+                    *(fetch_one(article) for article in top_articles),
+                    return_exceptions=True,
+                )
+
                 full_articles = []
-                for article in articles[:10]:  # Limit full fetch to top 10
-                    try:
-                        full_article = await self._fetch_full_article(article["id"])
-                        if full_article:
-                            full_articles.append(full_article)
-                        else:
-                            full_articles.append(article)
-                    except Exception as e:
-                        logger.warning(f"Could not fetch full article: {e}")
+                for article, result in zip(top_articles, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Could not fetch full article: {result}")
                         full_articles.append(article)
+                    else:
+                        full_articles.append(result)
 
                 # Add remaining articles without full content
                 full_articles.extend(articles[10:])
@@ -91,28 +128,44 @@ class DevToScraper(BaseScraper):
             logger.error(f"Error fetching Dev.to articles: {e}")
             raise
 
-    async def _fetch_full_article(self, article_id: int) -> Optional[Dict[str, Any]]:
+    async def _fetch_full_article(
+        self, client: httpx.AsyncClient, article_id: int
+    ) -> Optional[Dict[str, Any]]:
         """Fetch full article content.
 
         Args:
+            client: Shared HTTP client
             article_id: Dev.to article ID
 
         Returns:
             Full article data
         """
+        cached = _article_cache.get(article_id)
+        if cached is not None:
+            article, expires = cached
+            if expires > time.monotonic():
+                _article_cache.move_to_end(article_id)
+                return article
+            del _article_cache[article_id]
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/articles/{article_id}",
-                    headers={
-                        "User-Agent": "Newsauto/1.0",
-                        "Accept": "application/json",
-                    },
-                    timeout=10,
-                )
+            response = await request(
+                client,
+                "GET",
+                f"{self.BASE_URL}/articles/{article_id}",
+                headers=self.HEADERS,
+                timeout=10,
+            )
 
-                if response.status_code == 200:
-                    return response.json()
+            if response.status_code == 200:
+                article = response_json(response)
+                _article_cache[article_id] = (
+                    article,
+                    time.monotonic() + ARTICLE_CACHE_TTL,
+                )
+                if len(_article_cache) > ARTICLE_CACHE_SIZE:
+                    _article_cache.popitem(last=False)
+                return article
 
         except Exception as e:
             logger.debug(f"Could not fetch full article {article_id}: {e}")
@@ -129,21 +182,31 @@ class DevToScraper(BaseScraper):
             Parsed content item
         """
         try:
+            # Bound once, as every field below is read from the article
+            get = article.get
+
             # Extract basic fields
-            title = article.get("title", "").strip()
-            url = article.get("url", "").strip()
+            title = get("title", "").strip()
+            url = get("url", "").strip()
 
             if not title or not url:
                 return None
 
             # Extract author information
-            user = article.get("user", {})
+            user = get("user", {})
             author = user.get("name", user.get("username", ""))
 
+            tags = get("tag_list", [])
+            reading_time = get("reading_time_minutes")
+            reactions = get("public_reactions_count", 0)
+            comments = get("comments_count", 0)
+            org = get("organization")
+
             # Get content (body_markdown for full articles, description for listings)
-            content = article.get("body_markdown", "")
+            content = get("body_markdown", "")
+            full_text = bool(content)
             if not content:
-                content = article.get("description", "")
+                content = get("description", "")
 
             # Add metadata to content
             if content:
@@ -151,53 +214,49 @@ class DevToScraper(BaseScraper):
                 meta_parts = []
 
                 # Tags
-                tags = article.get("tag_list", [])
                 if tags:
                     meta_parts.append(f"**Tags**: {', '.join(tags)}")
 
                 # Reading time
-                reading_time = article.get("reading_time_minutes")
                 if reading_time:
                     meta_parts.append(f"**Reading time**: {reading_time} minutes")
 
                 # Reactions and comments
-                reactions = article.get("public_reactions_count", 0)
-                comments = article.get("comments_count", 0)
                 meta_parts.append(
                     f"**Reactions**: {reactions} | **Comments**: {comments}"
                 )
 
                 # Organization
-                org = article.get("organization")
                 if org:
                     meta_parts.append(f"**Organization**: {org.get('name', '')}")
 
-                if meta_parts:
-                    content = "\n".join(meta_parts) + "\n\n---\n\n" + content
+                # Header, "---" rule and body joined into one string at once
+                meta_parts.extend(("", "---", "", content))
+                content = "\n".join(meta_parts)
 
             # Parse published date
             published_at = None
-            if article.get("published_at"):
+            published_raw = get("published_at")
+            if published_raw:
                 try:
-                    published_at = datetime.fromisoformat(
-                        article["published_at"].replace("Z", "+00:00")
-                    )
-                except (ValueError, KeyError, AttributeError):
+                    published_at = parse_iso_datetime(published_raw)
+                except (ValueError, TypeError):
                     published_at = datetime.now()
 
             # Build metadata
             metadata = {
                 "source_type": "devto",
-                "tags": article.get("tag_list", []),
-                "reading_time_minutes": article.get("reading_time_minutes"),
-                "reactions_count": article.get("public_reactions_count", 0),
-                "comments_count": article.get("comments_count", 0),
-                "cover_image": article.get("cover_image"),
+                "full_text": full_text,
+                "tags": tags,
+                "reading_time_minutes": reading_time,
+                "reactions_count": reactions,
+                "comments_count": comments,
+                "cover_image": get("cover_image"),
             }
 
             # Add organization if present
-            if article.get("organization"):
-                metadata["organization"] = article["organization"].get("name")
+            if org:
+                metadata["organization"] = org.get("name")
 
             return {
                 "url": url,
@@ -207,8 +266,8 @@ class DevToScraper(BaseScraper):
                 "published_at": published_at,
                 "metadata": metadata,
                 # Use reactions as score indicator
-                "upvotes": article.get("public_reactions_count", 0),
-                "comment_count": article.get("comments_count", 0),
+                "upvotes": reactions,
+                "comment_count": comments,
             }
 
         except Exception as e:
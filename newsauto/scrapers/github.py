@@ -1,22 +1,49 @@
 """GitHub Trending scraper for high-value engineering content."""
 
+import asyncio
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from newsauto.scrapers.base import BaseScraper
+from newsauto.core.http import get_shared_client, request, response_json
+from newsauto.scrapers.base import BaseScraper, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
+# "123 stars today" / "1,234 stars this week"
+_STARS_RE = re.compile(r"([\d,]+)\s+stars")
+_NON_DIGITS_RE = re.compile(r"[^\d]")
+
+# Repositories per GraphQL query (GitHub allows up to 100 aliased lookups)
+GRAPHQL_BATCH_SIZE = 50
+
+# Fields fetched per repository when enhancing scraped data
+_REPO_DETAILS_FRAGMENT = """
+fragment RepoDetails on Repository {
+  createdAt
+  updatedAt
+  homepageUrl
+  stargazerCount
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+}
+"""
+
+# Trending period -> days of repository creation searched via the API
+SINCE_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
 
 class GitHubTrendingScraper(BaseScraper):
     """Scraper for GitHub trending repositories."""
 
     BASE_URL = "https://github.com/trending"
-    API_BASE = "https://api.github.com/repos"
+    SEARCH_URL = "https://api.github.com/search/repositories"
+    GRAPHQL_URL = "https://api.github.com/graphql"
 
     async def fetch_raw(self) -> List[Dict[str, Any]]:
         """Fetch trending repositories from GitHub.
@@ -30,45 +57,27 @@ class GitHubTrendingScraper(BaseScraper):
         limit = config.get("limit", 25)
 
         try:
-            # Build URL with parameters
-            url = self.BASE_URL
-            params = {}
-            if language:
-                params["language"] = language
-            if since:
-                params["since"] = since
-
-            # Fetch trending page
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; Newsauto/1.0)",
-                        "Accept": "text/html",
-                    },
-                    timeout=30,
-                )
-                response.raise_for_status()
-
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-            repos = []
-
-            # Find all repository articles
-            for article in soup.find_all("article", class_="Box-row")[:limit]:
+            # Shared client, reusing connections across runs
+            client = get_shared_client()
+            repos = None
+
+            # One search API request replaces the page scrape plus a
+            # request per repository when we have a token
+            token = config.get("github_token")
+            if token:
                 try:
-                    repo_data = self._parse_repo_article(article)
-                    if repo_data:
-                        # Enhance with API data if we have a token
-                        if config.get("github_token"):
-                            repo_data = await self._enhance_with_api(
-                                repo_data, config["github_token"]
-                            )
-                        repos.append(repo_data)
-                except Exception as e:
-                    logger.warning(f"Error parsing repo article: {e}")
-                    continue
+                    repos = await self._fetch_via_api(
+                        client, language, since, limit, token
+                    )
+                except httpx.HTTPError as e:
+                    logger.warning(
+                        f"GitHub search API failed, scraping trending page: {e}"
+                    )
+
+            if repos is None:
+                repos = await self._fetch_trending_page(
+                    client, language, since, limit, token
+                )
 
             logger.info(
                 f"Fetched {len(repos)} trending repos from GitHub ({language or 'all'}/{since})"
@@ -79,65 +88,215 @@ class GitHubTrendingScraper(BaseScraper):
             logger.error(f"Error fetching GitHub trending: {e}")
             raise
 
-    def _parse_repo_article(self, article) -> Optional[Dict[str, Any]]:
+    async def _fetch_trending_page(
+        self,
+        client: httpx.AsyncClient,
+        language: str,
+        since: str,
+        limit: int,
+        token: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Scrape repositories from the trending page.
+
+        Args:
+            client: Shared HTTP client
+            language: Language filter, empty for all
+            since: Trending period (daily, weekly, monthly)
+            limit: Maximum repositories
+            token: GitHub API token to enhance repositories with, if any
+
+        Returns:
+            Trending repositories
+        """
+        # Build URL with parameters
+        params = {}
+        if language:
+            params["language"] = language
+        if since:
+            params["since"] = since
+
+        # Fetch trending page
+        response = await request(
+            client,
+            "GET",
+            self.BASE_URL,
+            params=params,
+            headers={
+                "User-Agent": "Mozilla/5.0 (compatible; Newsauto/1.0)",
+                "Accept": "text/html",
+            },
+            timeout=30,
+        )
+        response.raise_for_status()
+
+        # Parse in a worker thread so other scrapers' I/O keeps running
+        repos = await asyncio.to_thread(self._parse_page, response.text, limit)
+
+        # Enhance with API data if we have a token
+        if token and repos:
+            await self._enhance_with_api(client, repos, token)
+
+        return repos
+
+    def _parse_page(self, html: str, limit: int) -> List[Dict[str, Any]]:
+        """Parse repositories from trending page HTML.
+
+        Args:
+            html: Trending page HTML
+            limit: Maximum repositories
+
+        Returns:
+            Parsed repositories
+        """
+        tree = LexborHTMLParser(html)
+        repos = []
+
+        # Find all repository articles
+        for article in tree.css("article.Box-row")[:limit]:
+            try:
+                repo_data = self._parse_repo_article(article)
+                if repo_data:
+                    repos.append(repo_data)
+            except Exception as e:
+                logger.warning(f"Error parsing repo article: {e}")
+                continue
+
+        return repos
+
+    async def _fetch_via_api(
+        self,
+        client: httpx.AsyncClient,
+        language: str,
+        since: str,
+        limit: int,
+        token: str,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the most starred recently created repositories from the search API.
+
+        Approximates the trending page with a single request: repositories
+        created within the trending period, sorted by stars. The search API
+        does not report stars gained in the period, but every star of a
+        repository created within it was, so stars_today is its star count.
+
+        Args:
+            client: Shared HTTP client
+            language: Language filter, empty for all
+            since: Trending period (daily, weekly, monthly)
+            limit: Maximum repositories
+            token: GitHub API token
+
+        Returns:
+            Repositories in the same shape as the trending page scrape
+
+        Raises:
+            httpx.HTTPError: If the search request fails
+        """
+        created_after = datetime.utcnow() - timedelta(days=SINCE_DAYS.get(since, 1))
+        query = f"created:>{created_after:%Y-%m-%d}"
+        if language:
+            query += f" language:{language}"
+
+        response = await request(
+            client,
+            "GET",
+            self.SEARCH_URL,
+            params={
+                "q": query,
+                "sort": "stars",
+                "order": "desc",
+                "per_page": min(limit, 100),
+            },
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+            timeout=30,
+        )
+        response.raise_for_status()
+
+        repos = []
+        for item in response_json(response).get("items", [])[:limit]:
+            owner = item["owner"]["login"]
+            name = item["name"]
+            stars = item.get("stargazers_count", 0)
+            repo_data = {
+                "owner": owner,
+                "name": name,
+                "full_name": f"{owner}/{name}",
+                "description": item.get("description") or "",
+                "language": item.get("language") or "",
+                "stars": stars,
+                "stars_today": stars,
+                "forks": item.get("forks_count", 0),
+                "url": f"https://github.com/{owner}/{name}",
+            }
+            repo_data.update(self._api_details(item))
+            repos.append(repo_data)
+
+        return repos
+
+    def _parse_repo_article(self, article: LexborNode) -> Optional[Dict[str, Any]]:
         """Parse repository information from HTML article.
 
         Args:
-            article: BeautifulSoup article element
+            article: Parsed article element
 
         Returns:
             Parsed repository data
         """
         try:
             # Extract repo name and owner
-            h2 = article.find("h2", class_="h3")
+            h2 = article.css_first("h2.h3")
             if not h2:
                 return None
 
-            repo_link = h2.find("a")
+            repo_link = h2.css_first("a")
             if not repo_link:
                 return None
 
-            repo_path = repo_link.get("href", "").strip("/")
+            repo_path = (repo_link.attributes.get("href") or "").strip("/")
             if "/" not in repo_path:
                 return None
 
             owner, name = repo_path.split("/", 1)
 
             # Extract description
-            description_p = article.find("p", class_="col-9")
-            description = description_p.get_text(strip=True) if description_p else ""
+            description_p = article.css_first("p.col-9")
+            description = description_p.text(strip=True) if description_p else ""
 
             # Extract language
-            language_span = article.find("span", {"itemprop": "programmingLanguage"})
-            language = language_span.get_text(strip=True) if language_span else ""
+            language_span = article.css_first('span[itemprop="programmingLanguage"]')
+            language = language_span.text(strip=True) if language_span else ""
 
             # Extract stars (today's stars)
-            stars_span = article.find("span", class_="d-inline-block float-sm-right")
+            stars_span = article.css_first("span.d-inline-block.float-sm-right")
             stars_today = 0
             if stars_span:
-                stars_text = stars_span.get_text(strip=True)
+                stars_text = stars_span.text(strip=True)
                 # Parse "123 stars today" or "1,234 stars this week"
-                import re
-
-                match = re.search(r"([\d,]+)\s+stars", stars_text)
+                match = _STARS_RE.search(stars_text)
                 if match:
                     stars_today = int(match.group(1).replace(",", ""))
 
+            # Find the stargazers and forks links in one pass over the anchors
+            stars_link = forks_link = None
+            for link in article.css("a"):
+                href = link.attributes.get("href") or ""
+                if stars_link is None and href.endswith("/stargazers"):
+                    stars_link = link
+                elif forks_link is None and href.endswith("/forks"):
+                    forks_link = link
+
             # Extract total stars
             total_stars = 0
-            stars_link = article.find(
-                "a", href=lambda x: x and x.endswith("/stargazers")
-            )
             if stars_link:
-                stars_text = stars_link.get_text(strip=True)
+                stars_text = stars_link.text(strip=True)
                 total_stars = self._parse_number(stars_text)
 
             # Extract forks
             forks = 0
-            forks_link = article.find("a", href=lambda x: x and x.endswith("/forks"))
             if forks_link:
-                forks_text = forks_link.get_text(strip=True)
+                forks_text = forks_link.text(strip=True)
                 forks = self._parse_number(forks_text)
 
             return {
@@ -165,60 +324,112 @@ class GitHubTrendingScraper(BaseScraper):
         Returns:
             Parsed integer
         """
-        import re
-
         text = text.strip()
         # Handle k suffix
         if text.endswith("k"):
             num = float(text[:-1]) * 1000
             return int(num)
         # Remove commas and parse
-        text = re.sub(r"[^\d]", "", text)
+        text = _NON_DIGITS_RE.sub("", text)
         return int(text) if text else 0
 
     async def _enhance_with_api(
-        self, repo_data: Dict[str, Any], token: str
-    ) -> Dict[str, Any]:
-        """Enhance repository data using GitHub API.
+        self, client: httpx.AsyncClient, repos: List[Dict[str, Any]], token: str
+    ) -> None:
+        """Enhance repository data in place using the GitHub GraphQL API.
+
+        All repositories are looked up in one query per GRAPHQL_BATCH_SIZE,
+        each as an aliased repository field, instead of a REST request per
+        repository. Repositories that cannot be looked up keep their
+        scraped data.
 
         Args:
-            repo_data: Basic repository data
+            client: Shared HTTP client
+            repos: Scraped repositories
             token: GitHub API token
-
-        Returns:
-            Enhanced repository data
         """
-        try:
-            url = f"{self.API_BASE}/{repo_data['full_name']}"
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers={
-                        "Authorization": f"token {token}",
-                        "Accept": "application/vnd.github.v3+json",
-                    },
-                    timeout=10,
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            batch = repos[start : start + GRAPHQL_BATCH_SIZE]
+            variables = {}
+            fields = []
+            for i, repo_data in enumerate(batch):
+                variables[f"owner{i}"] = repo_data["owner"]
+                variables[f"name{i}"] = repo_data["name"]
+                fields.append(
+                    f"r{i}: repository(owner: $owner{i}, name: $name{i}) "
+                    "{ ...RepoDetails }"
+                )
+            params = ", ".join(
+                f"$owner{i}: String!, $name{i}: String!" for i in range(len(batch))
+            )
+            query = f"query({params}) {{ {' '.join(fields)} }} {_REPO_DETAILS_FRAGMENT}"
+
+            try:
+                response = await request(
+                    client,
+                    "POST",
+                    self.GRAPHQL_URL,
+                    json={"query": query, "variables": variables},
+                    headers={"Authorization": f"bearer {token}"},
+                    timeout=30,
                 )
+                response.raise_for_status()
+                data = response_json(response).get("data") or {}
+            except Exception as e:
+                logger.debug(f"Could not enhance repo data: {e}")
+                continue
+
+            for i, repo_data in enumerate(batch):
+                details = data.get(f"r{i}")
+                if not details:
+                    continue
+                try:
+                    repo_data.update(self._graphql_details(details))
+                except (KeyError, TypeError) as e:
+                    logger.debug(f"Could not enhance {repo_data['full_name']}: {e}")
 
-                if response.status_code == 200:
-                    api_data = response.json()
-                    # Enhance with additional data
-                    repo_data.update(
-                        {
-                            "created_at": api_data.get("created_at"),
-                            "updated_at": api_data.get("updated_at"),
-                            "topics": api_data.get("topics", []),
-                            "watchers": api_data.get("watchers_count", 0),
-                            "open_issues": api_data.get("open_issues_count", 0),
-                            "homepage": api_data.get("homepage"),
-                        }
-                    )
+    @staticmethod
+    def _graphql_details(details: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a RepoDetails GraphQL result to the REST-style fields.
 
-        except Exception as e:
-            logger.debug(f"Could not enhance repo data: {e}")
+        Args:
+            details: Repository object from the GraphQL API
+
+        Returns:
+            Fields to merge into the repository data
+        """
+        return {
+            "created_at": details.get("createdAt"),
+            "updated_at": details.get("updatedAt"),
+            "topics": [
+                node["topic"]["name"] for node in details["repositoryTopics"]["nodes"]
+            ],
+            # REST's watchers_count is the stargazer count
+            "watchers": details["stargazerCount"],
+            # REST's open_issues_count includes open pull requests
+            "open_issues": details["issues"]["totalCount"]
+            + details["pullRequests"]["totalCount"],
+            "homepage": details.get("homepageUrl"),
+        }
+
+    @staticmethod
+    def _api_details(api_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick the extra repository fields from a GitHub API repository object.
+
+        Args:
+            api_data: Repository object from the REST API
 
-        return repo_data
+        Returns:
+            Fields to merge into the repository data
+        """
+        return {
+            "created_at": api_data.get("created_at"),
+            "updated_at": api_data.get("updated_at"),
+            "topics": api_data.get("topics", []),
+            "watchers": api_data.get("watchers_count", 0),
+            "open_issues": api_data.get("open_issues_count", 0),
+            "homepage": api_data.get("homepage"),
+        }
 
     def parse_item(self, repo: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse repository into standard content format.
@@ -230,23 +441,32 @@ class GitHubTrendingScraper(BaseScraper):
             Parsed content item
         """
         try:
+            # Bound once, as every field below is read from the repo
+            get = repo.get
+            stars = get("stars", 0)
+            stars_today = get("stars_today", 0)
+            forks = get("forks", 0)
+            description = get("description")
+            topics = get("topics")
+            updated_at = get("updated_at")
+
             # Build title
             title = f"{repo['full_name']}"
-            if repo.get("stars_today"):
-                title += f" - {repo['stars_today']} stars today"
+            if stars_today:
+                title += f" - {stars_today} stars today"
 
             # Build content
             content_parts = []
 
-            if repo.get("description"):
-                content_parts.append(f"**Description**: {repo['description']}")
+            if description:
+                content_parts.append(f"**Description**: {description}")
 
-            content_parts.append(f"**Language**: {repo.get('language', 'Unknown')}")
-            content_parts.append(f"**Stars**: {repo.get('stars', 0):,}")
-            content_parts.append(f"**Forks**: {repo.get('forks', 0):,}")
+            content_parts.append(f"**Language**: {get('language', 'Unknown')}")
+            content_parts.append(f"**Stars**: {stars:,}")
+            content_parts.append(f"**Forks**: {forks:,}")
 
-            if repo.get("topics"):
-                content_parts.append(f"**Topics**: {', '.join(repo['topics'][:5])}")
+            if topics:
+                content_parts.append(f"**Topics**: {', '.join(topics[:5])}")
 
             content_parts.append(f"\n[View on GitHub]({repo['url']})")
 
@@ -254,12 +474,10 @@ class GitHubTrendingScraper(BaseScraper):
 
             # Set published date (use updated_at if available, else current time)
             published_at = datetime.now()
-            if repo.get("updated_at"):
+            if updated_at:
                 try:
-                    published_at = datetime.fromisoformat(
-                        repo["updated_at"].replace("Z", "+00:00")
-                    )
-                except (ValueError, KeyError, AttributeError):
+                    published_at = parse_iso_datetime(updated_at)
+                except (ValueError, TypeError):
                     pass
 
             return {
@@ -270,14 +488,14 @@ class GitHubTrendingScraper(BaseScraper):
                 "published_at": published_at,
                 "metadata": {
                     "source_type": "github",
-                    "language": repo.get("language"),
-                    "stars": repo.get("stars", 0),
-                    "stars_today": repo.get("stars_today", 0),
-                    "forks": repo.get("forks", 0),
+                    "language": get("language"),
+                    "stars": stars,
+                    "stars_today": stars_today,
+                    "forks": forks,
                 },
                 # High engagement metrics for scoring
-                "score": repo.get("stars_today", 0),
-                "upvotes": repo.get("stars", 0),
+                "score": stars_today,
+                "upvotes": stars,
             }
 
         except Exception as e:
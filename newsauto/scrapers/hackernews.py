@@ -1,15 +1,32 @@
 """HackerNews scraper."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
+from sqlalchemy.orm import Session
 
+from newsauto.core.http import conditional_get, get_shared_client, response_json
+from newsauto.models.content import ContentSource
 from newsauto.scrapers.base import BaseScraper
 
+try:
+    import simdjson
+except ImportError:  # Optional speedup, fall back to response_json
+    simdjson = None
+
 logger = logging.getLogger(__name__)
 
+# Title prefixes of special story types, and their categories
+STORY_CATEGORIES = (
+    ("Ask HN:", "ask"),
+    ("Show HN:", "show"),
+    ("Launch HN:", "launch"),
+)
+_CATEGORY_PREFIXES = tuple(prefix for prefix, _ in STORY_CATEGORIES)
+
 
 class HackerNewsScraper(BaseScraper):
     """Scraper for HackerNews posts."""
@@ -20,6 +37,17 @@ class HackerNewsScraper(BaseScraper):
     BEST_STORIES_URL = f"{BASE_URL}/beststories.json"
     NEW_STORIES_URL = f"{BASE_URL}/newstories.json"
 
+    def __init__(self, source: ContentSource, db: Session = None):
+        """Initialize scraper.
+
+        Args:
+            source: Content source configuration
+            db: Database session
+        """
+        super().__init__(source, db)
+        # Reused for every story, so its buffers are allocated once
+        self._json_parser = simdjson.Parser() if simdjson is not None else None
+
     async def fetch_raw(self) -> List[Dict[str, Any]]:
         """Fetch posts from HackerNews.
 
@@ -74,10 +102,11 @@ class HackerNewsScraper(BaseScraper):
         else:
             url = self.TOP_STORIES_URL
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30)
-            response.raise_for_status()
-            story_ids = response.json()
+        # Revalidated, so an unchanged list is not downloaded again
+        client = get_shared_client()
+        response = await conditional_get(client, url, timeout=30)
+        response.raise_for_status()
+        story_ids = response_json(response)
 
         return story_ids[:limit]
 
@@ -91,14 +120,14 @@ class HackerNewsScraper(BaseScraper):
             List of story details
         """
         stories = []
+        client = get_shared_client()
 
-        async with httpx.AsyncClient() as client:
-            # Fetch stories in batches to avoid overwhelming the API
-            batch_size = 10
-            for i in range(0, len(story_ids), batch_size):
-                batch_ids = story_ids[i : i + batch_size]
-                batch_stories = await self._fetch_story_batch(client, batch_ids)
-                stories.extend(batch_stories)
+        # Fetch stories in batches to avoid overwhelming the API
+        batch_size = 10
+        for i in range(0, len(story_ids), batch_size):
+            batch_ids = story_ids[i : i + batch_size]
+            batch_stories = await self._fetch_story_batch(client, batch_ids)
+            stories.extend(batch_stories)
 
         return stories
 
@@ -114,8 +143,6 @@ class HackerNewsScraper(BaseScraper):
         Returns:
             List of story details
         """
-        import asyncio
-
         tasks = []
         for story_id in story_ids:
             url = self.ITEM_URL.format(item_id=story_id)
@@ -130,14 +157,36 @@ class HackerNewsScraper(BaseScraper):
                 continue
 
             try:
-                story = response.json()
-                if story and story.get("type") == "story":
+                story = self._decode_story(response)
+                if story:
                     stories.append(story)
             except Exception as e:
                 logger.warning(f"Failed to parse story: {e}")
 
         return stories
 
+    def _decode_story(self, response: httpx.Response) -> Optional[Dict[str, Any]]:
+        """Decode an item response, keeping it only if it is a story.
+
+        With pysimdjson installed, the item type is read from the parsed
+        document before the rest of it is converted to Python objects.
+
+        Args:
+            response: Item response
+
+        Returns:
+            Story details, or None for other item types
+        """
+        if self._json_parser is None:
+            story = response_json(response)
+            return story if story and story.get("type") == "story" else None
+
+        # The proxy must not outlive this call, or the parser cannot be reused
+        doc = self._json_parser.parse(response.content)
+        if isinstance(doc, simdjson.Object) and doc.get("type") == "story":
+            return doc.as_dict()
+        return None
+
     def parse_item(self, story: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse HackerNews story into standard format.
 
@@ -186,16 +235,15 @@ class HackerNewsScraper(BaseScraper):
                 "hn_url": hn_url,
             }
 
-            # Add story type flags
+            # Add story type flags, checking all prefixes at once first
+            # since most stories are plain links
             title = story.get("title", "")
-            if title.startswith("Ask HN:"):
-                metadata["story_category"] = "ask"
-            elif title.startswith("Show HN:"):
-                metadata["story_category"] = "show"
-            elif title.startswith("Launch HN:"):
-                metadata["story_category"] = "launch"
-            else:
-                metadata["story_category"] = "link"
+            metadata["story_category"] = "link"
+            if title.startswith(_CATEGORY_PREFIXES):
+                for prefix, category in STORY_CATEGORIES:
+                    if title.startswith(prefix):
+                        metadata["story_category"] = category
+                        break
 
             # Calculate engagement score
             score = story.get("score", 0)
@@ -229,40 +277,50 @@ class HackerNewsScraper(BaseScraper):
             List of comments
         """
         try:
-            async with httpx.AsyncClient() as client:
-                # Fetch story to get comment IDs
-                story_url = self.ITEM_URL.format(item_id=story_id)
-                response = await client.get(story_url, timeout=20)
-                response.raise_for_status()
-                story = response.json()
-
-                # Get comment IDs
-                comment_ids = story.get("kids", [])[:limit]
-
-                # Fetch comments
-                comments = []
-                for comment_id in comment_ids:
-                    comment_url = self.ITEM_URL.format(item_id=comment_id)
-                    response = await client.get(comment_url, timeout=20)
-
-                    if response.status_code == 200:
-                        comment = response.json()
-                        if (
-                            comment
-                            and not comment.get("dead")
-                            and not comment.get("deleted")
-                        ):
-                            comments.append(
-                                {
-                                    "text": comment.get("text", ""),
-                                    "author": comment.get("by", ""),
-                                    "time": datetime.fromtimestamp(
-                                        comment.get("time", 0), tz=timezone.utc
-                                    ),
-                                }
-                            )
-
-                return comments
+            client = get_shared_client()
+
+            # Fetch story to get comment IDs
+            story_url = self.ITEM_URL.format(item_id=story_id)
+            response = await client.get(story_url, timeout=20)
+            response.raise_for_status()
+            story = response_json(response)
+
+            # Get comment IDs
+            comment_ids = story.get("kids", [])[:limit]
+
+            # Fetch comments concurrently
+            responses = await asyncio.gather(
+                *(
+                    client.get(self.ITEM_URL.format(item_id=comment_id), timeout=20)
+                    for comment_id in comment_ids
+                ),
+                return_exceptions=True,
+            )
+
+            comments = []
+            for response in responses:
+                if isinstance(response, Exception):
+                    logger.warning(f"Failed to fetch comment: {response}")
+                    continue
+
+                if response.status_code == 200:
+                    comment = response_json(response)
+                    if (
+                        comment
+                        and not comment.get("dead")
+                        and not comment.get("deleted")
+                    ):
+                        comments.append(
+                            {
+                                "text": comment.get("text", ""),
+                                "author": comment.get("by", ""),
+                                "time": datetime.fromtimestamp(
+                                    comment.get("time", 0), tz=timezone.utc
+                                ),
+                            }
+                        )
+
+            return comments
 
         except Exception as e:
             logger.error(f"Error fetching comments for story {story_id}: {e}")
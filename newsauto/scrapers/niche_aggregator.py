@@ -6,15 +6,77 @@ Fetches content from RSS feeds configured for each niche.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from email.utils import parsedate_to_datetime
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from newsauto.config.niches import niche_configs
 from newsauto.config.rss_feeds import get_feeds_for_niche
+from newsauto.models.content import ContentSource, ContentSourceType
 from newsauto.scrapers.aggregator import ContentAggregator
+from newsauto.scrapers.base import contains_keyword, count_keyword_hits
 from newsauto.scrapers.rss import RSSFetcher
 
 logger = logging.getLogger(__name__)
 
+# Feeds fetched per niche, and how many are fetched at once
+MAX_FEEDS = 10
+FEED_CONCURRENCY = 5
+
+# Sources whose items get a relevance bonus
+PREMIUM_SOURCES = (
+    "bloomberg",
+    "wsj",
+    "financial times",
+    "gartner",
+    "forrester",
+    "mckinsey",
+)
+
+
+def _head_text(item: Dict[str, Any]) -> str:
+    """Lowercased title and summary of an item, as matched and scored."""
+    return f"{item.get('title', '')} {item.get('summary', '')}".lower()
+
+
+def _published_datetime(item: Dict[str, Any]) -> Optional[datetime]:
+    """Publication time of an item as a naive local datetime.
+
+    Strings are parsed as ISO 8601, or as RFC 822 dates as many feeds use.
+    The result is cached on the item as "_published_dt", so the age filter
+    and freshness scoring parse each date once.
+
+    Args:
+        item: Content item
+
+    Returns:
+        Publication time, or None if missing or unparseable
+    """
+    try:
+        return item["_published_dt"]
+    except KeyError:
+        pass
+
+    value = item.get("published_at")
+    published = None
+    if isinstance(value, datetime):
+        published = value
+    elif isinstance(value, str) and value:
+        try:
+            published = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                published = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                pass
+
+    # Comparable with datetime.now()
+    if published is not None and published.tzinfo is not None:
+        published = published.astimezone().replace(tzinfo=None)
+
+    item["_published_dt"] = published
+    return published
+
 
 class NicheContentAggregator:
     """Aggregates content specific to newsletter niches."""
@@ -22,7 +84,8 @@ class NicheContentAggregator:
     def __init__(self):
         """Initialize the niche content aggregator."""
         self.base_aggregator = ContentAggregator()
-        self.rss_scraper = RSSFetcher()
+        # Niche name -> lowercased (keywords, exclude keywords)
+        self._niche_keywords: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
 
     async def fetch_niche_content(
         self,
@@ -54,147 +117,219 @@ class NicheContentAggregator:
             logger.warning(f"No RSS feeds configured for niche: {niche_key}")
             rss_feeds = get_feeds_for_niche(niche_key, include_general=True)
 
-        # Fetch content from RSS feeds
-        all_content = []
-        for feed_url in rss_feeds[:10]:  # Limit to 10 feeds to avoid overload
-            try:
+        # Fetch feeds concurrently, each with its own fetcher
+        semaphore = asyncio.Semaphore(FEED_CONCURRENCY)
+        feed_urls = rss_feeds[:MAX_FEEDS]  # Limit feeds to avoid overload
+
+        async def fetch_feed(feed_url: str) -> List[Dict[str, Any]]:
+            async with semaphore:
                 logger.debug(f"Fetching from feed: {feed_url}")
-                # Set the feed URL for the scraper
-                self.rss_scraper.url = feed_url
-                self.rss_scraper.config = {
-                    "max_items": limit_per_source,
-                    "parse_full_text": True
-                }
-                content = await self.rss_scraper.fetch()
-
-                # Filter by age
-                cutoff_date = datetime.now() - timedelta(days=max_age_days)
-                filtered_content = []
-                for item in content:
-                    if item.get("published_at"):
-                        if isinstance(item["published_at"], str):
-                            try:
-                                pub_date = datetime.fromisoformat(item["published_at"])
-                                if pub_date >= cutoff_date:
-                                    filtered_content.append(item)
-                            except ValueError:
-                                filtered_content.append(item)
-                        elif isinstance(item["published_at"], datetime):
-                            if item["published_at"] >= cutoff_date:
-                                filtered_content.append(item)
-                    else:
-                        filtered_content.append(item)
-
-                # Add niche metadata
-                for item in filtered_content:
-                    item["niche"] = niche_key
-                    item["niche_name"] = niche.name
-                    item["content_category"] = niche.category.value
-
-                all_content.extend(filtered_content)
+                fetcher = RSSFetcher(
+                    ContentSource(
+                        name=feed_url,
+                        type=ContentSourceType.RSS,
+                        url=feed_url,
+                        config={"parse_full_text": True},
+                    )
+                )
+                entries = await fetcher.fetch_raw()
+            items = (fetcher.parse_item(entry) for entry in entries[:limit_per_source])
+            return [item for item in items if item]
+
+        results = await asyncio.gather(
+            *(fetch_feed(feed_url) for feed_url in feed_urls),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.error(f"Error fetching feed {feed_url}: {e}")
+        # Reference times shared by every item's age check and scoring
+        all_content = []
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=max_age_days)
+        for feed_url, content in zip(feed_urls, results):
+            if isinstance(content, Exception):
+                logger.error(f"Error fetching feed {feed_url}: {content}")
                 continue
 
-        # Apply niche-specific filtering
-        filtered_content = self._apply_niche_filters(all_content, niche)
-
-        # Score and rank content
-        scored_content = self._score_content(filtered_content, niche)
+            # Filter, annotate and score the feed's items in one pass
+            try:
+                processed = self._process_content(
+                    content, niche_key, niche, now, cutoff_date
+                )
+            except Exception as e:
+                logger.error(f"Error processing feed {feed_url}: {e}")
+                continue
+            all_content.extend(processed)
 
-        # Sort by score
-        scored_content.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
+        # Sort by score, which _process_content sets on every item
+        all_content.sort(key=itemgetter("relevance_score"), reverse=True)
 
-        logger.info(
-            f"Fetched {len(scored_content)} items for niche {niche.name}"
-        )
-        return scored_content
+        logger.info(f"Fetched {len(all_content)} items for niche {niche.name}")
+        return all_content
 
-    def _apply_niche_filters(
-        self, content: List[Dict[str, Any]], niche
+    def _process_content(
+        self,
+        content: List[Dict[str, Any]],
+        niche_key: str,
+        niche,
+        now: datetime,
+        cutoff_date: datetime,
     ) -> List[Dict[str, Any]]:
-        """Apply niche-specific keyword filtering."""
-        filtered = []
+        """Filter, annotate and score feed items in a single pass.
+
+        Args:
+            content: Items from one feed
+            niche_key: The niche identifier
+            niche: The niche configuration
+            now: Reference time for freshness scoring
+            cutoff_date: Items published before this are dropped
 
-        # Convert keywords to lowercase for case-insensitive matching
-        keywords = [kw.lower() for kw in niche.keywords]
-        exclude_keywords = [kw.lower() for kw in niche.exclude_keywords]
+        Returns:
+            Recent items matching the niche's keywords, with niche metadata
+            and relevance_score set
+        """
+        keywords, exclude_keywords = self._keywords_for(niche)
 
+        processed = []
         for item in content:
-            # Check content for keywords
-            text = (
-                f"{item.get('title', '')} {item.get('summary', '')} "
-                f"{item.get('content', '')}"
-            ).lower()
+            if not self._is_recent(item, cutoff_date):
+                continue
 
-            # Must contain at least one keyword
-            if keywords:
-                has_keyword = any(kw in text for kw in keywords)
-                if not has_keyword:
-                    continue
+            head = _head_text(item)
+            if not self._matches_keywords(item, head, keywords, exclude_keywords):
+                continue
 
-            # Must not contain exclude keywords
-            if exclude_keywords:
-                has_excluded = any(kw in text for kw in exclude_keywords)
-                if has_excluded:
-                    continue
+            # Add niche metadata
+            item["niche"] = niche_key
+            item["niche_name"] = niche.name
+            item["content_category"] = niche.category.value
 
-            filtered.append(item)
+            item["relevance_score"] = self._relevance_score(item, head, keywords, now)
+            processed.append(item)
 
-        return filtered
+        return processed
 
-    def _score_content(
+    def _apply_niche_filters(
         self, content: List[Dict[str, Any]], niche
+    ) -> List[Dict[str, Any]]:
+        """Apply niche-specific keyword filtering."""
+        keywords, exclude_keywords = self._keywords_for(niche)
+        return [
+            item
+            for item in content
+            if self._matches_keywords(
+                item, _head_text(item), keywords, exclude_keywords
+            )
+        ]
+
+    def _score_content(
+        self,
+        content: List[Dict[str, Any]],
+        niche,
+        now: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
         """Score content based on niche relevance."""
+        keywords, _ = self._keywords_for(niche)
+        if now is None:
+            now = datetime.now()
         for item in content:
-            score = 0.5  # Base score
-
-            text = (
-                f"{item.get('title', '')} {item.get('summary', '')}"
-            ).lower()
-
-            # Keyword density scoring
-            keywords = [kw.lower() for kw in niche.keywords]
-            keyword_count = sum(1 for kw in keywords if kw in text)
-            score += min(keyword_count * 0.1, 0.3)
-
-            # Freshness scoring
-            if item.get("published_at"):
-                try:
-                    if isinstance(item["published_at"], str):
-                        pub_date = datetime.fromisoformat(item["published_at"])
-                    else:
-                        pub_date = item["published_at"]
-
-                    age_days = (datetime.now() - pub_date).days
-                    if age_days <= 1:
-                        score += 0.2
-                    elif age_days <= 3:
-                        score += 0.1
-                    elif age_days <= 7:
-                        score += 0.05
-                except (ValueError, TypeError):
-                    pass
-
-            # Source quality scoring (premium sources get higher scores)
-            source = item.get("source", "").lower()
-            premium_sources = [
-                "bloomberg",
-                "wsj",
-                "financial times",
-                "gartner",
-                "forrester",
-                "mckinsey",
-            ]
-            if any(ps in source for ps in premium_sources):
-                score += 0.15
-
-            item["relevance_score"] = min(score, 1.0)
-
+            item["relevance_score"] = self._relevance_score(
+                item, _head_text(item), keywords, now
+            )
         return content
 
+    @staticmethod
+    def _is_recent(item: Dict[str, Any], cutoff_date: datetime) -> bool:
+        """Whether an item was published after cutoff_date.
+
+        Items without a date, or with a date that does not parse, are kept.
+        """
+        published = _published_datetime(item)
+        return published is None or published >= cutoff_date
+
+    @staticmethod
+    def _matches_keywords(
+        item: Dict[str, Any],
+        head: str,
+        keywords: Tuple[str, ...],
+        exclude_keywords: Tuple[str, ...],
+    ) -> bool:
+        """Whether an item contains a niche keyword and no exclude keyword.
+
+        Args:
+            item: Content item
+            head: Lowercased title and summary, from _head_text
+            keywords: Lowercased niche keywords
+            exclude_keywords: Lowercased exclude keywords
+        """
+        # The title and summary are checked first, as they often decide
+        # the item without lowercasing its content: an exclude keyword
+        # there rejects it, and a keyword accepts it if none are excluded
+        if exclude_keywords and contains_keyword(exclude_keywords, head):
+            return False
+        found = not keywords or contains_keyword(keywords, head)
+        if found and not exclude_keywords:
+            return True
+
+        content = str(item.get("content", "")).lower()
+
+        # Must contain at least one keyword
+        if not found and not contains_keyword(keywords, content):
+            return False
+
+        # Must not contain exclude keywords
+        return not (exclude_keywords and contains_keyword(exclude_keywords, content))
+
+    @staticmethod
+    def _relevance_score(
+        item: Dict[str, Any], head: str, keywords: Tuple[str, ...], now: datetime
+    ) -> float:
+        """Score an item's niche relevance between 0 and 1.
+
+        Args:
+            item: Content item
+            head: Lowercased title and summary, from _head_text
+            keywords: Lowercased niche keywords
+            now: Reference time for freshness scoring
+        """
+        score = 0.5  # Base score
+
+        # Keyword density scoring, up to three keywords
+        keyword_count = count_keyword_hits(keywords, head, limit=3)
+        score += min(keyword_count * 0.1, 0.3)
+
+        # Freshness scoring
+        pub_date = _published_datetime(item)
+        if pub_date is not None:
+            age_days = (now - pub_date).days
+            if age_days <= 1:
+                score += 0.2
+            elif age_days <= 3:
+                score += 0.1
+            elif age_days <= 7:
+                score += 0.05
+
+        # Source quality scoring (premium sources get higher scores)
+        source = item.get("source", "").lower()
+        if any(ps in source for ps in PREMIUM_SOURCES):
+            score += 0.15
+
+        return min(score, 1.0)
+
+    def _keywords_for(self, niche) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Lowercased keywords and exclude keywords of a niche.
+
+        Computed on first use for each niche rather than per call, for
+        case-insensitive matching against lowercased text.
+        """
+        keywords = self._niche_keywords.get(niche.name)
+        if keywords is None:
+            keywords = (
+                tuple(kw.lower() for kw in niche.keywords),
+                tuple(kw.lower() for kw in niche.exclude_keywords),
+            )
+            self._niche_keywords[niche.name] = keywords
+        return keywords
+
     async def fetch_multiple_niches(
         self,
         niche_keys: List[str],
@@ -1,46 +1,112 @@
 """Reddit content scraper."""
 
-import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import praw
-from praw.models import Submission
+import httpx
 
 from newsauto.core.config import get_settings
+from newsauto.core.http import get_shared_client, request, response_json
 from newsauto.scrapers.base import BaseScraper
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Posts per listing request, Reddit's maximum
+LISTING_PAGE_SIZE = 100
+
+# Seconds before expiry at which an access token is refreshed
+TOKEN_EXPIRY_MARGIN = 60.0
+
+# Application-only access token and the time.monotonic() it expires at,
+# shared by all scraper instances
+_access_token: Optional[Tuple[str, float]] = None
+
 
 class RedditScraper(BaseScraper):
     """Scraper for Reddit posts."""
 
+    TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+    API_URL = "https://oauth.reddit.com"
+    SORTS = ("hot", "new", "top", "rising")
+
     def __init__(self, *args, **kwargs):
         """Initialize Reddit scraper."""
         super().__init__(*args, **kwargs)
-        self.reddit = None
-        self._init_reddit()
-
-    def _init_reddit(self):
-        """Initialize Reddit API client."""
-        if not settings.reddit_client_id or not settings.reddit_client_secret:
+        self.configured = bool(
+            settings.reddit_client_id and settings.reddit_client_secret
+        )
+        if not self.configured:
             logger.warning("Reddit API credentials not configured")
-            return
 
-        try:
-            self.reddit = praw.Reddit(
-                client_id=settings.reddit_client_id,
-                client_secret=settings.reddit_client_secret,
-                user_agent=settings.reddit_user_agent,
-            )
-            # Test connection
-            self.reddit.read_only = True
-            logger.info("Reddit API client initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Reddit client: {e}")
+    async def _get_access_token(self, client: httpx.AsyncClient) -> str:
+        """Get an application-only OAuth token, refreshing it when near expiry.
+
+        Args:
+            client: HTTP client
+
+        Returns:
+            Bearer token for the OAuth API
+        """
+        global _access_token
+
+        if _access_token is not None and _access_token[1] > time.monotonic():
+            return _access_token[0]
+
+        response = await request(
+            client,
+            "POST",
+            self.TOKEN_URL,
+            data={"grant_type": "client_credentials"},
+            auth=(settings.reddit_client_id, settings.reddit_client_secret),
+            headers={"User-Agent": settings.reddit_user_agent},
+        )
+        response.raise_for_status()
+        payload = response_json(response)
+
+        token = payload.get("access_token")
+        if not token:
+            raise ValueError(f"Reddit token request failed: {payload.get('error')}")
+
+        expires_in = payload.get("expires_in", 3600)
+        _access_token = (token, time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN)
+        logger.info("Reddit API token refreshed")
+        return token
+
+    async def _api_get(
+        self, client: httpx.AsyncClient, path: str, params: Dict[str, Any]
+    ) -> Any:
+        """GET an OAuth API endpoint.
+
+        Args:
+            client: HTTP client
+            path: Path below API_URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+        """
+        global _access_token
+
+        token = await self._get_access_token(client)
+        response = await request(
+            client,
+            "GET",
+            f"{self.API_URL}{path}",
+            # raw_json=1 returns text unescaped, as PRAW did
+            params={**params, "raw_json": 1},
+            headers={
+                "Authorization": f"Bearer {token}",
+                "User-Agent": settings.reddit_user_agent,
+            },
+        )
+        if response.status_code == 401:
+            # Revoked or expired early; the next call fetches a new token
+            _access_token = None
+        response.raise_for_status()
+        return response_json(response)
 
     async def fetch_raw(self) -> List[Dict[str, Any]]:
         """Fetch posts from Reddit.
@@ -48,7 +114,7 @@ class RedditScraper(BaseScraper):
         Returns:
             List of Reddit posts
         """
-        if not self.reddit:
+        if not self.configured:
             raise ValueError("Reddit API not configured")
 
         config = self.source.config
@@ -58,15 +124,8 @@ class RedditScraper(BaseScraper):
         time_filter = config.get("time_filter", "week")
 
         try:
-            # Run in executor since PRAW is synchronous
-            loop = asyncio.get_event_loop()
-            posts = await loop.run_in_executor(
-                None,
-                self._fetch_subreddit_posts,
-                subreddit_name,
-                sort_by,
-                limit,
-                time_filter,
+            posts = await self._fetch_subreddit_posts(
+                get_shared_client(), subreddit_name, sort_by, limit, time_filter
             )
 
             logger.info(f"Fetched {len(posts)} posts from r/{subreddit_name}")
@@ -76,12 +135,18 @@ class RedditScraper(BaseScraper):
             logger.error(f"Error fetching Reddit posts: {e}")
             raise
 
-    def _fetch_subreddit_posts(
-        self, subreddit_name: str, sort_by: str, limit: int, time_filter: str
+    async def _fetch_subreddit_posts(
+        self,
+        client: httpx.AsyncClient,
+        subreddit_name: str,
+        sort_by: str,
+        limit: int,
+        time_filter: str,
     ) -> List[Dict[str, Any]]:
-        """Fetch posts from a subreddit (synchronous).
+        """Fetch posts from a subreddit listing.
 
         Args:
+            client: HTTP client
             subreddit_name: Name of subreddit
             sort_by: Sort method (hot, new, top, rising)
             limit: Number of posts to fetch
@@ -90,52 +155,60 @@ class RedditScraper(BaseScraper):
         Returns:
             List of post data
         """
-        subreddit = self.reddit.subreddit(subreddit_name)
-
-        # Get posts based on sort method
-        if sort_by == "hot":
-            submissions = subreddit.hot(limit=limit)
-        elif sort_by == "new":
-            submissions = subreddit.new(limit=limit)
-        elif sort_by == "top":
-            submissions = subreddit.top(time_filter=time_filter, limit=limit)
-        elif sort_by == "rising":
-            submissions = subreddit.rising(limit=limit)
-        else:
-            submissions = subreddit.hot(limit=limit)
+        if sort_by not in self.SORTS:
+            sort_by = "hot"
+
+        params = {}
+        if sort_by == "top":
+            params["t"] = time_filter
 
+        # Listings are paged, LISTING_PAGE_SIZE posts at a time
         posts = []
-        for submission in submissions:
-            posts.append(self._extract_post_data(submission))
+        while len(posts) < limit:
+            params["limit"] = min(limit - len(posts), LISTING_PAGE_SIZE)
+            listing = await self._api_get(
+                client, f"/r/{subreddit_name}/{sort_by}", params
+            )
+            data = listing["data"]
+            posts.extend(
+                self._extract_post_data(child["data"])
+                for child in data["children"]
+                if child.get("kind") == "t3"
+            )
 
-        return posts
+            if not data.get("after") or not data["children"]:
+                break
+            params["after"] = data["after"]
 
-    def _extract_post_data(self, submission: Submission) -> Dict[str, Any]:
-        """Extract data from Reddit submission.
+        return posts[:limit]
+
+    def _extract_post_data(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract data from a Reddit submission.
 
         Args:
-            submission: Reddit submission object
+            submission: Submission data from a listing
 
         Returns:
             Post data dictionary
         """
+        get = submission.get
         return {
-            "id": submission.id,
-            "title": submission.title,
-            "url": submission.url,
-            "reddit_url": f"https://reddit.com{submission.permalink}",
-            "author": str(submission.author) if submission.author else "[deleted]",
-            "subreddit": submission.subreddit.display_name,
-            "score": submission.score,
-            "upvote_ratio": submission.upvote_ratio,
-            "num_comments": submission.num_comments,
-            "created_utc": submission.created_utc,
-            "selftext": submission.selftext,
-            "is_self": submission.is_self,
-            "link_flair_text": submission.link_flair_text,
-            "over_18": submission.over_18,
-            "spoiler": submission.spoiler,
-            "stickied": submission.stickied,
+            "id": submission["id"],
+            "title": submission["title"],
+            "url": get("url"),
+            "reddit_url": f"https://reddit.com{submission['permalink']}",
+            "author": get("author") or "[deleted]",
+            "subreddit": submission["subreddit"],
+            "score": get("score", 0),
+            "upvote_ratio": get("upvote_ratio"),
+            "num_comments": get("num_comments", 0),
+            "created_utc": submission["created_utc"],
+            "selftext": get("selftext", ""),
+            "is_self": get("is_self", False),
+            "link_flair_text": get("link_flair_text"),
+            "over_18": get("over_18", False),
+            "spoiler": get("spoiler", False),
+            "stickied": get("stickied", False),
         }
 
     def parse_item(self, post: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -230,37 +303,24 @@ class RedditScraper(BaseScraper):
         Returns:
             List of comment texts
         """
-        if not self.reddit:
+        if not self.configured:
             return []
 
         try:
-            loop = asyncio.get_event_loop()
-            comments = await loop.run_in_executor(
-                None, self._fetch_post_comments, post_id, limit
+            _, comment_listing = await self._api_get(
+                get_shared_client(),
+                f"/comments/{post_id}",
+                {"sort": "best", "depth": 1, "limit": limit},
             )
-            return comments
+
+            # "more" stubs for unloaded comments are skipped
+            comments = [
+                child["data"]["body"]
+                for child in comment_listing["data"]["children"]
+                if child.get("kind") == "t1"
+            ]
+            return comments[:limit]
 
         except Exception as e:
             logger.error(f"Error fetching comments for post {post_id}: {e}")
             return []
-
-    def _fetch_post_comments(self, post_id: str, limit: int) -> List[str]:
-        """Fetch comments from a post (synchronous).
-
-        Args:
-            post_id: Reddit post ID
-            limit: Number of comments
-
-        Returns:
-            List of comment texts
-        """
-        submission = self.reddit.submission(id=post_id)
-        submission.comment_sort = "best"
-        submission.comments.replace_more(limit=0)
-
-        comments = []
-        for comment in submission.comments[:limit]:
-            if hasattr(comment, "body"):
-                comments.append(comment.body)
-
-        return comments
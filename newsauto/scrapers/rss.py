@@ -8,6 +8,7 @@ import feedparser
 import httpx
 from bs4 import BeautifulSoup
 
+from newsauto.core.http import conditional_get, get_shared_client
 from newsauto.scrapers.base import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -27,14 +28,15 @@ class RSSFetcher(BaseScraper):
             raise ValueError(f"No feed URL configured for source {self.source.name}")
 
         try:
-            # Fetch feed
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    feed_url,
-                    timeout=30,
-                    headers={"User-Agent": "Newsauto/1.0 (RSS Reader)"},
-                )
-                response.raise_for_status()
+            # Fetch feed, revalidating the copy from the last run
+            client = get_shared_client()
+            response = await conditional_get(
+                client,
+                feed_url,
+                timeout=30,
+                headers={"User-Agent": "Newsauto/1.0 (RSS Reader)"},
+            )
+            response.raise_for_status()
 
             # Parse feed
             feed = feedparser.parse(response.text)
@@ -72,10 +74,12 @@ class RSSFetcher(BaseScraper):
                 logger.warning("Missing title or URL in RSS entry")
                 return None
 
-            # Extract content
+            # Extract content; only content:encoded carries the full article
             content = ""
+            full_text = False
             if "content" in entry:
                 content = entry.content[0].get("value", "")
+                full_text = bool(content)
             elif "summary" in entry:
                 content = entry.get("summary", "")
             elif "description" in entry:
@@ -108,6 +112,7 @@ class RSSFetcher(BaseScraper):
             metadata = {
                 "source_type": "rss",
                 "feed_title": getattr(entry, "feed", {}).get("title", ""),
+                "full_text": full_text,
             }
 
             # Add categories/tags
@@ -33,6 +33,17 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _article_body(content_item: ContentItem) -> Optional[str]:
+    """Get the stored article text, if the scraper fetched the full body.
+
+    Link posts only store a stub (e.g. "External link: ...") and listings a
+    description, which must not stand in for the source page.
+    """
+    if (content_item.meta_data or {}).get("full_text"):
+        return content_item.content or None
+    return None
+
+
 class QualityScorer:
     """Main quality scoring orchestrator."""
 
@@ -67,7 +78,9 @@ class QualityScorer:
                 content_item.content,
             )
             factual_task = self.factual_checker.check(
-                content_item.summary or "", content_item.url
+                content_item.summary or "",
+                content_item.url,
+                cached_body=_article_body(content_item),
             )
             sentiment_task = self.sentiment_analyzer.analyze(
                 content_item.summary or content_item.content
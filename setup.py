@@ -16,17 +16,17 @@ setup(
         "alembic==1.13.1",
         "pydantic==2.5.3",
         "pydantic-settings==2.1.0",
-        "httpx==0.25.2",
+        "httpx[http2]==0.25.2",
         "python-multipart==0.0.6",
         "python-jose[cryptography]==3.3.0",
         "passlib[bcrypt]==1.7.4",
         "feedparser==6.0.10",
         "beautifulsoup4==4.12.2",
+        "selectolax==1.0.0",
         "torch>=2.1.2",
         "transformers==4.37.0",
         "sentence-transformers==2.3.1",
         "ollama==0.1.6",
-        "praw==7.7.1",
         "aiohttp==3.9.1",
         "jinja2==3.1.3",
         "emails==0.6",
@@ -65,7 +65,15 @@ setup(
             "black==25.9.0",
             "ruff==0.13.1",
             "mypy==1.18.2",
-        ]
+        ],
+        # Optional native accelerators, used when installed
+        "speedups": [
+            "pyahocorasick>=2.0.0",
+            "datasketch>=1.5.0",
+            "orjson>=3.9.0",
+            "ciso8601>=2.3.0",
+            "pysimdjson>=6.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,198 @@
+"""Tests for the shared scraper HTTP helpers."""
+
+import asyncio
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from newsauto.core import http
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record waits instead of sleeping, with no per-host pacing."""
+    waits = []
+
+    async def fake_sleep(delay):
+        waits.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(http, "HOST_MIN_INTERVAL", 0.0)
+    monkeypatch.setattr(http, "_next_request_at", {})
+    return waits
+
+
+def mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestRequest:
+    """Test paced and retried requests."""
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self, sleeps):
+        """Test transient failures are retried with doubling waits."""
+        statuses = iter([503, 502, 200])
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(next(statuses))
+
+        async with mock_client(handler) as client:
+            response = await http.request(client, "GET", "https://api.test/items")
+
+        assert response.status_code == 200
+        assert len(attempts) == 3
+        assert sleeps == [http.RETRY_BACKOFF, http.RETRY_BACKOFF * 2]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, sleeps):
+        """Test the last failing response is returned once retries run out."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(503)
+
+        async with mock_client(handler) as client:
+            response = await http.request(
+                client, "GET", "https://api.test/items", max_retries=2
+            )
+
+        assert response.status_code == 503
+        assert len(attempts) == 3
+        assert sleeps == [http.RETRY_BACKOFF, http.RETRY_BACKOFF * 2]
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_retried(self, sleeps):
+        """Test connection failures are retried, then raised."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        async with mock_client(handler) as client:
+            with pytest.raises(httpx.ConnectError):
+                await http.request(client, "GET", "https://api.test/items")
+
+        assert len(attempts) == http.MAX_RETRIES + 1
+        assert len(sleeps) == http.MAX_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, sleeps):
+        """Test a server-requested wait replaces the backoff."""
+        responses = iter(
+            [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)]
+        )
+
+        async with mock_client(lambda request: next(responses)) as client:
+            response = await http.request(client, "GET", "https://api.test/items")
+
+        assert response.status_code == 200
+        assert sleeps == [7.0]
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_not_waited(self, sleeps):
+        """Test waits beyond MAX_RETRY_WAIT return the response at once."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(
+                429, headers={"Retry-After": str(http.MAX_RETRY_WAIT + 1)}
+            )
+
+        async with mock_client(handler) as client:
+            response = await http.request(client, "GET", "https://api.test/items")
+
+        assert response.status_code == 429
+        assert len(attempts) == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, sleeps):
+        """Test non-transient failures are returned without retrying."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(404)
+
+        async with mock_client(handler) as client:
+            response = await http.request(client, "GET", "https://api.test/items")
+
+        assert response.status_code == 404
+        assert len(attempts) == 1
+        assert sleeps == []
+
+
+class TestConditionalGet:
+    """Test conditional GETs against the body cache."""
+
+    @pytest.fixture
+    def cache(self, sleeps, monkeypatch):
+        cache = OrderedDict()
+        monkeypatch.setattr(http, "_conditional_cache", cache)
+        return cache
+
+    @staticmethod
+    def etag_handler(requests):
+        """Serve each path with an ETag, answering 304 when it matches."""
+
+        def handler(request):
+            requests.append(request)
+            etag = f'"{request.url.path}"'
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            return httpx.Response(
+                200,
+                headers={"ETag": etag, "Content-Type": "application/rss+xml"},
+                content=f"<rss>{request.url.path}</rss>".encode(),
+            )
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_body(self, cache):
+        """Test a 304 is answered with the cached body as a 200."""
+        requests = []
+        url = "https://feeds.test/a"
+
+        async with mock_client(self.etag_handler(requests)) as client:
+            first = await http.conditional_get(client, url)
+            second = await http.conditional_get(
+                client, url, headers={"User-Agent": "Newsauto"}
+            )
+
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"/a"'
+        assert requests[1].headers["User-Agent"] == "Newsauto"
+        assert second.status_code == 200
+        assert second.content == first.content == b"<rss>/a</rss>"
+        assert second.headers["Content-Type"] == "application/rss+xml"
+
+    @pytest.mark.asyncio
+    async def test_responses_without_validators_not_cached(self, cache):
+        """Test responses without ETag or Last-Modified are not stored."""
+        async with mock_client(lambda request: httpx.Response(200)) as client:
+            await http.conditional_get(client, "https://feeds.test/a")
+
+        assert not cache
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted(self, cache, monkeypatch):
+        """Test the cache drops the least recently used URL when full."""
+        monkeypatch.setattr(http, "CONDITIONAL_CACHE_SIZE", 2)
+        requests = []
+
+        async with mock_client(self.etag_handler(requests)) as client:
+            await http.conditional_get(client, "https://feeds.test/a")
+            await http.conditional_get(client, "https://feeds.test/b")
+            # Revalidating a makes b the least recently used
+            await http.conditional_get(client, "https://feeds.test/a")
+            await http.conditional_get(client, "https://feeds.test/c")
+
+        assert list(cache) == ["https://feeds.test/a", "https://feeds.test/c"]
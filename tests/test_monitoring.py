@@ -0,0 +1,251 @@
+"""Tests for monitoring metrics and health checks."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from newsauto.monitoring.health import HealthChecker, HealthStatus
+from newsauto.monitoring.health_checks import ComprehensiveHealthCheck
+from newsauto.monitoring.metrics import MetricsCollector
+
+
+def request_total(endpoint, status="200"):
+    """Read the Prometheus request counter for an endpoint."""
+    value = REGISTRY.get_sample_value(
+        "http_requests_total",
+        {"method": "GET", "endpoint": endpoint, "status": status},
+    )
+    return value or 0.0
+
+
+class TestMetricsCollector:
+    """Test metrics collection."""
+
+    @pytest.fixture
+    def collector(self):
+        collector = MetricsCollector()
+        # Skip psutil sampling
+        collector._sample_system = Mock()
+        collector._system_stats = {"cpu_percent": 5.0}
+        return collector
+
+    def test_get_stats_resamples_without_sampler(self, collector):
+        """Test system stats are refreshed when no sampler task runs."""
+        from newsauto.monitoring.metrics import STATS_CACHE_TTL
+
+        collector.get_stats()
+        collector.get_stats()
+        assert collector._sample_system.call_count == 1
+
+        collector._stats_cache_ts -= STATS_CACHE_TTL
+        collector.get_stats()
+        assert collector._sample_system.call_count == 2
+
+        # The background sampler keeps the stats current on its own
+        collector._sampler_task = Mock()
+        collector._stats_cache_ts -= STATS_CACHE_TTL
+        collector.get_stats()
+        assert collector._sample_system.call_count == 2
+
+    def test_get_stats_returns_copy(self, collector):
+        """Test callers cannot change the cached statistics."""
+        collector.record_request("GET", "/api", 200, 0.5)
+
+        stats = collector.get_stats()
+        stats["total_requests"] = 0
+        stats["avg_response_times"].clear()
+        stats["system"]["cpu_percent"] = 99.0
+
+        cached = collector.get_stats()
+        assert cached["total_requests"] == 1
+        assert cached["avg_response_times"] == {"GET:/api": 0.5}
+        assert cached["system"] == {"cpu_percent": 5.0}
+
+    @pytest.mark.asyncio
+    async def test_flush_loop_batches_requests(self, collector):
+        """Test requests are aggregated until the flush loop pushes them."""
+        collector.start_flush_loop(interval=3600)
+        try:
+            for _ in range(3):
+                collector.record_request("GET", "/batched", 200, 0.1)
+            collector.record_request("GET", "/batched", 500, 0.2)
+
+            # Aggregated in memory, not yet in Prometheus
+            assert request_total("/batched") == 0
+            assert collector.get_stats()["total_requests"] == 4
+
+            collector.flush()
+            assert request_total("/batched") == 3
+            assert request_total("/batched", "500") == 1
+
+            collector.record_request("GET", "/batched", 200, 0.1)
+        finally:
+            await collector.stop_flush_loop()
+
+        # Stopping flushes whatever is left
+        assert collector._flush_task is None
+        assert request_total("/batched") == 4
+
+    @pytest.mark.asyncio
+    async def test_flush_loop_runs_periodically(self, collector):
+        """Test the background loop flushes without being asked."""
+        collector.start_flush_loop(interval=0.01)
+        try:
+            collector.record_request("GET", "/periodic", 200, 0.1)
+            for _ in range(100):
+                if request_total("/periodic"):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await collector.stop_flush_loop()
+
+        assert request_total("/periodic") == 1
+
+    def test_records_directly_without_flush_loop(self, collector):
+        """Test requests go straight to Prometheus when not batching."""
+        collector.record_request("GET", "/direct", 200, 0.1)
+        assert request_total("/direct") == 1
+
+
+class TestHealthChecker:
+    """Test the application health checker."""
+
+    @pytest.fixture
+    def checker(self):
+        return HealthChecker(enabled_checks=("database",))
+
+    @staticmethod
+    def component(status):
+        return [{"name": "database", "status": status, "message": "database"}]
+
+    @pytest.mark.asyncio
+    async def test_results_cached_until_expiry(self, checker):
+        """Test check_all reuses its result for cache_duration."""
+        checker._run = AsyncMock(
+            return_value=(self.component(HealthStatus.HEALTHY), HealthStatus.HEALTHY)
+        )
+
+        first = await checker.check_all()
+        assert await checker.check_all() is first
+        assert checker._run.await_count == 1
+
+        checker.last_check -= checker.cache_duration
+        assert await checker.check_all() is not first
+        assert checker._run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_last_good_served_during_flap(self, checker):
+        """Test a brief failure reports the last good result as degraded."""
+        checker._run = AsyncMock(
+            return_value=(self.component(HealthStatus.HEALTHY), HealthStatus.HEALTHY)
+        )
+        good = await checker.check_all()
+
+        checker._run.return_value = (
+            self.component(HealthStatus.UNHEALTHY),
+            HealthStatus.UNHEALTHY,
+        )
+        checker.last_check -= checker.cache_duration
+        flapping = await checker.check_all()
+
+        assert flapping["stale"] is True
+        assert flapping["status"] == HealthStatus.DEGRADED
+        assert flapping["components"] == good["components"]
+        assert flapping["fresh_error"] == ["database: database"]
+
+        # Readiness does not trust a stale snapshot
+        with patch.object(
+            checker, "check_database", new_callable=AsyncMock
+        ) as check_database:
+            check_database.return_value = Mock(status=HealthStatus.UNHEALTHY)
+            assert (await checker.check_readiness())["ready"] is False
+
+        # Past the stale window the failure is reported as is
+        checker._last_good_at -= checker.stale_window
+        checker.last_check -= checker.cache_duration
+        failed = await checker.check_all()
+        assert failed["status"] == HealthStatus.UNHEALTHY
+        assert "stale" not in failed
+
+    def test_table_count_recounted_after_ttl(self, db_session):
+        """Test a table added by a migration shows up once the cache expires."""
+        from sqlalchemy import text
+
+        checker = HealthChecker(db=db_session, enabled_checks=("database",))
+        tables = checker._query_database()
+
+        db_session.execute(text("CREATE TABLE migrated (id INTEGER)"))
+        assert checker._query_database() == tables
+
+        checker._table_count_at -= checker._schema_ttl
+        assert checker._query_database() == tables + 1
+
+        db_session.execute(text("DROP TABLE migrated"))
+        checker.invalidate_schema_cache()
+        assert checker._query_database() == tables
+
+
+class TestComprehensiveHealthCheck:
+    """Test the self-healing health check orchestrator."""
+
+    @pytest.fixture
+    def checker(self):
+        module = "newsauto.monitoring.health_checks"
+        with patch(f"{module}.SMTPHealthCheck"), patch(
+            f"{module}.OllamaHealthCheck"
+        ), patch(f"{module}.FeedHealthCheck"), patch(f"{module}.DatabaseHealthCheck"):
+            checker = ComprehensiveHealthCheck()
+
+        for name in ("smtp_check", "ollama_check", "feed_check", "db_check"):
+            check = Mock()
+            check.check = AsyncMock(return_value={"healthy": True})
+            setattr(checker, name, check)
+        return checker
+
+    @pytest.mark.asyncio
+    async def test_results_cached_until_expiry(self, checker):
+        """Test check_all reuses its result for the cache TTL."""
+        first = await checker.check_all()
+        assert await checker.check_all() is first
+        assert checker.db_check.check.await_count == 1
+
+        checker._last -= checker._ttl
+        await checker.check_all()
+        assert checker.db_check.check.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_run(self, checker):
+        """Test simultaneous cache misses wait on a single run."""
+        release = asyncio.Event()
+
+        async def slow_check():
+            await release.wait()
+            return {"healthy": True}
+
+        checker.db_check.check = AsyncMock(side_effect=slow_check)
+
+        callers = [asyncio.ensure_future(checker.check_all()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # A cancelled caller does not cancel the shared run
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers[1:])
+
+        assert checker.db_check.check.await_count == 1
+        assert results[0] is results[1]
+        assert results[0]["overall_healthy"] is True
+        assert checker._inflight is None
+
+    @pytest.mark.asyncio
+    async def test_timed_out_check_reported(self, checker):
+        """Test a check exceeding its timeout is reported unhealthy."""
+        checker.feed_check.check = AsyncMock(side_effect=asyncio.TimeoutError)
+
+        result = await checker.check_all()
+
+        assert result["overall_healthy"] is False
+        assert result["checks"]["feeds"]["error"].startswith("timeout after")
@@ -1,5 +1,7 @@
 """Tests for quality control pipeline."""
 
+import asyncio
+
 import pytest
 from newsauto.quality.hallucination_detector import HallucinationDetector
 from newsauto.quality.factual_checker import FactualChecker
@@ -40,6 +42,27 @@ class TestHallucinationDetector:
         score = await detector.check(summary, source)
         assert score < 0.7, "Should detect hallucinated entities"
 
+    def test_overlapping_claims_counted_separately(self, detector):
+        """Test claims matched by overlapping patterns are all flagged."""
+        summary = "Revenue increased by 45% of the total in 2023."
+        analysis = detector.get_detailed_analysis(summary, "Revenue grew.")
+
+        assert sorted(analysis["flagged_patterns"]) == [
+            "45% of",
+            "in 2023",
+            "increased by 45%",
+        ]
+        assert analysis["fact_score"] == 0.0
+
+    def test_supported_claims_not_flagged(self, detector):
+        """Test claims repeated in the source count as supported."""
+        summary = "Revenue increased by 45% of the total in 2023."
+        source = "In 2023 revenue increased by 45%, or 45% of the total."
+
+        analysis = detector.get_detailed_analysis(summary, source)
+        assert analysis["flagged_patterns"] == []
+        assert analysis["fact_score"] == 1.0
+
 
 class TestFactualChecker:
     """Test factual accuracy checking."""
@@ -62,6 +85,35 @@ class TestFactualChecker:
         score = await checker.check("Test summary", url)
         assert 0.4 <= score <= 0.7, "Unknown sources should have medium score"
 
+    @pytest.mark.asyncio
+    async def test_fetch_source_content_reads_past_first_chunk(self, checker):
+        """Test source pages are read up to the limit, not one buffer."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        from newsauto.quality.factual_checker import SOURCE_READ_LIMIT
+
+        async def handler(request):
+            response = web.StreamResponse(headers={"Content-Type": "text/html"})
+            await response.prepare(request)
+            for _ in range(10):
+                await response.write(b"a" * 8000)
+                await response.drain()
+                await asyncio.sleep(0.01)
+            return response
+
+        app = web.Application()
+        app.router.add_get("/page", handler)
+        async with TestServer(app) as server:
+            try:
+                content = await checker._fetch_source_content(
+                    str(server.make_url("/page"))
+                )
+            finally:
+                await checker.close()
+
+        assert content == "a" * SOURCE_READ_LIMIT
+
     def test_credibility_report(self, checker):
         """Test credibility report generation."""
         report = checker.get_credibility_report("https://www.reuters.com/article")
@@ -97,6 +149,40 @@ class TestSentimentAnalyzer:
         score = await analyzer.analyze(text)
         assert score < -0.5, "Should detect negative sentiment"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "This is great\U0001f389 news",
+            "Really \u00abexcellent\u00bb work",
+            "an amazing\u2022 thing",
+        ],
+    )
+    async def test_symbols_attached_to_words(self, analyzer, text):
+        """Test emoji, guillemets and bullets are stripped from words."""
+        score = await analyzer.analyze(text)
+        assert score == 0.7, "Symbols should not hide sentiment words"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "This is great\U0001f389 news",
+            "Really \u00abexcellent\u00bb work",
+            "an amazing\u2022 thing",
+            "A very\u2026 terrible \u2014 incredibly \u201cbrilliant\u201d result!",
+            "extremely \u2022 awful, totally_great (very) \u00abwonderful\u00bb crisis",
+        ],
+    )
+    def test_automaton_matches_tokenizer(self, analyzer, text):
+        """Test the Aho-Corasick scan counts the same words as tokenizing."""
+        pytest.importorskip("ahocorasick")
+        tokenizing = SentimentAnalyzer()
+        tokenizing._automaton = None
+
+        expected = tokenizing.get_detailed_analysis(text)
+        assert analyzer._automaton is not None
+        assert analyzer.get_detailed_analysis(text) == expected
+
     def test_professional_tone(self, analyzer):
         """Test professional tone checking."""
         professional = "The company reported a 10% increase in revenue."
@@ -1,8 +1,9 @@
 """Tests for content scrapers."""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import feedparser
+import httpx
 import pytest
 
 from newsauto.models.content import ContentSource
@@ -24,34 +25,53 @@ class TestRSSScraper:
         scraper = RSSFetcher(source)
 
         # Mock feed data
-        mock_feed = MagicMock()
-        mock_feed.entries = [
-            MagicMock(
-                title="Article 1",
-                link="https://example.com/1",
-                summary="Summary 1",
-                published_parsed=(2024, 1, 1, 0, 0, 0, 0, 1, -1),
-                get=lambda x, default=None: "Author 1" if x == "author" else default,
-            ),
-            MagicMock(
-                title="Article 2",
-                link="https://example.com/2",
-                summary="Summary 2",
-                published_parsed=(2024, 1, 2, 0, 0, 0, 0, 2, -1),
-                get=lambda x, default=None: None,
-            ),
-        ]
+        feed = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Article 1</title><link>https://example.com/1</link>
+<description>Summary 1</description><author>Author 1</author>
+<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>
+<item><title>Article 2</title><link>https://example.com/2</link>
+<description>Summary 2</description>
+<pubDate>Tue, 02 Jan 2024 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+        response = httpx.Response(
+            200, content=feed, request=httpx.Request("GET", source.url)
+        )
 
-        with patch.object(feedparser, "parse", return_value=mock_feed):
-            with patch("httpx.AsyncClient.get"):  # Mock the HTTP call
-                import asyncio
+        # Mock the HTTP call
+        with patch(
+            "newsauto.scrapers.rss.conditional_get",
+            new_callable=AsyncMock,
+            return_value=response,
+        ):
+            import asyncio
 
-                items = asyncio.run(scraper.fetch_raw())
+            entries = asyncio.run(scraper.fetch_raw())
 
+        items = [scraper.parse_item(entry) for entry in entries]
         assert len(items) == 2
         assert items[0]["title"] == "Article 1"
         assert items[0]["author"] == "Author 1"
-        assert items[1]["author"] is None
+        assert items[1]["author"] == ""
+
+    def test_full_text_flag(self):
+        """Test only content:encoded bodies are marked as full text."""
+        source = Mock(spec=ContentSource)
+        source.url = "https://example.com/feed"
+        source.config = {}
+        scraper = RSSFetcher(source)
+
+        full = feedparser.FeedParserDict(
+            title="Article 1",
+            link="https://example.com/1",
+            content=[{"value": "<p>The whole article</p>"}],
+        )
+        summary = feedparser.FeedParserDict(
+            title="Article 2", link="https://example.com/2", summary="Teaser"
+        )
+
+        assert scraper.parse_item(full)["metadata"]["full_text"] is True
+        assert scraper.parse_item(summary)["metadata"]["full_text"] is False
 
     def test_fetch_from_source(self, db_session):
         """Test fetching from RSS source."""
@@ -131,86 +151,239 @@ class TestRedditScraper:
     """Test Reddit scraper."""
 
     @pytest.fixture
-    def mock_praw(self):
-        """Mock praw Reddit instance."""
-        with patch("praw.Reddit") as mock_reddit:
-            mock_instance = MagicMock()
-            mock_reddit.return_value = mock_instance
-            yield mock_instance
-
-    def test_fetch_subreddit_posts(self, mock_praw):
-        """Test fetching subreddit posts."""
-        source = Mock(spec=ContentSource)
-        source.url = "https://reddit.com/r/programming"
-        source.config = {"subreddit": "programming"}
-        scraper = RedditScraper(source)
-        scraper.reddit = mock_praw
-
-        # Mock subreddit
-        mock_subreddit = MagicMock()
-        mock_praw.subreddit.return_value = mock_subreddit
-
-        # Mock posts
-        mock_post1 = MagicMock(
-            title="Post 1",
-            url="https://reddit.com/post1",
-            selftext="Text content",
-            author=MagicMock(name="author1"),
-            created_utc=1704067200.0,
-            score=100,
-            num_comments=50,
-        )
-
-        mock_post2 = MagicMock(
-            title="Post 2",
-            url="https://example.com/link",
-            selftext="",
-            author=MagicMock(name="author2"),
-            created_utc=1704067200.0,
-            score=200,
-            num_comments=75,
-        )
+    def reddit_api(self, monkeypatch):
+        """Configure credentials and start each test without a token."""
+        from newsauto.core import http
+        from newsauto.scrapers import reddit
 
-        mock_subreddit.hot.return_value = [mock_post1, mock_post2]
+        monkeypatch.setattr(reddit.settings, "reddit_client_id", "client-id")
+        monkeypatch.setattr(reddit.settings, "reddit_client_secret", "secret")
+        monkeypatch.setattr(reddit, "_access_token", None)
+        monkeypatch.setattr(http, "HOST_MIN_INTERVAL", 0.0)
+        return reddit
 
-        posts = scraper.fetch_subreddit("programming", sort="hot", limit=2)
-
-        assert len(posts) == 2
-        assert posts[0]["title"] == "Post 1"
-        assert posts[0]["score"] == 100
-        assert posts[1]["url"] == "https://example.com/link"
-
-    def test_fetch_from_source(self, db_session, mock_praw):
-        """Test fetching from Reddit source."""
+    @pytest.fixture
+    def scraper(self, reddit_api):
         source = Mock(spec=ContentSource)
         source.url = "https://reddit.com/r/python"
-        source.config = {"subreddit": "python", "limit": 10}
-        scraper = RedditScraper(source, db_session)
-        scraper.reddit = mock_praw
-
-        mock_subreddit = MagicMock()
-        mock_praw.subreddit.return_value = mock_subreddit
-
-        mock_post = MagicMock(
-            title="Test Post",
-            url="https://reddit.com/test",
-            selftext="Test content",
-            author=MagicMock(name="testauthor"),
-            created_utc=1704067200.0,
-            score=150,
-            num_comments=25,
+        source.config = {"subreddit": "python"}
+        return RedditScraper(source)
+
+    @staticmethod
+    def _submission(index, **overrides):
+        """Build a listing child as returned by the OAuth API."""
+        data = {
+            "id": f"p{index}",
+            "title": f"Post {index}",
+            "url": f"https://example.com/{index}",
+            "permalink": f"/r/python/comments/p{index}/post/",
+            "author": "alice",
+            "subreddit": "python",
+            "score": 100,
+            "upvote_ratio": 0.9,
+            "num_comments": 25,
+            "created_utc": 1704067200.0,
+            "selftext": "",
+            "is_self": False,
+            "link_flair_text": None,
+            "over_18": False,
+            "spoiler": False,
+            "stickied": False,
+        }
+        data.update(overrides)
+        return {"kind": "t3", "data": data}
+
+    @staticmethod
+    def _token_response(request, token="token-1", expires_in=3600):
+        assert request.headers["Authorization"].startswith("Basic ")
+        assert b"grant_type=client_credentials" in request.content
+        return httpx.Response(
+            200, json={"access_token": token, "expires_in": expires_in}
         )
 
-        mock_subreddit.hot.return_value = [mock_post]
+    @pytest.mark.asyncio
+    async def test_token_fetched_once_and_refreshed(self, scraper, reddit_api):
+        """Test the token is reused until it nears expiry."""
+        token_requests = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                token_requests.append(request)
+                return self._token_response(request, f"token-{len(token_requests)}")
+            return httpx.Response(200, json={})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await scraper._get_access_token(client) == "token-1"
+            assert await scraper._get_access_token(client) == "token-1"
+            assert len(token_requests) == 1
+
+            # Expired tokens are replaced on next use
+            reddit_api._access_token = ("token-1", 0.0)
+            assert await scraper._get_access_token(client) == "token-2"
+            assert len(token_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_short_lived_token_refreshed(self, scraper):
+        """Test tokens expiring within the margin are not reused."""
+        token_requests = []
+
+        def handler(request):
+            token_requests.append(request)
+            return self._token_response(request, expires_in=30)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await scraper._get_access_token(client)
+            await scraper._get_access_token(client)
+
+        assert len(token_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_resets_token(self, scraper, reddit_api):
+        """Test a 401 drops the token so the next call fetches a new one."""
+        reddit_api._access_token = ("revoked", float("inf"))
+        authorizations = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return self._token_response(request, "fresh")
+            authorizations.append(request.headers["Authorization"])
+            if request.headers["Authorization"] == "Bearer revoked":
+                return httpx.Response(401, json={"error": 401})
+            return httpx.Response(200, json={"ok": True})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await scraper._api_get(client, "/r/python/hot", {})
+            assert reddit_api._access_token is None
+
+            assert await scraper._api_get(client, "/r/python/hot", {}) == {"ok": True}
+
+        assert authorizations == ["Bearer revoked", "Bearer fresh"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_subreddit_posts_pages(self, scraper):
+        """Test listings are paged 100 posts at a time."""
+        total = 250
+        listing_params = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return self._token_response(request)
+            assert request.url.path == "/r/python/top"
+            params = request.url.params
+            listing_params.append(dict(params))
+            after = params.get("after")
+            first = int(after[1:]) + 1 if after else 0
+            last = min(first + int(params["limit"]), total)
+            children = [self._submission(i) for i in range(first, last)]
+            return httpx.Response(
+                200,
+                json={
+                    "kind": "Listing",
+                    "data": {
+                        "after": f"p{last - 1}" if last < total else None,
+                        "children": children,
+                    },
+                },
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            posts = await scraper._fetch_subreddit_posts(
+                client, "python", "top", 130, "day"
+            )
 
-        content = scraper.fetch_from_source(
-            {"subreddit": "test", "sort": "hot", "limit": 1}
+        assert [post["id"] for post in posts] == [f"p{i}" for i in range(130)]
+        assert [p["limit"] for p in listing_params] == ["100", "30"]
+        assert [p.get("after") for p in listing_params] == [None, "p99"]
+        assert all(p["t"] == "day" and p["raw_json"] == "1" for p in listing_params)
+
+        # The last page ends the listing even below the limit
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            posts = await scraper._fetch_subreddit_posts(
+                client, "python", "top", 500, "day"
+            )
+        assert len(posts) == total
+
+    @pytest.mark.asyncio
+    async def test_fetch_comments(self, scraper, reddit_api, monkeypatch):
+        """Test top-level comment bodies are extracted, skipping stubs."""
+        comment_params = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/access_token":
+                return self._token_response(request)
+            assert request.url.path == "/comments/p1"
+            comment_params.append(dict(request.url.params))
+            return httpx.Response(
+                200,
+                json=[
+                    {"kind": "Listing", "data": {"children": [self._submission(1)]}},
+                    {
+                        "kind": "Listing",
+                        "data": {
+                            "children": [
+                                {"kind": "t1", "data": {"body": "First"}},
+                                {"kind": "t1", "data": {"body": "Second"}},
+                                {"kind": "more", "data": {"children": ["c3"]}},
+                            ]
+                        },
+                    },
+                ],
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(reddit_api, "get_shared_client", lambda: client)
+            assert await scraper.fetch_comments("p1") == ["First", "Second"]
+            assert await scraper.fetch_comments("p1", limit=1) == ["First"]
+
+        assert comment_params[0]["sort"] == "best"
+        assert comment_params[0]["depth"] == "1"
+        assert comment_params[1]["limit"] == "1"
+
+    def test_parse_item_matches_praw_extraction(self, scraper):
+        """Test posts parse as they did when extracted from PRAW objects."""
+        child = self._submission(
+            7,
+            title="Python 3.13 & you",
+            selftext="Release notes",
+            is_self=True,
+            link_flair_text="News",
         )
 
-        assert len(content) == 1
-        assert content[0].title == "Test Post"
-        assert content[0].source == "reddit.com/r/test"
-        assert content[0].score > 0
+        # The dictionary PRAW's Submission attributes produced
+        praw_post = {
+            "id": "p7",
+            "title": "Python 3.13 & you",
+            "url": "https://example.com/7",
+            "reddit_url": "https://reddit.com/r/python/comments/p7/post/",
+            "author": "alice",
+            "subreddit": "python",
+            "score": 100,
+            "upvote_ratio": 0.9,
+            "num_comments": 25,
+            "created_utc": 1704067200.0,
+            "selftext": "Release notes",
+            "is_self": True,
+            "link_flair_text": "News",
+            "over_18": False,
+            "spoiler": False,
+            "stickied": False,
+        }
+
+        post = scraper._extract_post_data(child["data"])
+        assert post == praw_post
+
+        item = scraper.parse_item(post)
+        assert item == scraper.parse_item(praw_post)
+        assert item["url"] == praw_post["reddit_url"]
+        assert item["content"].startswith("Release notes")
+        assert item["metadata"]["engagement_score"] == 150
+        assert item["score"] == 15
+
+    def test_deleted_author(self, scraper):
+        """Test posts by deleted accounts keep PRAW's placeholder."""
+        post = scraper._extract_post_data(self._submission(1, author=None)["data"])
+        assert post["author"] == "[deleted]"
 
 
 class TestHackerNewsScraper:
@@ -298,6 +471,149 @@ class TestHackerNewsScraper:
         assert content[0].source == "news.ycombinator.com"
 
 
+class TestGitHubTrendingScraper:
+    """Test GitHub trending scraper."""
+
+    TRENDING_HTML = """
+    <article class="Box-row">
+      <h2 class="h3 lh-condensed"><a href="/acme/widget">acme / widget</a></h2>
+      <p class="col-9 color-fg-muted my-1 pr-4">Widgets for everyone</p>
+      <span itemprop="programmingLanguage">Python</span>
+      <a href="/acme/widget/stargazers">850</a>
+      <a href="/acme/widget/forks">40</a>
+      <span class="d-inline-block float-sm-right">850 stars today</span>
+    </article>
+    """
+
+    SEARCH_RESULT = {
+        "items": [
+            {
+                "owner": {"login": "acme"},
+                "name": "widget",
+                "description": "Widgets for everyone",
+                "language": "Python",
+                "stargazers_count": 850,
+                "forks_count": 40,
+                "created_at": "2024-01-01T08:00:00Z",
+                "updated_at": "2024-01-01T20:00:00Z",
+                "topics": [],
+                "watchers_count": 850,
+                "open_issues_count": 3,
+                "homepage": None,
+            }
+        ]
+    }
+
+    @pytest.fixture
+    def scraper(self, monkeypatch):
+        from newsauto.core import http
+        from newsauto.scrapers.github import GitHubTrendingScraper
+
+        monkeypatch.setattr(http, "HOST_MIN_INTERVAL", 0.0)
+        source = Mock(spec=ContentSource)
+        source.url = "https://github.com/trending"
+        source.config = {"since": "daily"}
+        return GitHubTrendingScraper(source)
+
+    @pytest.mark.asyncio
+    async def test_api_and_page_scores_comparable(self, scraper):
+        """Test token and no-token runs score a repository alike."""
+
+        def handler(request):
+            assert request.headers["Authorization"] == "token secret"
+            assert request.url.params["sort"] == "stars"
+            return httpx.Response(200, json=self.SEARCH_RESULT)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            (api_repo,) = await scraper._fetch_via_api(
+                client, "python", "daily", 25, "secret"
+            )
+        (page_repo,) = scraper._parse_page(self.TRENDING_HTML, 25)
+
+        api_item = scraper.parse_item(api_repo)
+        page_item = scraper.parse_item(page_repo)
+
+        assert api_item["score"] == page_item["score"] == 850
+        assert api_item["title"] == page_item["title"]
+        assert api_item["title"] == "acme/widget - 850 stars today"
+        assert api_item["upvotes"] == page_item["upvotes"]
+
+
+class TestBaseScraper:
+    """Test fetching and saving through the base scraper."""
+
+    @pytest.fixture
+    def source(self, db_session):
+        from newsauto.models.content import ContentSourceType
+
+        source = ContentSource(
+            name="Static", type=ContentSourceType.RSS, url="https://example.com"
+        )
+        source.config = {}
+        source.error_count = 0
+        db_session.add(source)
+        db_session.commit()
+        return source
+
+    @staticmethod
+    def _scraper(source, db_session, count):
+        from newsauto.scrapers.base import BaseScraper
+
+        class StaticScraper(BaseScraper):
+            async def fetch_raw(self):
+                return [{"n": n} for n in range(count)]
+
+            def parse_item(self, raw_item):
+                n = raw_item["n"]
+                return {"url": f"https://example.com/{n}", "title": f"Item {n}"}
+
+        return StaticScraper(source, db_session)
+
+    @pytest.mark.asyncio
+    async def test_fetch_saves_batch(self, db_session, source):
+        """Test new items are saved in one batch and repeats are skipped."""
+        from newsauto.models.content import ContentItem
+
+        scraper = self._scraper(source, db_session, 3)
+        with patch.object(
+            scraper, "_save_individually", wraps=scraper._save_individually
+        ) as save_individually:
+            items = await scraper.fetch()
+
+        save_individually.assert_not_called()
+        assert len(items) == 3
+        assert db_session.query(ContentItem).count() == 3
+        assert source.last_fetched is not None
+
+        # Stored URLs are not saved again
+        new_items = await self._scraper(source, db_session, 4).fetch()
+        assert [item.url for item in new_items] == ["https://example.com/3"]
+        assert db_session.query(ContentItem).count() == 4
+
+    @pytest.mark.asyncio
+    async def test_fetch_falls_back_on_integrity_error(self, db_session, source):
+        """Test a conflicting row only drops itself from the batch."""
+        from newsauto.models.content import ContentItem
+
+        # Stored by another writer after the existing-URL lookup
+        db_session.add(
+            ContentItem(
+                source_id=source.id, url="https://example.com/1", title="Earlier"
+            )
+        )
+        db_session.commit()
+
+        scraper = self._scraper(source, db_session, 3)
+        with patch.object(scraper, "_existing_urls", return_value=set()), patch.object(
+            scraper, "_save_individually", wraps=scraper._save_individually
+        ) as save_individually:
+            await scraper.fetch()
+
+        save_individually.assert_called_once()
+        titles = {item.title for item in db_session.query(ContentItem)}
+        assert titles == {"Earlier", "Item 0", "Item 2"}
+
+
 class TestContentAggregator:
     """Test content aggregator."""
 
@@ -348,6 +664,77 @@ class TestContentAggregator:
         assert "https://example.com/1" in urls
         assert "https://example.com/2" in urls
 
+    @staticmethod
+    def _headline_batch():
+        """Build a batch of headlines with reposts and near-duplicates."""
+        from newsauto.models.content import ContentItem
+
+        headlines = [
+            "Python 3.13 released with experimental free-threading",
+            "Rust 1.80 stabilizes LazyCell and LazyLock",
+            "SQLite is not a toy database",
+            "Show HN: A tiny HTTP server written in Zig",
+            "Why we migrated from Postgres to MySQL",
+            "The case against microservices",
+            "Kubernetes 1.31 adds support for OCI image volumes",
+            "Understanding async/await in JavaScript",
+            "GitHub Copilot now available for all students",
+            "Linux 6.10 brings new NTSYNC driver",
+            "How to design a REST API that lasts",
+            "An introduction to eBPF for observability",
+        ]
+        variants = [
+            "{}",
+            "{} (2024)",
+            "{} - Hacker News",
+            "[Discussion] {}",
+            "{}!",
+        ]
+
+        items = []
+        for i, headline in enumerate(headlines):
+            for j, variant in enumerate(variants[: 1 + i % len(variants)]):
+                items.append(
+                    ContentItem(
+                        url=f"https://example.com/{i}/{j}",
+                        title=variant.format(headline),
+                        content="",
+                        score=(i * 7 + j * 13) % 100,
+                    )
+                )
+        # A repost of one URL under another title
+        items.append(
+            ContentItem(
+                url="https://example.com/3/0",
+                title="A tiny Zig web server",
+                content="",
+                score=99,
+            )
+        )
+        return items
+
+    def test_deduplicate_lsh_matches_exact(self, db_session):
+        """Test LSH and exact title comparison keep the same items."""
+        pytest.importorskip("datasketch")
+        aggregator = ContentAggregator(db_session)
+        items = self._headline_batch()
+
+        exact = aggregator.deduplicate_content(items, use_lsh=False)
+        approximate = aggregator.deduplicate_content(items, use_lsh=True)
+
+        assert len(exact) < len(items)
+        assert [item.url for item in approximate] == [item.url for item in exact]
+
+    def test_deduplicate_small_batches_exact(self, db_session):
+        """Test batches below the LSH threshold compare every title."""
+        from newsauto.scrapers import aggregator as aggregator_module
+
+        aggregator = ContentAggregator(db_session)
+        with patch.object(aggregator_module, "MinHashLSH") as mock_lsh:
+            aggregator.deduplicate_content(self._headline_batch())
+
+        mock_lsh.assert_not_called()
+
     async def test_fetch_and_process(self, db_session, mock_ollama_client):
         """Test fetching and processing with LLM."""
         aggregator = ContentAggregator(db_session, mock_ollama_client)
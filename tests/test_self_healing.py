@@ -38,6 +38,99 @@ class TestSMTPHealthCheck:
             assert result["healthy"] == False
             assert result.get("blacklisted") == True
 
+    @pytest.fixture
+    def smtp_checker(self):
+        """SMTP checker with an explicit config and no canary setting."""
+        from types import SimpleNamespace
+
+        from newsauto.email.email_sender import SMTPConfig
+
+        settings = SimpleNamespace(smtp_canary_email=None)
+        with patch(
+            "newsauto.monitoring.health_checks.get_settings", return_value=settings
+        ):
+            yield SMTPHealthCheck(SMTPConfig(host="smtp.test", port=25))
+
+    @pytest.mark.asyncio
+    async def test_handshake_disconnects_on_failure(self, smtp_checker):
+        """Test the handshake connection is closed when NOOP fails."""
+        with patch(
+            "newsauto.email.email_sender.EmailSender.noop",
+            new_callable=AsyncMock,
+            side_effect=Exception("Connection refused"),
+        ), patch(
+            "newsauto.email.email_sender.EmailSender.disconnect",
+            new_callable=AsyncMock,
+            side_effect=Exception("Not connected"),
+        ) as mock_disconnect:
+            result = await smtp_checker.check()
+
+        mock_disconnect.assert_awaited_once()
+        assert result["healthy"] == False
+        assert result["error"] == "Connection refused"
+
+    @pytest.fixture
+    def smtp_server(self):
+        """Patch EmailSender's network calls; send_email fails as spam."""
+        sender = "newsauto.email.email_sender.EmailSender"
+        with patch(f"{sender}.noop", new_callable=AsyncMock), patch(
+            f"{sender}.connect", new_callable=AsyncMock
+        ), patch(
+            f"{sender}.disconnect", new_callable=AsyncMock
+        ) as mock_disconnect, patch(
+            f"{sender}.send_email",
+            new_callable=AsyncMock,
+            side_effect=Exception("554 Message rejected as spam"),
+        ) as mock_send:
+            yield mock_send, mock_disconnect
+
+    @pytest.mark.asyncio
+    async def test_canary_failure_reported_once(self, smtp_checker, smtp_server):
+        """Test only the probe that sent a failed canary reports it."""
+        mock_send, mock_disconnect = smtp_server
+
+        first = await smtp_checker.check()
+        second = await smtp_checker.check()
+
+        assert mock_send.await_count == 1
+        assert mock_disconnect.await_count == 3  # Two handshakes, one canary
+        assert first["blacklisted"] == True
+        assert second["healthy"] == True
+        assert second["test_send"] == "skipped"
+
+    @pytest.mark.asyncio
+    async def test_failed_canary_retried_sooner(self, smtp_checker, smtp_server):
+        """Test a failed canary is resent after the shorter retry interval."""
+        from datetime import timedelta
+
+        mock_send, _ = smtp_server
+
+        await smtp_checker.check()
+        smtp_checker._last_canary_send -= smtp_checker.canary_retry_interval
+        smtp_checker._last_canary_send -= timedelta(seconds=1)
+        result = await smtp_checker.check()
+
+        assert mock_send.await_count == 2
+        assert result["healthy"] == False
+
+    @pytest.mark.asyncio
+    async def test_config_change_resets_canary(self, smtp_checker, smtp_server):
+        """Test switching servers sends a canary to the new one at once."""
+        from newsauto.email.email_sender import SMTPConfig
+
+        mock_send, _ = smtp_server
+        await smtp_checker.check()
+
+        mock_send.side_effect = None
+        mock_send.return_value = True
+        smtp_checker.config = SMTPConfig(host="smtp.backup.test", port=587)
+        result = await smtp_checker.check()
+
+        assert mock_send.await_count == 2
+        assert result["healthy"] == True
+        assert result["smtp_host"] == "smtp.backup.test"
+        assert result["test_send"] == "success"
+
 
 class TestOllamaHealthCheck:
     """Test Ollama health checking."""